@@ -0,0 +1,17 @@
+"""বেঞ্চমার্ক স্ক্রিপ্টগুলোর জন্য oth-job-test.py মডিউল হিসেবে লোড করার সহায়ক।"""
+import importlib.util
+import os
+import sys
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'oth-job-test.py')
+
+
+def load_scraper():
+    """ফাইলের নামে '-' থাকায় সাধারণ import কাজ করে না, তাই পাথ থেকে লোড করা হয়।"""
+    if 'oth_job_test' in sys.modules:
+        return sys.modules['oth_job_test']
+    spec = importlib.util.spec_from_file_location('oth_job_test', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['oth_job_test'] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,107 @@
+"""
+ডেডলাইন পার্সারের সঠিকতা যাচাই ও মাইক্রো-বেঞ্চমার্ক।
+
+    python benchmarks/bench_deadline_parser.py [--iterations 2000]
+
+কর্পাসের প্রতিটি ইনপুটে parse_deadline_date() প্রত্যাশিত তারিখ দেয় কিনা দেখা হয়,
+তারপর আগের পদ্ধতি (প্রতিবার dateparser.parse) এর সাথে গতি তুলনা করা হয়।
+"""
+import argparse
+import sys
+import time
+from datetime import date
+
+from _loader import load_scraper
+
+# (ইনপুট, প্রত্যাশিত তারিখ)
+CORPUS = [
+    ('30 Dec 2026', date(2026, 12, 30)),
+    ('1 Jan 2027', date(2027, 1, 1)),
+    ('05 Sept 2026', date(2026, 9, 5)),
+    ('15 September 2026', date(2026, 9, 15)),
+    ('7 MAY 2026', date(2026, 5, 7)),
+    ('28 Feb. 2027', date(2027, 2, 28)),
+    ('12 October, 2026', date(2026, 10, 12)),
+    ('3rd March 2027', date(2027, 3, 3)),
+    ('২৫ ডিসেম্বর ২০২৬', date(2026, 12, 25)),
+    ('০১ জানুয়ারি ২০২৭', date(2027, 1, 1)),
+    ('১০ জানুয়ারী ২০২৭', date(2027, 1, 10)),
+    ('৯ ফেব্রুয়ারী ২০২৭', date(2027, 2, 9)),
+    ('১৫ আগষ্ট ২০২৬', date(2026, 8, 15)),
+    ('২০ মে ২০২৬', date(2026, 5, 20)),
+    ('31 অক্টোবর 2026', date(2026, 10, 31)),
+    ('৩০ November ২০২৬', date(2026, 11, 30)),
+]
+
+# টেক্সট থেকে তারিখ অংশ বের করার কেস: (ডেডলাইন টেক্সট, প্রত্যাশিত date_str)
+EXTRACTION_CORPUS = [
+    ('Deadline: 30 Dec 2026', '30 Dec 2026'),
+    ('Application Deadline 15 September 2026', '15 September 2026'),
+    ('আবেদনের সময়সীমা: ২৫ ডিসেম্বর ২০২৬', '২৫ ডিসেম্বর ২০২৬'),
+    ('আবেদনের সময়সীমা: ২০ মে ২০৩০', '২০ মে ২০৩০'),
+    ('চূড়ান্ত ফলাফল প্রকাশ', None),
+]
+
+
+def check_correctness(scraper):
+    failures = 0
+    for text, expected in CORPUS:
+        parsed = scraper.parse_deadline_date(text)
+        actual = parsed.date() if parsed else None
+        if actual != expected:
+            failures += 1
+            print(f"FAIL parse {text!r}: expected {expected}, got {actual}")
+
+    for text, expected in EXTRACTION_CORPUS:
+        match = scraper._DEADLINE_TEXT_RE.search(text)
+        actual = match.group(1) if match else None
+        if actual != expected:
+            failures += 1
+            print(f"FAIL extract {text!r}: expected {expected!r}, got {actual!r}")
+        elif actual and not scraper.parse_deadline_date(actual):
+            failures += 1
+            print(f"FAIL extract {text!r}: extracted {actual!r} but it does not parse")
+
+    total = len(CORPUS) + len(EXTRACTION_CORPUS)
+    print(f"correctness: {total - failures}/{total} passed")
+    return failures
+
+
+def bench(label, func, inputs, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in inputs:
+            func(text)
+    elapsed = time.perf_counter() - start
+    calls = iterations * len(inputs)
+    print(f"{label:<28} {calls:>8} calls  {elapsed * 1e6 / calls:>10.2f} us/call")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    scraper = load_scraper()
+    failures = check_correctness(scraper)
+
+    # সাইটের আসল ইনপুটগুলো ইংরেজি মাসের নাম, তাই সেগুলোতেই তুলনা
+    english_inputs = [text for text, _ in CORPUS if text.isascii()]
+
+    start = time.perf_counter()
+    import dateparser
+    print(f"dateparser import: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    legacy = bench('dateparser.parse (legacy)', lambda text: dateparser.parse(text, languages=['en', 'bn']),
+                   english_inputs, max(1, args.iterations // 100))
+    legacy_per_call = legacy / (max(1, args.iterations // 100) * len(english_inputs))
+    fast = bench('parse_deadline_date', scraper.parse_deadline_date, english_inputs, args.iterations)
+    fast_per_call = fast / (args.iterations * len(english_inputs))
+    print(f"speedup: {legacy_per_call / fast_per_call:.0f}x")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
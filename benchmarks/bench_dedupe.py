@@ -0,0 +1,178 @@
+"""
+near-duplicate টাইটেল ইনডেক্সের সঠিকতা ও স্কেল বেঞ্চমার্ক।
+
+    python benchmarks/bench_dedupe.py [--titles 50000] [--queries 2000] [--naive-queries 50]
+
+সিন্থেটিক বাংলা/ইংরেজি বিজ্ঞপ্তির টাইটেল দিয়ে NearDuplicateIndex তৈরি করা হয়, তারপর
+পুনঃপ্রকাশের ধরনে বদলানো টাইটেল (বাংলা/ASCII অঙ্ক, 'সংশোধিত', ভিন্ন বিরাম চিহ্ন) খুঁজে পায়
+কিনা এবং ভিন্ন সাল/পদসংখ্যার টাইটেল বা একই বিজ্ঞপ্তির ফলো-আপ পোস্টকে (ফলাফল, প্রবেশপত্র)
+ভুল করে ডুপ্লিকেট ধরে কিনা মাপা হয়। শেষে সব টাইটেলের
+সাথে সরাসরি Jaccard তুলনার (আগের মত O(n) প্রতি লুকআপ) সাথে গতি তুলনা।
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from _loader import load_scraper
+
+ORGANIZATIONS = [
+    'বাংলাদেশ রেলওয়ে', 'স্বাস্থ্য অধিদপ্তর', 'প্রাথমিক শিক্ষা অধিদপ্তর', 'বাংলাদেশ পুলিশ', 'সেনাবাহিনী',
+    'বাংলাদেশ ব্যাংক', 'পল্লী বিদ্যুতায়ন বোর্ড', 'খাদ্য অধিদপ্তর', 'ভূমি মন্ত্রণালয়', 'জেলা প্রশাসকের কার্যালয়',
+    'Bangladesh Bank', 'Sonali Bank PLC', 'BRAC NGO', 'Power Grid Company', 'Titas Gas',
+    'Dhaka WASA', 'Civil Aviation Authority', 'Bangladesh Navy', 'Janata Bank', 'Islami Bank',
+    'কৃষি সম্প্রসারণ অধিদপ্তর', 'মৎস্য অধিদপ্তর', 'সমাজসেবা অধিদপ্তর', 'নির্বাচন কমিশন', 'পরিবার পরিকল্পনা অধিদপ্তর',
+]
+POSTS = [
+    'নিয়োগ বিজ্ঞপ্তি', 'অফিস সহায়ক নিয়োগ', 'সহকারী শিক্ষক নিয়োগ', 'Job Circular', 'Officer Job Circular',
+    'Assistant Director Recruitment', 'কম্পিউটার অপারেটর নিয়োগ', 'ড্রাইভার পদে নিয়োগ', 'Senior Officer Circular',
+    'Trainee Assistant Job Circular',
+]
+BENGALI_DIGITS = str.maketrans('0123456789', '০১২৩৪৫৬৭৮৯')
+
+
+def make_title(rng):
+    title = f"{rng.choice(ORGANIZATIONS)} {rng.choice(POSTS)} {rng.randint(2015, 2027)}"
+    if rng.random() < 0.7:
+        title += f" - {rng.randint(1, 5000)} পদ"
+    if rng.random() < 0.5:
+        title = title.translate(BENGALI_DIGITS)
+    return title
+
+
+def make_variant(rng, title):
+    """একই বিজ্ঞপ্তির পুনঃপ্রকাশ: অঙ্ক, বিরাম চিহ্ন, স্পেস বা 'সংশোধিত' বদলে যায়।"""
+    variants = [
+        lambda t: t.translate(BENGALI_DIGITS),
+        lambda t: t.translate(str.maketrans('০১২৩৪৫৬৭৮৯', '0123456789')),
+        lambda t: f"{t} (সংশোধিত)",
+        lambda t: f"{t} – Revised",
+        lambda t: t.replace(' - ', ': ').replace(' ', '  '),
+        lambda t: f"{t}।",
+        lambda t: t.replace(' পদ', ' পদে'),
+    ]
+    for transform in rng.sample(variants, 2):
+        title = transform(title)
+    return title
+
+
+def make_distinct(rng, title, existing_normalized, normalize):
+    """সাল বা পদসংখ্যা বদলানো টাইটেল যা কর্পাসে নেই; এগুলো ডুপ্লিকেট ধরা ভুল।"""
+    while True:
+        candidate = f"{title.rsplit(' - ', 1)[0]} - {rng.randint(1, 5000)} পদ"
+        if normalize(candidate) not in existing_normalized:
+            return candidate
+
+
+FOLLOW_UP_SUFFIXES = [' ফলাফল', ' - Result', ' Admit Card', ' প্রবেশপত্র ডাউনলোড', ' Exam Date', ' পরীক্ষার সময়সূচি',
+                      ' লিখিত পরীক্ষার ফলাফল', ' Viva Notice']
+
+
+def make_follow_up(rng, title):
+    """একই বিজ্ঞপ্তির ফলাফল/প্রবেশপত্র পোস্ট: একটি ছোট শব্দ যোগ হয়, কিন্তু এটি আলাদা পোস্ট।"""
+    return title + rng.choice(FOLLOW_UP_SUFFIXES)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def naive_find(scraper, entries, title, threshold):
+    """আগের ধরনের সব টাইটেলের সাথে সরাসরি তুলনা (একই নরমালাইজেশন ও Jaccard)।"""
+    normalized = scraper.normalize_title(title)
+    shingles = scraper._title_shingles(normalized)
+    numbers = scraper._TITLE_NUMBER_RE.findall(normalized)
+    post_types = scraper.title_post_types(normalized)
+    best = None
+    for key, (other, other_shingles) in entries.items():
+        if scraper._TITLE_NUMBER_RE.findall(other) != numbers or scraper.title_post_types(other) != post_types:
+            continue
+        similarity = len(shingles & other_shingles) / len(shingles | other_shingles)
+        if similarity >= threshold and (best is None or similarity > best[1]):
+            best = (key, similarity)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--titles', type=int, default=50000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--naive-queries', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    scraper = load_scraper()
+    rng = random.Random(args.seed)
+
+    titles = {}
+    normalized_seen = set()
+    while len(titles) < args.titles:
+        title = make_title(rng)
+        normalized = scraper.normalize_title(title)
+        if normalized not in normalized_seen:
+            normalized_seen.add(normalized)
+            titles[str(len(titles))] = title
+
+    start = time.perf_counter()
+    index = scraper.NearDuplicateIndex()
+    for key, title in titles.items():
+        index.add(key, title)
+    build_seconds = time.perf_counter() - start
+
+    # tracemalloc নিজে ধীর, তাই মেমোরি আলাদা একটি বিল্ডে মাপা হয়
+    tracemalloc.start()
+    measured = scraper.NearDuplicateIndex()
+    for key, title in titles.items():
+        measured.add(key, title)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del measured
+    print(f"index build: {len(index)} titles in {build_seconds:.2f} s "
+          f"({build_seconds / len(index) * 1e6:.1f} us/title), peak {peak / 1e6:.1f} MB")
+
+    sample_keys = rng.sample(sorted(titles), args.queries)
+    positives = [(key, make_variant(rng, titles[key])) for key in sample_keys]
+    negatives = [make_distinct(rng, titles[key], normalized_seen, scraper.normalize_title) for key in sample_keys]
+    follow_ups = [make_follow_up(rng, titles[key]) for key in sample_keys]
+
+    latencies = []
+    found = 0
+    for key, variant in positives:
+        start = time.perf_counter()
+        match = index.find(variant)
+        latencies.append(time.perf_counter() - start)
+        found += bool(match and (match[0] == key or scraper.normalize_title(titles[match[0]]) == scraper.normalize_title(titles[key])))
+    false_positives = 0
+    for title in negatives:
+        start = time.perf_counter()
+        false_positives += index.find(title) is not None
+        latencies.append(time.perf_counter() - start)
+    follow_up_matches = 0
+    for title in follow_ups:
+        start = time.perf_counter()
+        follow_up_matches += index.find(title) is not None
+        latencies.append(time.perf_counter() - start)
+
+    print(f"recall (re-published variants found): {found}/{len(positives)} = {found / len(positives):.1%}")
+    print(f"false positives (different count/year): {false_positives}/{len(negatives)} = {false_positives / len(negatives):.1%}")
+    print(f"false positives (result/admit follow-ups): {follow_up_matches}/{len(follow_ups)} = "
+          f"{follow_up_matches / len(follow_ups):.1%}")
+    print(f"lookup latency: p50 {percentile(latencies, 0.5) * 1e6:.0f} us, p99 {percentile(latencies, 0.99) * 1e6:.0f} us")
+
+    entries = {
+        key: (scraper.normalize_title(title), scraper._title_shingles(scraper.normalize_title(title)))
+        for key, title in titles.items()
+    }
+    naive_titles = [variant for _, variant in positives[:args.naive_queries]]
+    start = time.perf_counter()
+    for title in naive_titles:
+        naive_find(scraper, entries, title, index.threshold)
+    naive_per_query = (time.perf_counter() - start) / len(naive_titles)
+    lsh_per_query = sum(latencies) / len(latencies)
+    print(f"naive scan: {naive_per_query * 1e3:.1f} ms/lookup vs LSH {lsh_per_query * 1e3:.3f} ms/lookup "
+          f"(x{naive_per_query / lsh_per_query:.0f})")
+
+
+if __name__ == '__main__':
+    main()
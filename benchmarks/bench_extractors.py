@@ -0,0 +1,171 @@
+"""
+লিস্টিং ও পোস্ট পেজ এক্সট্র্যাক্টরের আউটপুট মিল যাচাই ও পার্সিং বেঞ্চমার্ক।
+
+    python benchmarks/bench_extractors.py [--iterations 50] [--noise-kb 150]
+
+fixtures/ এর প্রতিটি পেজে নতুন extract_listing_entries()/extract_post_media() এর আউটপুট
+আগের পদ্ধতির (পুরো ট্রি পার্স + copy.copy, পোস্ট পেজে html.parser) সাথে হুবহু মেলানো হয়,
+তারপর প্রতি পেজের পার্স সময় ও সর্বোচ্চ মেমোরি (tracemalloc) তুলনা করা হয়।
+আসল Blogger পেজে সাইডবার/উইজেট/স্ক্রিপ্ট অনেক থাকে, --noise-kb দিয়ে সেটি যোগ করা যায়।
+"""
+import argparse
+import contextlib
+import copy
+import glob
+import io
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from _loader import load_scraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def legacy_listing_entries(html):
+    """আগের get_all_post_links_and_details এর পার্সিং অংশ (ফিল্টারিং বাদে)।"""
+    soup = BeautifulSoup(html, 'lxml')
+    entries = []
+    for a_tag in soup.find_all('a', href=re.compile(r'/\d{4}/\d{2}/')):
+        post_url = a_tag.get('href')
+        r_snippetized_div = a_tag.find('div', class_='r-snippetized')
+        if r_snippetized_div:
+            snippet_body_tag = r_snippetized_div.find('div', class_='snippet-body')
+            deadline_text = snippet_body_tag.text.strip() if snippet_body_tag else ""
+            temp_r_snippetized = copy.copy(r_snippetized_div)
+            if temp_r_snippetized.find('div', class_='snippet-body'):
+                temp_r_snippetized.find('div', class_='snippet-body').decompose()
+            title = temp_r_snippetized.text.strip()
+            if 'blogspot.com/' in post_url and len(title) > 5:
+                entries.append({'title': title, 'url': post_url, 'deadline_text': deadline_text})
+    return entries
+
+
+def legacy_post_media(html):
+    """আগের scrape_single_post_media এর পার্সিং অংশ।"""
+    soup = BeautifulSoup(html, 'html.parser')
+    media_data = {'images': [], 'download_links': [], 'labels': [], 'application_link': None, 'application_text': None}
+
+    post_body = soup.find('div', class_='post-body')
+    if not post_body:
+        post_body = soup.find('div', class_='entry-content')
+    if not post_body:
+        return media_data
+
+    images = post_body.select('div.separator img[src], div.separator img[data-src]')
+    if not images:
+        images = post_body.select('img[src], img[data-src]')
+    for img_tag in images:
+        img_src = img_tag.get('src') or img_tag.get('data-src')
+        if img_src:
+            media_data['images'].append(img_src.replace('/s16000/', '/s1000/'))
+
+    for p_tag in post_body.find_all('p'):
+        if 'আবেদনের লিংকঃ' in p_tag.text:
+            link_tag = p_tag.find('a', href=True)
+            if link_tag:
+                media_data['application_link'] = link_tag['href']
+                media_data['application_text'] = p_tag.text.strip()
+                break
+
+    if not media_data['application_link']:
+        for link in post_body.find_all('a', href=True):
+            link_text = link.get_text().strip()
+            parent_text = link.parent.get_text().strip() if link.parent else ""
+            if re.search(r'apply', link_text, re.IGNORECASE):
+                media_data['application_link'] = link['href']
+                media_data['application_text'] = "Apply Link: " + link_text
+                break
+            elif re.search(r'apply', parent_text, re.IGNORECASE) and len(parent_text) < 150:
+                media_data['application_link'] = link['href']
+                media_data['application_text'] = parent_text
+                break
+
+    labels_container = soup.find('span', class_='post-labels')
+    if not labels_container:
+        labels_container = soup.find('div', class_='post-footer')
+    if labels_container:
+        label_tags = labels_container.select('a[rel="tag"]')
+        if not label_tags:
+            label_tags = labels_container.find_all('a')
+        if label_tags:
+            media_data['labels'] = [tag.text.strip() for tag in label_tags if tag.text.strip()]
+
+    if not media_data['labels']:
+        media_data['labels'] = ['জব সার্কুলার']
+    return media_data
+
+
+def load_fixtures():
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            pages[os.path.basename(path)] = f.read()
+    return pages
+
+
+def add_template_noise(html, noise_kb):
+    """পোস্ট কন্টেন্টের বাইরে সাইডবার উইজেট ও স্ক্রিপ্ট যোগ করে আসল পেজের আকারের কাছাকাছি আনে।"""
+    widget = (
+        '<div class="widget PopularPosts"><ul>'
+        + ''.join(f'<li><a href="/p/page-{i}.html"><img src="/thumb-{i}.jpg"/>জনপ্রিয় পোস্ট {i}</a></li>' for i in range(10))
+        + '</ul></div><script>var data = {"k": [1, 2, 3]};</script>'
+    )
+    repeat = max(0, noise_kb * 1024 // len(widget.encode('utf-8')))
+    return html.replace('</body>', f'<aside class="sidebar">{widget * repeat}</aside></body>')
+
+
+def quiet(func, *args):
+    """এক্সট্র্যাক্টরের প্রগ্রেস প্রিন্ট বেঞ্চমার্ক আউটপুটে না আসার জন্য।"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def measure(func, html, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        quiet(func, html)
+    per_call = (time.perf_counter() - start) / iterations
+
+    tracemalloc.start()
+    quiet(func, html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return per_call, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--noise-kb', type=int, default=0)
+    args = parser.parse_args()
+
+    scraper = load_scraper()
+    mismatches = 0
+
+    print(f"{'page':<26} {'legacy ms':>10} {'new ms':>8} {'legacy KiB':>11} {'new KiB':>8}  match")
+    for name, html in load_fixtures().items():
+        html = add_template_noise(html, args.noise_kb)
+        if name.startswith('archive'):
+            legacy, new = legacy_listing_entries, scraper.extract_listing_entries
+        else:
+            legacy, new = legacy_post_media, scraper.extract_post_media
+
+        same = quiet(legacy, html) == quiet(new, html)
+        mismatches += not same
+        legacy_time, legacy_peak = measure(legacy, html, args.iterations)
+        new_time, new_peak = measure(new, html, args.iterations)
+        print(f"{name:<26} {legacy_time * 1000:>10.3f} {new_time * 1000:>8.3f} "
+              f"{legacy_peak / 1024:>11.1f} {new_peak / 1024:>8.1f}  {'yes' if same else 'NO'}")
+
+    if mismatches:
+        print(f"{mismatches} fixture(s) differ from the legacy output")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
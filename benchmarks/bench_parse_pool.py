@@ -0,0 +1,81 @@
+"""
+ব্যাকফিল মোডের প্রসেস-পুল পার্সিং কতটা কোরের সাথে বাড়ে তা মাপে (নেটওয়ার্ক ছাড়া)।
+
+    python benchmarks/bench_parse_pool.py [--pages 2000] [--workers 1,2,4,8] [--chunk-sizes 1,16,64]
+
+কর্পাসের পোস্ট পেজগুলো পুনরাবৃত্তি করে --pages টি কাঁচা HTML বানানো হয়, তারপর একই পেজ
+থ্রেড পুলে (GIL এ আটকে থাকে, তুলনার জন্য) এবং বিভিন্ন PARSE_WORKERS/PARSE_CHUNK_SIZE এ প্রসেস পুলে
+_parse_post_pages দিয়ে পার্স হয়। ছোট চাংকে IPC খরচ, বড় চাংকে শেষের দিকে অলস ওয়ার্কার দেখা যায়।
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from run_benchmarks import quiet
+
+
+def build_pages(count):
+    from corpus import build_corpus
+
+    pages, _first_path = build_corpus(50)
+    post_pages = [(path, html) for path, html in sorted(pages.items()) if 'job-circular' in path]
+    return [post_pages[i % len(post_pages)] for i in range(count)]
+
+
+def chunked(pages, size):
+    return [pages[offset:offset + size] for offset in range(0, len(pages), size)]
+
+
+def run_threads(scraper, pages, workers):
+    started = time.perf_counter()
+    with quiet(), ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(scraper._parse_post_pages, chunked(pages, 1)))
+    return time.perf_counter() - started
+
+
+def _silence_worker():
+    sys.stdout = open(os.devnull, 'w')
+
+
+def run_processes(scraper, pages, workers, chunk_size):
+    with ProcessPoolExecutor(max_workers=workers, initializer=_silence_worker) as pool:
+        # ওয়ার্কার চালু হওয়ার খরচ মাপের বাইরে রাখা হয়, রানে এটি একবারই হয়
+        pool.submit(int).result()
+        started = time.perf_counter()
+        list(pool.map(scraper._parse_post_pages, chunked(pages, chunk_size)))
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=2000)
+    parser.add_argument('--workers', default=','.join(str(n) for n in (1, 2, 4, 8) if n <= (os.cpu_count() or 1)) or '1')
+    parser.add_argument('--chunk-sizes', default='1,16,64')
+    args = parser.parse_args()
+
+    os.environ.setdefault('IMAGE_CHECK', '0')
+    from _loader import load_scraper
+
+    scraper = load_scraper()
+    pages = build_pages(args.pages)
+    print(f"{len(pages)} post pages, {os.cpu_count()} CPUs\n")
+    print(f"{'mode':>10} {'workers':>8} {'chunk':>6} {'seconds':>8} {'pages/s':>9} {'speedup':>8}")
+
+    # bs4/lxml ইমপোর্ট ও strainer তৈরি মাপের বাইরে রাখতে একবার গরম করে নেওয়া
+    run_threads(scraper, pages[:20], 1)
+    baseline = run_threads(scraper, pages, 1)
+    print(f"{'serial':>10} {1:>8} {1:>6} {baseline:>8.2f} {len(pages) / baseline:>9.1f} {1:>8.2f}")
+    for workers in (int(value) for value in args.workers.split(',')):
+        seconds = run_threads(scraper, pages, workers)
+        print(f"{'threads':>10} {workers:>8} {1:>6} {seconds:>8.2f} {len(pages) / seconds:>9.1f} {baseline / seconds:>8.2f}")
+        for chunk_size in (int(value) for value in args.chunk_sizes.split(',')):
+            seconds = run_processes(scraper, pages, workers, chunk_size)
+            print(f"{'processes':>10} {workers:>8} {chunk_size:>6} {seconds:>8.2f} "
+                  f"{len(pages) / seconds:>9.1f} {baseline / seconds:>8.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
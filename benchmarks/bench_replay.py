@@ -0,0 +1,120 @@
+"""
+HTTP ক্যাসেট রেকর্ড/রিপ্লে দিয়ে নেটওয়ার্ক ছাড়া স্ক্র্যাপিং লোড টেস্ট।
+
+    python benchmarks/bench_replay.py [--posts 200] [--volume 20] [--workers 4,8,16,32]
+                                      [--latency-ms 80] [--jitter-ms 40] [--error-rate 0.02]
+
+প্রথমে লোকাল fake_site থেকে আর্কাইভ ক্রল ও সব পোস্ট স্ক্র্যাপ HTTP_CASSETTE_MODE=record এ
+চালিয়ে ক্যাসেট তৈরি হয়, তারপর সার্ভার বন্ধ করে একই পোস্টগুলো --volume গুণ বেশি বার রিপ্লে করা হয়
+(কৃত্রিম লেটেন্সি, জিটার ও ত্রুটির হার সহ) বিভিন্ন ওয়ার্কার সংখ্যায়। এতে হোস্ট-লিমিট, থ্রেড পুল
+ও ত্রুটি-হ্যান্ডলিং বেশি ভলিউমে কেমন আচরণ করে তা ল্যাপটপেই মাপা যায়।
+"""
+import argparse
+import atexit
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from run_benchmarks import percentile, quiet
+
+
+def configure_environment(args, state_dir, cassette_path):
+    """স্ক্রিপ্টের কনফিগারেশন ইমপোর্টের সময় পড়া হয়, তাই লোডের আগেই env সেট করতে হবে।"""
+    os.environ.update({
+        'STATE_DIR': state_dir,
+        'HTTP_CASSETTE_MODE': 'record',
+        'HTTP_CASSETTE': cassette_path,
+        'CRAWL_MODE': 'paginated',
+        'CRAWL_MAX_PAGES': str(10 ** 6),
+        'MAX_POSTS': str(10 ** 9),
+        'IMAGE_CHECK': '0',
+        'PER_HOST_CONCURRENCY': str(args.per_host_concurrency),
+    })
+
+
+def switch_to_replay(scraper, args, seed):
+    """একই প্রসেসে রেকর্ড থেকে রিপ্লে তে যেতে মডিউলের ক্যাসেট ও সেশন নতুন করে তৈরি করানো হয়।"""
+    scraper.HTTP_CASSETTE_MODE = 'replay'
+    scraper.REPLAY_LATENCY_MS = args.latency_ms
+    scraper.REPLAY_JITTER_MS = args.jitter_ms
+    scraper.REPLAY_ERROR_RATE = args.error_rate
+    scraper.REPLAY_SEED = seed
+    scraper._cassette = None
+    scraper._http_session = None
+
+
+def replay_scenario(scraper, post_urls, workers):
+    latencies = []
+    failures = 0
+
+    def scrape(url):
+        started = time.perf_counter()
+        media = scraper.scrape_single_post_media(url)
+        return time.perf_counter() - started, not media['images']
+
+    started = time.perf_counter()
+    with quiet(), ThreadPoolExecutor(max_workers=workers) as executor:
+        for elapsed, failed in executor.map(scrape, post_urls):
+            latencies.append(elapsed)
+            failures += failed
+    total = time.perf_counter() - started
+    return total, latencies, failures
+
+
+def run(args, state_dir):
+    cassette_path = os.path.join(state_dir, 'cassette.zip')
+    configure_environment(args, state_dir, cassette_path)
+
+    from _loader import load_scraper
+    from corpus import build_corpus
+    from fake_site import FakeSite
+
+    scraper = load_scraper()
+    pages, first_path = build_corpus(args.posts, page_size=args.page_size)
+
+    with FakeSite(pages) as site:
+        started = time.perf_counter()
+        with quiet():
+            details = scraper.get_all_post_links_and_details(site.url(first_path))
+            post_urls = [entry['url'] for entry in details]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(scraper.scrape_single_post_media, post_urls))
+        record_seconds = time.perf_counter() - started
+        recorded_requests = site.requests
+    cassette = scraper.get_cassette()
+    cassette.save()
+    atexit.unregister(cassette.save)
+    print(f"recorded {recorded_requests} requests in {record_seconds:.2f}s; server is now stopped\n")
+
+    replay_urls = post_urls * args.volume
+    print(f"replaying {len(replay_urls)} post requests, latency {args.latency_ms:.0f}+{args.jitter_ms:.0f} ms, "
+          f"error rate {args.error_rate:.0%}, per-host limit {args.per_host_concurrency}")
+    print(f"{'workers':>8} {'seconds':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'failed':>7}")
+    for workers in (int(value) for value in args.workers.split(',')):
+        switch_to_replay(scraper, args, seed=str(workers))
+        total, latencies, failures = replay_scenario(scraper, replay_urls, workers)
+        print(f"{workers:>8} {total:>8.2f} {len(replay_urls) / total:>8.1f} "
+              f"{percentile(latencies, 0.5) * 1000:>8.1f} {percentile(latencies, 0.99) * 1000:>8.1f} {failures:>7}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posts', type=int, default=200)
+    parser.add_argument('--page-size', type=int, default=20)
+    parser.add_argument('--volume', type=int, default=20, help='রেকর্ড করা পোস্টের কত গুণ রিকোয়েস্ট রিপ্লে হবে')
+    parser.add_argument('--workers', default='4,8,16,32')
+    parser.add_argument('--per-host-concurrency', type=int, default=4)
+    parser.add_argument('--latency-ms', type=float, default=80)
+    parser.add_argument('--jitter-ms', type=float, default=40)
+    parser.add_argument('--error-rate', type=float, default=0.02)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='bench-replay-') as state_dir:
+        return run(args, state_dir)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
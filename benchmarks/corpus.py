@@ -0,0 +1,73 @@
+"""
+বেঞ্চমার্কের জন্য আর্কাইভ ও পোস্ট পেজের কর্পাস।
+
+fixtures/ এর হাতে লেখা পেজগুলো (আসল Blogger মার্কআপের আদলে) টেমপ্লেট হিসেবে ব্যবহার করে
+যেকোনো সংখ্যক পোস্ট ও "Older posts" পেজিনেশনসহ সিন্থেটিক আর্কাইভ তৈরি করা হয়।
+"""
+import glob
+import os
+from datetime import date, timedelta
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# স্ক্রিপ্ট শুধু 'blogspot.com/' যুক্ত URL নেয়, তাই লোকাল সার্ভারের পাথে এটি রাখা হয়
+SITE_PREFIX = '/sarkari-chakri-prostuti.blogspot.com'
+
+_SNIPPETS = [
+    'Deadline: {deadline:%d %b %Y}',
+    'আবেদনের সময়সীমা: {deadline:%d} ডিসেম্বর {deadline:%Y}',
+    'Application Deadline {deadline:%d %B %Y}',
+    'চূড়ান্ত ফলাফল প্রকাশিত হয়েছে',
+    'প্রবেশপত্র ডাউনলোড নোটিশ',
+]
+
+
+def load_post_templates():
+    """ইমেজসহ পোস্ট ফিক্সচারগুলো (বডি ছাড়া বা ইমেজ ছাড়া পেজ বাদে)।"""
+    templates = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, 'post_*.html'))):
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        if '<img' in html:
+            templates.append(html)
+    return templates
+
+
+def post_path(index, today=None):
+    published = (today or date.today()) - timedelta(days=index // 5)
+    return f"{SITE_PREFIX}/{published:%Y}/{published:%m}/job-circular-{index:05d}.html"
+
+
+def build_corpus(total_posts, page_size=20, today=None):
+    """
+    {পাথ: HTML} ডিকশনারি ও প্রথম আর্কাইভ পেজের পাথ ফেরত দেয়। নতুন পোস্ট আগে আসে,
+    প্রতিটি আর্কাইভ পেজ পরের (পুরোনো) পেজের লিংক দেয়।
+    """
+    today = today or date.today()
+    templates = load_post_templates()
+    pages = {}
+    archive_paths = [f"{SITE_PREFIX}/search?page={i}" for i in range(0, max(1, -(-total_posts // page_size)))]
+
+    for page_number, archive_path in enumerate(archive_paths):
+        rows = []
+        for index in range(page_number * page_size, min(total_posts, (page_number + 1) * page_size)):
+            path = post_path(index, today)
+            deadline = today + timedelta(days=30 - index % 45)
+            snippet = _SNIPPETS[index % len(_SNIPPETS)].format(deadline=deadline)
+            rows.append(
+                f'<div class="post-outer"><div class="post"><a href="{{base}}{path}" class="r-snippet-container">'
+                f'<div class="r-snippetized">সরকারি চাকরি নিয়োগ বিজ্ঞপ্তি নম্বর {index}'
+                f'<div class="snippet-body">{snippet}</div></div></a></div></div>'
+            )
+            pages[path] = templates[index % len(templates)].replace('</h3>', f' #{index}</h3>')
+
+        older = ''
+        if page_number + 1 < len(archive_paths):
+            older = (f'<a class="blog-pager-older-link flat-button" href="{{base}}{archive_paths[page_number + 1]}" '
+                     f'id="Blog1_blog-pager-older-link">Older posts</a>')
+        pages[archive_path] = (
+            '<!DOCTYPE html><html><head><meta charset="UTF-8"></head><body><div class="blog-posts">'
+            + ''.join(rows) + f'</div><div class="blog-pager">{older}</div></body></html>'
+        )
+
+    return pages, archive_paths[0]
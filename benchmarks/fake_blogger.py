@@ -0,0 +1,176 @@
+"""
+Blogger API v3 এর posts().list/insert/patch/delete ও ব্যাচ রিকোয়েস্টের ইন-মেমোরি নকল।
+
+কৃত্রিম লেটেন্সি, rateLimitExceeded (429) এর হার এবং দৈনিক কোটা সীমা কনফিগার করা যায়;
+ত্রুটিগুলো আসল googleapiclient HttpError হিসেবে তোলা হয় যাতে স্ক্রিপ্টের রিট্রাই কোড চলে।
+"""
+import itertools
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+QUOTA_COSTS = {'list': 1, 'get': 1, 'insert': 50, 'patch': 50, 'delete': 50}
+ORDER_BY_VALUES = ('ORDER_BY_UNSPECIFIED', 'PUBLISHED', 'UPDATED')
+
+
+def make_http_error(status, reason, retry_after=None):
+    headers = {'status': str(status)}
+    if retry_after is not None:
+        headers['retry-after'] = str(retry_after)
+    content = json.dumps({'error': {'code': status, 'errors': [{'reason': reason}]}}).encode('utf-8')
+    return HttpError(httplib2.Response(headers), content)
+
+
+class FakeRequest:
+    def __init__(self, service, kind, func):
+        self._service = service
+        self._kind = kind
+        self._func = func
+
+    def execute(self, in_batch=False):
+        if not in_batch and self._service.latency_seconds:
+            time.sleep(self._service.latency_seconds)
+        self._service._charge(self._kind)
+        return self._func()
+
+
+class FakeBatch:
+    """একটি ব্যাচ একবার রাউন্ড-ট্রিপ লেটেন্সি নেয়, ভেতরের রিকোয়েস্টগুলো ক্রমে চলে।"""
+
+    def __init__(self, service, callback):
+        self._service = service
+        self._callback = callback
+        self._items = []
+
+    def add(self, request, callback=None, request_id=None):
+        self._items.append((request_id, request, callback or self._callback))
+
+    def execute(self):
+        if self._service.latency_seconds:
+            time.sleep(self._service.latency_seconds)
+        for request_id, request, callback in self._items:
+            try:
+                response = request.execute(in_batch=True)
+            except HttpError as e:
+                callback(request_id, None, e)
+            else:
+                callback(request_id, response, None)
+
+
+class _Posts:
+    def __init__(self, service):
+        self._service = service
+
+    def list(self, blogId, labels=None, fetchBodies=True, maxResults=20, orderBy='PUBLISHED',
+             pageToken=None, fields=None, **kwargs):
+        # আসল ক্লায়েন্টের মতই ডিসকভারি ডকুমেন্টের enum এর বাইরের মান রিকোয়েস্ট তৈরির সময়ই বাতিল
+        if orderBy not in ORDER_BY_VALUES:
+            raise TypeError(f'Parameter "orderBy" value "{orderBy}" is not an allowed value in "{list(ORDER_BY_VALUES)}"')
+        service = self._service
+        sort_field = 'updated' if orderBy == 'UPDATED' else 'published'
+
+        def run():
+            with service.lock:
+                items = [p for p in service.store.values() if not labels or labels in p['labels']]
+            items.sort(key=lambda p: p[sort_field], reverse=True)
+            start = int(pageToken or 0)
+            response = {'items': [dict(p) for p in items[start:start + maxResults]]}
+            if start + maxResults < len(items):
+                response['nextPageToken'] = str(start + maxResults)
+            return response
+
+        return FakeRequest(service, 'list', run)
+
+    def insert(self, blogId, body, **kwargs):
+        service = self._service
+
+        def run():
+            with service.lock:
+                post = service._new_post(body['title'], body.get('labels', []))
+                post['content'] = body.get('content', '')
+            return dict(post)
+
+        return FakeRequest(service, 'insert', run)
+
+    def patch(self, blogId, postId, body, **kwargs):
+        service = self._service
+
+        def run():
+            with service.lock:
+                post = service.store[postId]
+                post.update({key: value for key, value in body.items() if key in ('title', 'content', 'labels')})
+                post['updated'] = service._timestamp()
+            return dict(post)
+
+        return FakeRequest(service, 'patch', run)
+
+    def delete(self, blogId, postId, **kwargs):
+        service = self._service
+
+        def run():
+            with service.lock:
+                if service.store.pop(postId, None) is None:
+                    raise make_http_error(404, 'notFound')
+            return ''
+
+        return FakeRequest(service, 'delete', run)
+
+
+class FakeBloggerService:
+    def __init__(self, latency_seconds=0.0, rate_limit_error_rate=0.0, quota_limit_units=None,
+                 retry_after_seconds=0, seed=0):
+        self.latency_seconds = latency_seconds
+        self.rate_limit_error_rate = rate_limit_error_rate
+        self.quota_limit_units = quota_limit_units
+        self.retry_after_seconds = retry_after_seconds
+        self.quota_units = 0
+        self.calls = {}
+        self.store = {}
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._clock = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self._random = random.Random(seed)
+
+    def posts(self):
+        return _Posts(self)
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self, callback)
+
+    def seed_posts(self, count, label, expired_fraction=0.0, today=None):
+        """ব্লগে আগে থেকে থাকা পোস্ট তৈরি করে; expired_fraction অংশের WebEndDate আজ বা আগের।"""
+        today = today or datetime.now().date()
+        with self.lock:
+            for i in range(count):
+                if i < count * expired_fraction:
+                    end_date = today - timedelta(days=i % 10)
+                else:
+                    end_date = today + timedelta(days=1 + i % 60)
+                self._new_post(f"বিদ্যমান পোস্ট {i}", [label, f"WebEndDate:{end_date:%d-%m-%Y}"])
+
+    def _timestamp(self):
+        self._clock += timedelta(seconds=1)
+        return self._clock.isoformat()
+
+    def _new_post(self, title, labels):
+        post_id = str(next(self._ids))
+        stamp = self._timestamp()
+        post = {'id': post_id, 'title': title, 'labels': list(labels), 'published': stamp, 'updated': stamp}
+        self.store[post_id] = post
+        return post
+
+    def _charge(self, kind):
+        with self.lock:
+            self.calls[kind] = self.calls.get(kind, 0) + 1
+            cost = QUOTA_COSTS.get(kind, 1)
+            if self.quota_limit_units is not None and self.quota_units + cost > self.quota_limit_units:
+                raise make_http_error(403, 'quotaExceeded')
+            self.quota_units += cost
+            throttled = kind != 'list' and self._random.random() < self.rate_limit_error_rate
+        if throttled:
+            raise make_http_error(429, 'rateLimitExceeded', self.retry_after_seconds)
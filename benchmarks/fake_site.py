@@ -0,0 +1,85 @@
+"""
+কর্পাস পরিবেশনের জন্য লোকাল HTTP সার্ভার (ETag/Last-Modified ও কৃত্রিম লেটেন্সি সহ)।
+"""
+import hashlib
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeSite:
+    """পেজের HTML এ থাকা '{base}' কে সার্ভারের আসল ঠিকানা দিয়ে বদলে পরিবেশন করে।"""
+
+    def __init__(self, pages, latency_seconds=0.0):
+        self.latency_seconds = latency_seconds
+        self.requests = 0
+        self.not_modified = 0
+        self._pages = pages
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._bodies = {
+            path: html.replace('{base}', self.base_url).encode('utf-8') for path, html in pages.items()
+        }
+        self._last_modified = formatdate(time.time() - 3600, usegmt=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def url(self, path):
+        return self.base_url + path
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                with site._lock:
+                    site.requests += 1
+                if site.latency_seconds:
+                    time.sleep(site.latency_seconds)
+
+                body = site._bodies.get(self.path)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get('If-None-Match') == etag:
+                    with site._lock:
+                        site.not_modified += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', site._last_modified)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_HEAD(self):
+                body = site._bodies.get(self.path)
+                self.send_response(200 if body is not None or self.path.endswith(('.jpg', '.png')) else 404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,239 @@
+"""
+নেটওয়ার্ক ছাড়া পুরো স্ক্রিপ্টের ধাপভিত্তিক পারফরম্যান্স বেঞ্চমার্ক।
+
+    python benchmarks/run_benchmarks.py [--posts 2000] [--existing-posts 5000] ...
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<আগের>.json
+
+লোকাল HTTP সার্ভার (fake_site) সিন্থেটিক কর্পাস পরিবেশন করে এবং FakeBloggerService আসল
+Blogger API এর জায়গা নেয়। প্রতিটি ধাপের থ্রুপুট, লেটেন্সি (p50/p90/p99) ও প্রসেসের সর্বোচ্চ
+RSS একটি JSON ফাইলে সংরক্ষিত হয়, যাতে রান-টু-রান রিগ্রেশন তুলনা করা যায়।
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+POST_TAG = 'অন্যান্য'
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summarize(latencies, total_seconds, items):
+    return {
+        'calls': len(latencies),
+        'items': items,
+        'total_seconds': round(total_seconds, 4),
+        'throughput_per_second': round(items / total_seconds, 2) if total_seconds else None,
+        'latency_ms': {
+            name: round(percentile(latencies, fraction) * 1000, 3) if latencies else None
+            for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0))
+        },
+    }
+
+
+@contextlib.contextmanager
+def quiet():
+    """স্ক্রিপ্টের বাংলা প্রগ্রেস প্রিন্ট বেঞ্চমার্কের সময় বন্ধ রাখা।"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    with quiet():
+        result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # লিনাক্সে KiB, macOS এ বাইট
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def configure_environment(args, state_dir):
+    """স্ক্রিপ্টের কনফিগারেশন ইমপোর্টের সময় পড়া হয়, তাই লোডের আগেই env সেট করতে হবে।"""
+    os.environ.update({
+        'STATE_DIR': state_dir,
+        'HTTP_CACHE': '1' if args.http_cache else '0',
+        # ফিক্সচারের ইমেজ URL আসল Blogger হোস্টের, বেঞ্চমার্ক যেন নেটওয়ার্কে না যায়
+        'IMAGE_CHECK': '0',
+        'CRAWL_MODE': 'paginated',
+        'CRAWL_MAX_PAGES': str(10 ** 6),
+        'MAX_POSTS': str(10 ** 9),
+        'POST_TAG': POST_TAG,
+        'POST_RATE_PER_MINUTE': str(args.post_rate_per_minute),
+        'POST_RATE_MAX_PER_MINUTE': str(args.post_rate_per_minute),
+        'SCRAPE_WORKERS': str(args.scrape_workers),
+    })
+
+
+def run(args):
+    from _loader import load_scraper
+    from corpus import build_corpus
+    from fake_blogger import FakeBloggerService
+    from fake_site import FakeSite
+
+    scraper = load_scraper()
+    pages, first_archive_path = build_corpus(args.posts, page_size=args.page_size)
+    stages = {}
+
+    def new_service():
+        # প্রতিটি ধাপে আলাদা blog_id, যাতে ডিস্কের পোস্ট ইনডেক্স এক ধাপ থেকে অন্য ধাপে না যায়
+        scraper._post_index_cache.clear()
+        scraper._rate_limiters.clear()
+        return FakeBloggerService(
+            latency_seconds=args.api_latency_ms / 1000,
+            rate_limit_error_rate=args.rate_limit_error_rate,
+            quota_limit_units=args.quota_limit_units,
+        )
+
+    with FakeSite(pages, latency_seconds=args.http_latency_ms / 1000) as site:
+        listing_url = site.url(first_archive_path)
+
+        # ১. আর্কাইভ লিস্টিং (সব পেজ)
+        latencies = []
+        for _ in range(args.listing_runs):
+            details, elapsed = timed(scraper.get_all_post_links_and_details, listing_url)
+            latencies.append(elapsed)
+        stages['get_all_post_links_and_details'] = dict(
+            summarize(latencies, sum(latencies), len(details) * args.listing_runs),
+            archive_pages=-(-args.posts // args.page_size),
+        )
+
+        # ২. একক পোস্ট স্ক্র্যাপ: পরপর (লেটেন্সি) ও থ্রেড পুলে (থ্রুপুট)
+        post_urls = [d['url'] for d in details][:args.scrape_posts]
+        latencies = []
+        for url in post_urls:
+            _, elapsed = timed(scraper.scrape_single_post_media, url)
+            latencies.append(elapsed)
+        stages['scrape_single_post_media'] = summarize(latencies, sum(latencies), len(post_urls))
+
+        start = time.perf_counter()
+        with quiet(), ThreadPoolExecutor(max_workers=args.scrape_workers) as executor:
+            media = list(executor.map(scraper.scrape_single_post_media, post_urls))
+        elapsed = time.perf_counter() - start
+        stages['scrape_single_post_media_concurrent'] = dict(
+            summarize([], elapsed, len(post_urls)), workers=args.scrape_workers
+        )
+
+    # ৩. বিদ্যমান পোস্ট ইনডেক্স: প্রথমবার পূর্ণ সিঙ্ক, পরে ইনক্রিমেন্টাল
+    service = new_service()
+    service.seed_posts(args.existing_posts, POST_TAG)
+    _, cold = timed(scraper.get_existing_titles, service, 'bench-index')
+    scraper._post_index_cache.clear()
+    service.seed_posts(args.publish_posts // 10, POST_TAG)
+    _, warm = timed(scraper.get_existing_titles, service, 'bench-index')
+    stages['get_existing_titles'] = dict(
+        summarize([cold, warm], cold + warm, args.existing_posts),
+        cold_full_sync_ms=round(cold * 1000, 3),
+        warm_incremental_ms=round(warm * 1000, 3),
+        api_calls=dict(service.calls),
+    )
+
+    # ৪. পোস্ট প্রকাশ
+    service = new_service()
+    with quiet():
+        rendered = [scraper.render_post(d, m) for d, m in zip(details, media)]
+    posts = [post for post in rendered if post][:args.publish_posts]
+    _, elapsed = timed(scraper.publish_posts, service, 'bench-publish', posts)
+    stages['publish_posts'] = dict(
+        summarize([], elapsed, len(posts)),
+        api_calls=dict(service.calls),
+        fake_quota_units=service.quota_units,
+        estimated_quota_units=scraper.get_rate_limiter('bench-publish').quota_units,
+    )
+
+    # ৫. মেয়াদোত্তীর্ণ পোস্ট ডিলিট
+    service = new_service()
+    service.seed_posts(args.existing_posts, POST_TAG, expired_fraction=args.expired_fraction)
+    _, elapsed = timed(scraper.delete_expired_posts, service, 'bench-delete')
+    deleted = args.existing_posts - len(service.store)
+    stages['delete_expired_posts'] = dict(summarize([elapsed], elapsed, deleted), api_calls=dict(service.calls))
+
+    return stages, scraper.METRICS.snapshot()
+
+
+def compare(current, previous_path):
+    with open(previous_path, encoding='utf-8') as f:
+        previous = json.load(f)
+    print(f"\ncompared with {previous_path}:")
+    for name, stage in current['stages'].items():
+        old = previous.get('stages', {}).get(name)
+        if not old or not old.get('throughput_per_second') or not stage.get('throughput_per_second'):
+            continue
+        ratio = stage['throughput_per_second'] / old['throughput_per_second']
+        flag = '  <-- regression' if ratio < 0.9 else ''
+        print(f"  {name:<40} throughput x{ratio:.2f}{flag}")
+    print(f"  {'peak_rss_mb':<40} {previous.get('peak_rss_mb')} -> {current['peak_rss_mb']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posts', type=int, default=500, help='সিন্থেটিক আর্কাইভে মোট পোস্ট')
+    parser.add_argument('--page-size', type=int, default=20)
+    parser.add_argument('--listing-runs', type=int, default=3)
+    parser.add_argument('--scrape-posts', type=int, default=100)
+    parser.add_argument('--scrape-workers', type=int, default=8)
+    parser.add_argument('--existing-posts', type=int, default=5000, help='ব্লগে আগে থেকে থাকা পোস্ট')
+    parser.add_argument('--publish-posts', type=int, default=50)
+    parser.add_argument('--expired-fraction', type=float, default=0.05)
+    parser.add_argument('--http-latency-ms', type=float, default=20)
+    parser.add_argument('--api-latency-ms', type=float, default=50)
+    parser.add_argument('--rate-limit-error-rate', type=float, default=0.0)
+    parser.add_argument('--quota-limit-units', type=int, default=None)
+    parser.add_argument('--post-rate-per-minute', type=float, default=6000)
+    parser.add_argument('--http-cache', action='store_true', help='ডিস্ক HTTP ক্যাশ চালু রেখে মাপা')
+    parser.add_argument('--output', help='ফলাফলের JSON পাথ (ডিফল্ট: benchmarks/results/)')
+    parser.add_argument('--compare', help='আগের ফলাফলের JSON এর সাথে তুলনা')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='oth-bench-') as state_dir:
+        configure_environment(args, state_dir)
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        stages, scraper_metrics = run(args)
+
+    result = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': vars(args),
+        'stages': stages,
+        'peak_rss_mb': peak_rss_mb(),
+        # স্ক্রিপ্টের নিজস্ব মেট্রিক্স (HTTP/API কাউন্টার, লেটেন্সি হিস্টোগ্রাম)
+        'scraper_metrics': scraper_metrics,
+    }
+
+    print(f"{'stage':<40} {'items':>7} {'items/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for name, stage in stages.items():
+        latency = stage['latency_ms']
+        print(f"{name:<40} {stage['items']:>7} {stage['throughput_per_second'] or 0:>10.1f} "
+              f"{latency['p50'] or 0:>9.1f} {latency['p99'] or 0:>9.1f}")
+    print(f"peak RSS: {result['peak_rss_mb']} MB")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"bench-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"saved: {output}")
+
+    if args.compare:
+        compare(result, args.compare)
+
+
+if __name__ == '__main__':
+    main()
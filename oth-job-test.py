@@ -1,16 +1,35 @@
+import time
+_PROCESS_STARTED = time.perf_counter()
+
 import os
 import requests
-from bs4 import BeautifulSoup
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-import time
+# ⚡ bs4, google-auth ও googleapiclient.discovery ভারী, তাই যে ধাপে দরকার সেখানেই ইমপোর্ট করা হয়
+from googleapiclient.errors import HttpError
 import re
-import copy 
+import html as html_lib
 from datetime import datetime, timedelta
-import dateparser 
 import json
+import unicodedata
+from functools import lru_cache
+import hashlib
+import zlib
+import zipfile
+import io
+import heapq
+import random
+import threading
+import queue
+import atexit
+import signal
+from contextlib import contextmanager
+from string import Template
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from http.client import responses as HTTP_STATUS_REASONS
 
 
 # =========================================================
@@ -19,433 +38,3199 @@ import json
 
 TARGET_LISTING_URL = os.getenv('TARGET_URL')
 BLOG_ID = os.getenv('BLOG_ID')
+# 🪞 একই পোস্ট একাধিক ব্লগে: কমা দিয়ে আলাদা BLOG_IDS (না দিলে বা খালি হলে শুধু BLOG_ID)
+# GitHub Actions এ অসংজ্ঞায়িত secret খালি স্ট্রিং হিসেবে আসে, তাই `or` দিয়ে ফলব্যাক
+BLOG_IDS = [blog_id.strip() for blog_id in (os.getenv('BLOG_IDS') or BLOG_ID or '').split(',') if blog_id.strip()]
 
 SCOPES = ['https://www.googleapis.com/auth/blogger']
 MAX_POSTS_TO_LOAD = int(os.getenv('MAX_POSTS', 50))
-POST_DELAY_SECONDS = 10 
+# ⏱️ অ্যাডাপটিভ রেট লিমিট: শুরুতে এই হারে পোস্ট হবে, সফল হলে বাড়বে, 429 পেলে অর্ধেক হবে
+POST_RATE_PER_MINUTE = float(os.getenv('POST_RATE_PER_MINUTE', 12))
+POST_RATE_MIN_PER_MINUTE = float(os.getenv('POST_RATE_MIN_PER_MINUTE', 2))
+POST_RATE_MAX_PER_MINUTE = float(os.getenv('POST_RATE_MAX_PER_MINUTE', 60))
+# 1 এর বেশি দিলে ব্যাচে ইনসার্ট হবে, তবে ব্যাচের ভেতরে প্রকাশের ক্রম নিশ্চিত নয়
+PUBLISH_BATCH_SIZE = int(os.getenv('PUBLISH_BATCH_SIZE', 1))
+# Blogger API কোটা খরচের আনুমানিক হিসাব (প্রতি কল ইউনিট)
+API_QUOTA_COSTS = {'list': 1, 'get': 1, 'insert': 50, 'patch': 50, 'delete': 50}
+# শুধু এই ধরনের কলগুলো টোকেন খরচ করে; বাকিগুলো শুধু থ্রটল বিরতি মেনে চলে
+RATE_LIMITED_API_KINDS = {'insert', 'patch'}
 DELETE_DELAY_SECONDS = 1
+DELETE_BATCH_SIZE = int(os.getenv('DELETE_BATCH_SIZE', 50))
+API_MAX_RETRIES = int(os.getenv('API_MAX_RETRIES', 4))
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# insert আইডেমপোটেন্ট নয়: 5xx/নেটওয়ার্ক ত্রুটির আগেই পোস্ট তৈরি হয়ে থাকতে পারে, তাই শুধু রেট-লিমিটে আবার পাঠানো হয়
+NON_IDEMPOTENT_API_KINDS = {'insert'}
 SCRAPED_POST_TAG = os.getenv('POST_TAG', 'অন্যান্য')
 
+BLOGGER_DISCOVERY_URL = 'https://www.googleapis.com/discovery/v1/apis/blogger/v3/rest'
+# ⏱️ রিফ্রেশ করা অ্যাক্সেস টোকেন মেয়াদ শেষের এত সেকেন্ড আগ পর্যন্ত পুনরায় ব্যবহার হবে
+TOKEN_REUSE_MARGIN_SECONDS = 300
+# 🔑 অ্যাক্সেস টোকেন ক্যাশ STATE_DIR এর বাইরে রাখা হয়, কারণ CI সেই ফোল্ডার Actions cache এ সংরক্ষণ করে।
+# CI তে রানগুলোর ব্যবধান টোকেনের মেয়াদের (~১ ঘন্টা) চেয়ে বেশি, তাই সেখানে ক্যাশ বন্ধ (TOKEN_CACHE=0 দিলেও বন্ধ)
+TOKEN_CACHE_PATH = os.getenv('TOKEN_CACHE') or os.path.join(os.path.expanduser('~'), '.cache', 'oth-scraper', 'token_cache.json')
+TOKEN_CACHE_ENABLED = os.getenv('TOKEN_CACHE') != '0' and not os.getenv('CI')
+
 # 🎯 নতুন ডেট ট্যাগ প্যাটার্ন
 WEB_END_DATE_TAG_PREFIX = 'WebEndDate:'
 
+# ⚡ কনকারেন্ট স্ক্র্যাপিং সেটিংস
+SCRAPE_WORKERS = int(os.getenv('SCRAPE_WORKERS', 8))
+PER_HOST_CONCURRENCY = int(os.getenv('PER_HOST_CONCURRENCY', 4))
+# একই হোস্টে পরপর দুটি রিকোয়েস্টের মধ্যে ন্যূনতম বিরতি (ভদ্রতা); 0 হলে বন্ধ
+PER_HOST_MIN_INTERVAL_SECONDS = float(os.getenv('PER_HOST_MIN_INTERVAL_SECONDS', 0))
+
+# 🌐 একাধিক সোর্স: SOURCES (JSON) বা SOURCES_FILE (JSON ফাইলের পাথ); না দিলে শুধু TARGET_URL।
+# উদাহরণ: [{"url": "https://x.blogspot.com/search/label/Bank", "max_posts": 20, "tag": "ব্যাংক",
+#           "include": "ব্যাংক|Bank", "exclude": "ফলাফল", "types": ["deadline"]}]
+SOURCES_JSON = os.getenv('SOURCES')
+SOURCES_FILE = os.getenv('SOURCES_FILE')
+
+# 💾 রান-টু-রান স্টেট ও HTTP ক্যাশ সেটিংস (HTTP_CACHE=0 দিলে ক্যাশ বন্ধ)
+STATE_DIR = os.getenv('STATE_DIR', '.scraper_state')
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE', '1') != '0'
+HTTP_CACHE_DIR = os.path.join(STATE_DIR, 'http_cache')
+HTTP_CACHE_MAX_AGE_DAYS = int(os.getenv('HTTP_CACHE_MAX_AGE_DAYS', 14))
+HTTP_CACHE_MAX_MB = int(os.getenv('HTTP_CACHE_MAX_MB', 100))
+
+# 📼 HTTP রেকর্ড/রিপ্লে: HTTP_CASSETTE_MODE='record' আসল রানের সব রেসপন্স (স্ক্র্যাপিং ও Blogger API)
+# HTTP_CASSETTE (zip) এ লেখে, 'replay' নেটওয়ার্ক ছাড়াই সেখান থেকে চালায়, সাথে কৃত্রিম লেটেন্সি/জিটার/ত্রুটি।
+HTTP_CASSETTE_MODE = os.getenv('HTTP_CASSETTE_MODE', 'off')
+HTTP_CASSETTE_PATH = os.getenv('HTTP_CASSETTE', 'http_cassette.zip')
+REPLAY_LATENCY_MS = float(os.getenv('REPLAY_LATENCY_MS', 0))
+REPLAY_JITTER_MS = float(os.getenv('REPLAY_JITTER_MS', 0))
+REPLAY_ERROR_RATE = float(os.getenv('REPLAY_ERROR_RATE', 0))
+REPLAY_SEED = os.getenv('REPLAY_SEED')
+if HTTP_CASSETTE_MODE in ('record', 'replay'):
+    # ক্যাসেটে কন্ডিশনাল (304) রেসপন্স নয়, পুরো বডি থাকা দরকার
+    HTTP_CACHE_ENABLED = False
+
+# 🖼️ ইমেজ যাচাই: প্রদর্শন/ডাউনলোড সাইজ HEAD রিকোয়েস্টে যাচাই, ফলাফল ডিস্কে TTL সহ ক্যাশ (IMAGE_CHECK=0 দিলে বন্ধ)
+IMAGE_DISPLAY_SIZE = 's1000'
+IMAGE_DOWNLOAD_SIZE = 's16000'
+IMAGE_CHECK_ENABLED = os.getenv('IMAGE_CHECK', '1') != '0'
+IMAGE_CHECK_WORKERS = int(os.getenv('IMAGE_CHECK_WORKERS', 8))
+IMAGE_CHECK_TIMEOUT_SECONDS = 10
+IMAGE_CHECK_TTL_DAYS = int(os.getenv('IMAGE_CHECK_TTL_DAYS', 7))
+# ভাঙা ইমেজের ফলাফল কম সময় রাখা হয়, যাতে সাময়িক সমস্যা স্থায়ী না হয়
+IMAGE_CHECK_FAILURE_TTL_HOURS = int(os.getenv('IMAGE_CHECK_FAILURE_TTL_HOURS', 6))
+
+# 📚 আর্কাইভ ক্রল মোড: 'single' (শুধু TARGET_URL পেজ) বা 'paginated' (Older posts ধরে পেছনে যাওয়া)
+CRAWL_MODE = os.getenv('CRAWL_MODE', 'single')
+CRAWL_MAX_PAGES = int(os.getenv('CRAWL_MAX_PAGES', 20))
+# এই তারিখের (YYYY-MM-DD) আগের মাসের পোস্ট URL পেলে ক্রল থামবে
+CRAWL_WATERMARK_DATE = os.getenv('CRAWL_WATERMARK_DATE')
+
+# 🧮 ব্যাকফিল মোডে HTML পার্সিং প্রসেসের সংখ্যা (0 = সব কোর) এবং প্রতি IPC বার্তায় পেজ সংখ্যা
+PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', 0)) or os.cpu_count() or 1
+PARSE_CHUNK_SIZE = int(os.getenv('PARSE_CHUNK_SIZE', 16))
+
+# 🚰 স্ট্রিমিং পাইপলাইন: স্ক্র্যাপ হয়ে প্রকাশের অপেক্ষায় থাকা সর্বোচ্চ পোস্ট সংখ্যা
+PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', 8))
+JOURNAL_RETENTION_DAYS = int(os.getenv('JOURNAL_RETENTION_DAYS', 30))
+# প্রকাশ শেষ না হওয়া scraped/rendered রেকর্ড (পুরো রেন্ডার করা HTML সহ) এর চেয়ে পুরোনো হলে বাদ, আবার স্ক্র্যাপ হবে
+JOURNAL_PENDING_RETENTION_DAYS = int(os.getenv('JOURNAL_PENDING_RETENTION_DAYS', 3))
+
+# 📇 লোকাল পোস্ট ইনডেক্স সেটিংস
+POST_INDEX_FULL_SYNC_DAYS = int(os.getenv('POST_INDEX_FULL_SYNC_DAYS', 7))
+POST_INDEX_PAGE_SIZE = 500
+POST_INDEX_INCREMENTAL_PAGE_SIZE = 50
+POST_INDEX_LIST_FIELDS = 'nextPageToken,items(id,title,labels,published,updated)'
+
+# ✏️ সোর্সে বদলে যাওয়া (ডেডলাইন বাড়ানো, নতুন ছবি) আগে প্রকাশিত পোস্ট patch করা (POST_UPDATES=0 দিলে বন্ধ)
+POST_UPDATES_ENABLED = os.getenv('POST_UPDATES', '1') != '0'
+# একই পোস্টের সোর্স পেজ এর চেয়ে ঘন ঘন আবার আনা হয় না (ইনডেক্সের checked_at দিয়ে); 0 হলে প্রতি রানে
+POST_UPDATE_CHECK_INTERVAL_HOURS = float(os.getenv('POST_UPDATE_CHECK_INTERVAL_HOURS', 24))
+
+# 🧬 প্রায়-একই টাইটেল (সংশোধিত/ভিন্ন বিরাম চিহ্ন) কে ডুপ্লিকেট ধরার ন্যূনতম Jaccard মিল; 1 হলে বন্ধ
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv('NEAR_DUPLICATE_THRESHOLD', 0.85))
+
+# 🔁 রান মোড: 'once' (CI তে একবার চালানো), 'daemon' (অবিরাম চলে এবং TARGET_URL পর্যবেক্ষণ করে)
+# বা 'backfill' (পুরো আর্কাইভ একবার পড়া, পার্সিং প্রসেস পুলে)
+RUN_MODE = os.getenv('RUN_MODE', 'once')
+# ডেমন পোলিং: নতুন পোস্ট পেলে সর্বনিম্ন বিরতিতে ফেরে, কিছু না বদলালে ধাপে ধাপে সর্বোচ্চ পর্যন্ত বাড়ে
+POLL_MIN_SECONDS = int(os.getenv('POLL_MIN_SECONDS', 300))
+POLL_MAX_SECONDS = int(os.getenv('POLL_MAX_SECONDS', 3600))
+POLL_BACKOFF_FACTOR = float(os.getenv('POLL_BACKOFF_FACTOR', 1.5))
+DELETE_SWEEP_INTERVAL_SECONDS = int(os.getenv('DELETE_SWEEP_INTERVAL_SECONDS', 6 * 3600))
+HTTP_CACHE_PRUNE_INTERVAL_SECONDS = 24 * 3600
+
+# 📊 রান শেষে মেট্রিক্স রিপোর্ট: JSON সবসময়, Prometheus textfile ও cProfile শুধু পাথ দিলে
+RUN_REPORT_PATH = os.getenv('RUN_REPORT', os.path.join(STATE_DIR, 'run_report.json'))
+METRICS_TEXTFILE_PATH = os.getenv('METRICS_TEXTFILE')
+PROFILE_OUTPUT_PATH = os.getenv('PROFILE_OUTPUT')
+
+# =========================================================
+# সহায়ক ফাংশন: রান মেট্রিক্স (ধাপের সময়, কাউন্টার, লেটেন্সি হিস্টোগ্রাম)
+# =========================================================
+
+METRICS_PREFIX = 'oth_scraper'
+LATENCY_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class RunMetrics:
+    """
+    একটি রানের ধাপভিত্তিক সময়, কাউন্টার ও লেটেন্সি হিস্টোগ্রাম থ্রেড-সেফভাবে জমা রাখে।
+    লেবেল (যেমন host, kind) সহ প্রতিটি সিরিজ আলাদা রাখা হয়।
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.finished = False
+        self.stages = {}
+        self.counters = {}
+        self.histograms = {}
+        self._latency_hooks = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """হিস্টোগ্রামে একটি লেটেন্সি যোগ করে এবং রেজিস্টার করা হুকগুলোকে জানায়।"""
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {'buckets': [0] * len(LATENCY_BUCKETS_SECONDS), 'sum': 0.0, 'count': 0}
+            histogram['sum'] += seconds
+            histogram['count'] += 1
+            for i, bound in enumerate(LATENCY_BUCKETS_SECONDS):
+                if seconds <= bound:
+                    histogram['buckets'][i] += 1
+                    break
+            hooks = list(self._latency_hooks)
+        for hook in hooks:
+            hook(name, labels, seconds)
+
+    def add_latency_hook(self, hook):
+        """প্রতিটি HTTP/API রিকোয়েস্টের কাঁচা লেটেন্সি পেতে hook(name, labels, seconds) রেজিস্টার করে।"""
+        with self._lock:
+            self._latency_hooks.append(hook)
+
+    def record_stage(self, name, seconds):
+        with self._lock:
+            stage = self.stages.setdefault(name, {'calls': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+            stage['calls'] += 1
+            stage['total_seconds'] += seconds
+            stage['max_seconds'] = max(stage['max_seconds'], seconds)
+
+    @contextmanager
+    def stage(self, name):
+        """with ব্লক বা ডেকোরেটর হিসেবে একটি ধাপের সময় মাপে (থ্রেড পুলে মোট সময় যোগ হয়)।"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - started)
+
+    def snapshot(self):
+        """JSON এ লেখার উপযোগী ডিকশনারি ফেরত দেয়; হিস্টোগ্রাম বাকেটগুলো ক্রমযোজিত (cumulative)।"""
+        with self._lock:
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': round(value, 6)}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+            histograms = []
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                cumulative, running = {}, 0
+                for bound, count in zip(LATENCY_BUCKETS_SECONDS, histogram['buckets']):
+                    running += count
+                    cumulative[str(bound)] = running
+                cumulative['+Inf'] = histogram['count']
+                histograms.append({
+                    'name': name, 'labels': dict(labels), 'buckets': cumulative,
+                    'sum': round(histogram['sum'], 6), 'count': histogram['count'],
+                })
+            stages = {
+                name: {
+                    'calls': stage['calls'],
+                    'total_seconds': round(stage['total_seconds'], 6),
+                    'max_seconds': round(stage['max_seconds'], 6),
+                }
+                for name, stage in self.stages.items()
+            }
+        return {'stages': stages, 'counters': counters, 'histograms': histograms}
+
+
+METRICS = RunMetrics()
+
+
+def start_profiler():
+    """PROFILE_OUTPUT দেওয়া থাকলে পুরো রানের cProfile চালু করে।"""
+    if not PROFILE_OUTPUT_PATH:
+        return None
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def _profile_summary(profiler, limit=15):
+    """cProfile ফলাফল ফাইলে লিখে cumulative সময় অনুযায়ী শীর্ষ ফাংশনগুলো ফেরত দেয়।"""
+    import pstats
+
+    profiler.disable()
+    os.makedirs(os.path.dirname(PROFILE_OUTPUT_PATH) or '.', exist_ok=True)
+    profiler.dump_stats(PROFILE_OUTPUT_PATH)
+    # METRICS.stage ডেকোরেটরের contextlib র‍্যাপারগুলো বাদ, নইলে তালিকার শীর্ষে শুধু সেগুলোই থাকে
+    rows = sorted(
+        (item for item in pstats.Stats(profiler).stats.items() if not item[0][0].endswith('contextlib.py')),
+        key=lambda item: item[1][3], reverse=True,
+    )[:limit]
+    return {
+        'path': PROFILE_OUTPUT_PATH,
+        'top_cumulative': [
+            {'function': f"{os.path.basename(filename)}:{line}({function})", 'calls': calls,
+             'self_seconds': round(self_time, 6), 'cumulative_seconds': round(cumulative, 6)}
+            for (filename, line, function), (_primitive, calls, self_time, cumulative, _callers) in rows
+        ],
+    }
+
+
+def build_run_report(profiler=None):
+    """মেট্রিক্স, স্টার্টআপ সময় ও ব্লগভিত্তিক কোটা হিসাব একসাথে রিপোর্টে জড়ো করে।"""
+    finished_at = time.time()
+    report = {
+        'started_at': datetime.fromtimestamp(METRICS.started_at).isoformat(timespec='seconds'),
+        'finished_at': datetime.fromtimestamp(finished_at).isoformat(timespec='seconds'),
+        'duration_seconds': round(finished_at - METRICS.started_at, 3),
+        'finished_cleanly': METRICS.finished,
+        'startup_seconds': {name: round(seconds, 6) for name, seconds in STARTUP_TIMINGS.items()},
+        'quota': {
+            blog_id: {'units': limiter.quota_units, 'calls': dict(limiter.calls),
+                      'final_rate_per_minute': round(limiter.rate_per_minute, 2)}
+            for blog_id, limiter in _rate_limiters.items()
+        },
+    }
+    report.update(METRICS.snapshot())
+    if profiler is not None:
+        report['profile'] = _profile_summary(profiler)
+    return report
+
+
+def _prometheus_labels(labels):
+    if not labels:
+        return ''
+    escaped = (
+        f'{key}="' + str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for key, value in sorted(labels.items())
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def format_prometheus(report):
+    """রিপোর্টকে node_exporter textfile collector এর ফরম্যাটে রূপান্তর করে।"""
+    lines = []
+
+    def sample(name, value, labels=None):
+        lines.append(f"{METRICS_PREFIX}_{name}{_prometheus_labels(labels)} {value}")
+
+    sample('last_run_timestamp_seconds', round(time.time()))
+    sample('run_duration_seconds', report['duration_seconds'])
+    sample('run_finished_cleanly', int(report['finished_cleanly']))
+    for name, stage in report['stages'].items():
+        sample('stage_seconds_total', stage['total_seconds'], {'stage': name})
+        sample('stage_calls_total', stage['calls'], {'stage': name})
+    for blog_id, quota in report['quota'].items():
+        sample('api_quota_units', quota['units'], {'blog_id': blog_id})
+    for counter in report['counters']:
+        sample(counter['name'], counter['value'], counter['labels'])
+    for histogram in report['histograms']:
+        for bound, count in histogram['buckets'].items():
+            sample(f"{histogram['name']}_bucket", count, dict(histogram['labels'], le=bound))
+        sample(f"{histogram['name']}_sum", histogram['sum'], histogram['labels'])
+        sample(f"{histogram['name']}_count", histogram['count'], histogram['labels'])
+    return '\n'.join(lines) + '\n'
+
+
+def print_stage_summary(report):
+    stages = sorted(report['stages'].items(), key=lambda item: item[1]['total_seconds'], reverse=True)
+    print("\n⏱️ ধাপভিত্তিক সময় (থ্রেড পুলের ধাপে সব থ্রেডের মোট সময়):")
+    for name, stage in stages:
+        print(f"    {name:<28} {stage['total_seconds']:>9.3f} s  ({stage['calls']} বার, সর্বোচ্চ {stage['max_seconds']:.3f} s)")
+    for blog_id, quota in report['quota'].items():
+        print(f"    📊 ব্লগ {blog_id}: আনুমানিক API কোটা খরচ {quota['units']} ইউনিট {quota['calls']}")
+
+
+def write_run_report(profiler=None):
+    """রান শেষে (atexit) JSON রিপোর্ট ও ঐচ্ছিক Prometheus textfile লেখে।"""
+    report = build_run_report(profiler)
+    print_stage_summary(report)
+    try:
+        _atomic_write(RUN_REPORT_PATH, json.dumps(report, ensure_ascii=False, indent=2))
+        if METRICS_TEXTFILE_PATH:
+            _atomic_write(METRICS_TEXTFILE_PATH, format_prometheus(report))
+        print(f"📝 রান রিপোর্ট সংরক্ষিত: {RUN_REPORT_PATH}")
+    except OSError as e:
+        print(f"⚠️ রান রিপোর্ট লেখা যায়নি: {e}")
+
 # =========================================================
 # সহায়ক ফাংশন: API অনুমোদিত সার্ভিস অবজেক্ট তৈরি
 # =========================================================
 
+STARTUP_TIMINGS = {}
+
+
+def _token_cache_path():
+    return TOKEN_CACHE_PATH
+
+
+def _remove_legacy_token_cache():
+    """আগের সংস্করণ টোকেন STATE_DIR এ রাখত; সেটি CI cache এ থেকে না যায় তাই মুছে ফেলা হয়।"""
+    try:
+        os.remove(os.path.join(STATE_DIR, 'token_cache.json'))
+    except OSError:
+        pass
+
+
+def _refresh_token_key(token_info):
+    """ক্যাশ করা টোকেন যেন শুধু একই রিফ্রেশ টোকেনের সাথে মেলে।"""
+    return hashlib.sha256(str(token_info.get('refresh_token')).encode('utf-8')).hexdigest()
+
+
+def _load_cached_access_token(token_info):
+    """আগের রানে রিফ্রেশ করা অ্যাক্সেস টোকেন এখনো বৈধ থাকলে token_info তে যোগ করে।"""
+    _remove_legacy_token_cache()
+    if not TOKEN_CACHE_ENABLED:
+        return token_info
+    try:
+        with open(_token_cache_path(), encoding='utf-8') as f:
+            cached = json.load(f)
+        expiry = datetime.strptime(cached['expiry'], '%Y-%m-%dT%H:%M:%S')
+    except (OSError, ValueError, KeyError):
+        return token_info
+
+    if cached.get('key') != _refresh_token_key(token_info):
+        return token_info
+    if (expiry - datetime.utcnow()).total_seconds() < TOKEN_REUSE_MARGIN_SECONDS:
+        return token_info
+
+    return dict(token_info, token=cached['token'], expiry=cached['expiry'])
+
+
+def _save_cached_access_token(token_info, creds):
+    """রিফ্রেশ করা অ্যাক্সেস টোকেন ও মেয়াদ (শুধু এগুলোই) পরের রানের জন্য সংরক্ষণ করে।"""
+    if not TOKEN_CACHE_ENABLED or not creds.token or not creds.expiry:
+        return
+    data = {
+        'key': _refresh_token_key(token_info),
+        'token': creds.token,
+        'expiry': creds.expiry.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+    try:
+        _atomic_write(_token_cache_path(), json.dumps(data))
+        os.chmod(_token_cache_path(), 0o600)
+    except OSError as e:
+        print(f"⚠️ টোকেন ক্যাশ সংরক্ষণ করা যায়নি: {e}")
+
+
+def _build_blogger_from_discovery(creds):
+    """
+    প্রথমে লাইব্রেরির সাথে বান্ডেল করা ডিসকভারি ডকুমেন্ট, না থাকলে ডিস্কে ক্যাশ করা কপি,
+    তাও না থাকলে একবার ডাউনলোড করে ক্যাশে রেখে সার্ভিস তৈরি করে।
+    """
+    from googleapiclient.discovery import build, build_from_document
+
+    client_kwargs = _api_client_kwargs(creds)
+    try:
+        return build('blogger', 'v3', static_discovery=True, cache_discovery=False, **client_kwargs)
+    except Exception as e:
+        print(f"⚠️ বান্ডেল করা ডিসকভারি ডকুমেন্ট পাওয়া যায়নি ({e}), ডিস্ক ক্যাশ ব্যবহার করা হচ্ছে।")
+
+    discovery_path = os.path.join(STATE_DIR, 'discovery', 'blogger_v3.json')
+    try:
+        with open(discovery_path, encoding='utf-8') as f:
+            document = f.read()
+    except OSError:
+        response = http_get(BLOGGER_DISCOVERY_URL, timeout=15)
+        response.raise_for_status()
+        document = response.text
+        _atomic_write(discovery_path, document)
+
+    return build_from_document(document, **client_kwargs)
+
+
+def _api_client_kwargs(creds):
+    """সাধারণত credentials; ক্যাসেট মোডে ক্যাসেটের মধ্য দিয়ে যাওয়া http অবজেক্ট।"""
+    cassette = get_cassette()
+    if cassette is None:
+        return {'credentials': creds}
+    if cassette.replaying:
+        return {'http': CassetteHttp(cassette)}
+
+    import google_auth_httplib2
+    from googleapiclient.http import build_http
+
+    return {'http': CassetteHttp(cassette, google_auth_httplib2.AuthorizedHttp(creds, http=build_http()))}
+
+
+_blogger_credentials = None
+
+
 def get_blogger_service():
-    """Google Blogger API-এর জন্য মেমোরি থেকে ক্রেডেনশিয়াল লোড করে।"""
+    """Google Blogger API-এর জন্য মেমোরি থেকে ক্রেডেনশিয়াল লোড করে।"""
+    global _blogger_credentials
+    from google.oauth2.credentials import Credentials
+
+    if HTTP_CASSETTE_MODE == 'replay':
+        # রিপ্লেতে সব রেসপন্স ক্যাসেট থেকে আসে, টোকেন বা নেটওয়ার্ক লাগে না
+        print("📼 রিপ্লে মোড: ক্রেডেনশিয়াল ছাড়া ক্যাসেট থেকে Blogger API সার্ভিস তৈরি করা হচ্ছে।")
+        return _build_blogger_from_discovery(None)
+
+    auth_started = time.perf_counter()
     creds = None
+    token_info = None
     
     google_token_json = os.environ.get('GOOGLE_TOKEN')
     google_creds_json = os.environ.get('GOOGLE_CREDENTIALS')
 
     if google_token_json:
         token_info = json.loads(google_token_json)
-        creds = Credentials.from_authorized_user_info(token_info, SCOPES)
+        creds = Credentials.from_authorized_user_info(_load_cached_access_token(token_info), SCOPES)
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
+            from google.auth.transport.requests import Request
+
             creds.refresh(Request())
+            _save_cached_access_token(token_info, creds)
         else:
             if google_creds_json:
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 secret_info = json.loads(google_creds_json)
                 flow = InstalledAppFlow.from_client_config(secret_info, SCOPES)
                 creds = flow.run_local_server(port=0)
+    else:
+        print("⚡ আগের রানের অ্যাক্সেস টোকেন এখনো বৈধ, রিফ্রেশ বাদ দেওয়া হলো।")
+
+    build_started = time.perf_counter()
+    STARTUP_TIMINGS['auth'] = build_started - auth_started
+    _blogger_credentials = creds
+    service = _build_blogger_from_discovery(creds)
+    STARTUP_TIMINGS['build_service'] = time.perf_counter() - build_started
+    return service
 
-    return build('blogger', 'v3', credentials=creds)
+
+def get_blog_services(service, blog_ids):
+    """
+    প্রতিটি ব্লগের জন্য আলাদা সার্ভিস অবজেক্ট (httplib2 থ্রেড-সেফ নয়, আর ব্লগগুলো আলাদা থ্রেডে চলে)।
+    প্রথম ব্লগ মূল সার্ভিসটি পায়; বাকিগুলো একই ক্রেডেনশিয়াল ও ক্যাশ করা discovery থেকে তৈরি হয়।
+    """
+    services = {}
+    for blog_id in blog_ids:
+        services[blog_id] = service if not services else _build_blogger_from_discovery(_blogger_credentials)
+    return services
+
+
+def print_startup_report():
+    """ইমপোর্ট ও সেটআপে কত সময় লেগেছে তা প্রিন্ট করে।"""
+    total = time.perf_counter() - _PROCESS_STARTED
+    parts = ', '.join(f"{name}: {seconds * 1000:.0f} ms" for name, seconds in STARTUP_TIMINGS.items())
+    print(f"⏱️ স্টার্টআপ সময় ({parts}), মোট: {total * 1000:.0f} ms")
 
 # =========================================================
-# 🔄 ধাপ ৩.১: বিদ্যমান পোস্ট টাইটেল সংগ্রহ (সকল)
+# সহায়ক ফাংশন: HTTP রেকর্ড/রিপ্লে ক্যাসেট (পুনরুৎপাদনযোগ্য লোড ও রিগ্রেশন টেস্ট)
 # =========================================================
 
-def get_existing_titles(service, blog_id):
-    """ব্লগ থেকে SCRAPED_POST_TAG যুক্ত পোস্টের বর্তমান টাইটেলগুলির সেট সংগ্রহ করে।"""
-    print("        🔍 ডুপ্লিকেশন চেক: ব্লগের সকল 'অন্যান্য' ট্যাগযুক্ত পোস্ট টাইটেল লোড করা হচ্ছে...")
-    existing_titles = set()
+# শুধু রিপ্লের জন্য দরকারি হেডারগুলো রাখা হয় (কুকি বা অন্য কিছু নয়)
+_CASSETTE_HEADERS = ('content-type', 'location', 'etag', 'last-modified', 'retry-after')
+_INJECTED_API_ERROR = json.dumps({'error': {
+    'code': 429, 'message': 'Injected by replay', 'errors': [{'reason': 'rateLimitExceeded', 'message': 'Injected by replay'}],
+}}).encode('utf-8')
+
+_cassette = None
+_cassette_lock = threading.Lock()
+
+
+class HttpCassette:
+    """
+    রেকর্ড করা HTTP রেসপন্সের zip ফাইল। index.json এ "METHOD URL" অনুযায়ী রেসপন্সের ক্রম
+    (স্ট্যাটাস, দরকারি হেডার, বডির sha1), আর বডিগুলো bodies/<sha1> এন্ট্রিতে deflate করা, একই বডি একবারই।
+    রিপ্লেতে একই কী এর রেসপন্সগুলো ক্রমানুসারে আসে, শেষ হলে শেষটিই বারবার (বেশি ভলিউমে লোড টেস্টের জন্য)।
+    """
+
+    def __init__(self, path, mode, seed=None):
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._interactions = {}
+        self._bodies = {}
+        self._play_counts = {}
+        self._missed = set()
+        self._rng = random.Random(seed)
+        self._archive = None
+        if self.replaying:
+            self._archive = zipfile.ZipFile(path)
+            self._interactions = json.loads(self._archive.read('index.json'))
+            total = sum(len(interactions) for interactions in self._interactions.values())
+            print(f"📼 ক্যাসেট রিপ্লে: {path} ({total} টি রেসপন্স, লেটেন্সি {REPLAY_LATENCY_MS:.0f}+{REPLAY_JITTER_MS:.0f} ms, ত্রুটির হার {REPLAY_ERROR_RATE:.0%})")
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    def record(self, method, url, status, headers, body):
+        """headers: requests এর CaseInsensitiveDict বা httplib2.Response (ছোট হাতের কী)।"""
+        digest = hashlib.sha1(body).hexdigest()
+        kept = {name: headers[name] for name in _CASSETTE_HEADERS if name in headers}
+        with self._lock:
+            self._bodies[digest] = body
+            self._interactions.setdefault(f"{method} {url}", []).append({'status': status, 'headers': kept, 'body': digest})
+        METRICS.inc('cassette_requests_total', outcome='recorded')
+
+    def _body(self, digest):
+        with self._lock:
+            body = self._bodies.get(digest)
+        if body is None:
+            body = self._archive.read(f'bodies/{digest}')
+            with self._lock:
+                self._bodies[digest] = body
+        return body
+
+    def play(self, method, url, api=False):
+        """(স্ট্যাটাস, হেডার, বডি) দেয়; কৃত্রিম লেটেন্সি ও ত্রুটি (API তে 429, ওয়েবে 503) এখানেই যোগ হয়।"""
+        key = f"{method} {url}"
+        with self._lock:
+            delay = (REPLAY_LATENCY_MS + self._rng.uniform(0, REPLAY_JITTER_MS)) / 1000
+            inject_error = self._rng.random() < REPLAY_ERROR_RATE
+            interactions = self._interactions.get(key)
+            interaction = None
+            first_miss = False
+            if interactions:
+                position = self._play_counts.get(key, 0)
+                self._play_counts[key] = position + 1
+                interaction = interactions[min(position, len(interactions) - 1)]
+            elif key not in self._missed:
+                self._missed.add(key)
+                first_miss = True
+
+        if delay > 0:
+            time.sleep(delay)
+        if inject_error:
+            METRICS.inc('cassette_requests_total', outcome='injected_error')
+            if api:
+                return 429, {'content-type': 'application/json'}, _INJECTED_API_ERROR
+            return 503, {}, b''
+        if interaction is None:
+            METRICS.inc('cassette_requests_total', outcome='miss')
+            if first_miss:
+                print(f"        ⚠️ ক্যাসেটে নেই, 404 দেওয়া হলো: {key}")
+            return 404, {}, b''
+        METRICS.inc('cassette_requests_total', outcome='replayed')
+        return interaction['status'], interaction['headers'], self._body(interaction['body'])
+
+    def save(self):
+        """রেকর্ড করা রেসপন্সগুলো অ্যাটমিকভাবে zip ক্যাসেটে লিখে।"""
+        with self._lock:
+            interactions = dict(self._interactions)
+            bodies = dict(self._bodies)
+        if not interactions:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('index.json', json.dumps(interactions, ensure_ascii=False))
+            for digest, body in bodies.items():
+                archive.writestr(f'bodies/{digest}', body)
+        os.replace(tmp_path, self.path)
+        raw_bytes = sum(len(body) for body in bodies.values())
+        print(f"📼 ক্যাসেট সংরক্ষিত: {self.path} ({sum(map(len, interactions.values()))} টি রেসপন্স, "
+              f"{raw_bytes / 1024:.0f} KiB বডি → {os.path.getsize(self.path) / 1024:.0f} KiB)")
+
+
+def get_cassette():
+    """HTTP_CASSETTE_MODE অনুযায়ী প্রসেসের একমাত্র ক্যাসেট; বন্ধ থাকলে None। রেকর্ড মোডে প্রসেস শেষে সংরক্ষিত হয়।"""
+    global _cassette
+    if HTTP_CASSETTE_MODE not in ('record', 'replay'):
+        return None
+    with _cassette_lock:
+        if _cassette is None:
+            _cassette = HttpCassette(HTTP_CASSETTE_PATH, HTTP_CASSETTE_MODE, REPLAY_SEED)
+            if not _cassette.replaying:
+                atexit.register(_cassette.save)
+    return _cassette
+
+
+class CassetteAdapter(HTTPAdapter):
+    """requests ট্রান্সপোর্ট: রেকর্ড মোডে আসল রেসপন্স ক্যাসেটে রাখে, রিপ্লে মোডে নেটওয়ার্কে না গিয়ে ক্যাসেট থেকে দেয়।"""
+
+    def __init__(self, cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        if not self.cassette.replaying:
+            response = super().send(request, **kwargs)
+            self.cassette.record(request.method, request.url, response.status_code, response.headers, response.content)
+            return response
+
+        status, headers, body = self.cassette.play(request.method, request.url)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = HTTP_STATUS_REASONS.get(status, '')
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+class CassetteHttp:
+    """
+    googleapiclient এর জন্য httplib2.Http এর মত অবজেক্ট (শুধু request())। রেকর্ড মোডে আসল
+    অথরাইজড http এ পাঠিয়ে রেসপন্স রাখে; রিপ্লে মোডে ক্রেডেনশিয়াল বা নেটওয়ার্ক লাগে না।
+    """
+
+    def __init__(self, cassette, http=None):
+        self.cassette = cassette
+        self.http = http
+        # টোকেন রিফ্রেশের জন্য googleapiclient এই অ্যাট্রিবিউট দেখে
+        self.credentials = getattr(http, 'credentials', None)
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        if not self.cassette.replaying:
+            response, content = self.http.request(uri, method=method, body=body, headers=headers, **kwargs)
+            self.cassette.record(method, uri, response.status, response, content)
+            return response, content
+
+        import httplib2
+
+        status, response_headers, content = self.cassette.play(method, uri, api=True)
+        return httplib2.Response(dict(response_headers, status=str(status))), content
+
+
+class SequentialBatch:
+    """
+    ক্যাসেট মোডে BatchHttpRequest এর বদলে একই add()/execute() ইন্টারফেসে রিকোয়েস্টগুলো একে একে চালায়;
+    ব্যাচের মাল্টিপার্ট বাউন্ডারি ও Content-ID প্রতি রানে র‍্যান্ডম, তাই সেটা রিপ্লেতে মেলানো যায় না।
+    """
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id=None):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        # BatchHttpRequest এর মত প্রতিটি আইটেমের ত্রুটি (নেটওয়ার্ক বা ক্যাসেট মিস সহ) তার callback এই যায়,
+        # যাতে একটির ব্যর্থতায় বাকিগুলো বাদ না পড়ে এবং সফলগুলো আবার না পাঠানো হয়
+        for request_id, request in self._requests:
+            try:
+                response = request.execute()
+            except Exception as e:
+                self._callback(request_id, None, e)
+                continue
+            self._callback(request_id, response, None)
+
+
+def new_api_batch(service, callback):
+    """সাধারণত Google API ব্যাচ; ক্যাসেট মোডে SequentialBatch।"""
+    if get_cassette() is not None:
+        return SequentialBatch(callback)
+    return service.new_batch_http_request(callback=callback)
+
+# =========================================================
+# সহায়ক ফাংশন: শেয়ার্ড HTTP সেশন ও হোস্ট-ভিত্তিক কনকারেন্সি লিমিট
+# =========================================================
+
+_http_session = None
+_http_session_lock = threading.Lock()
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+_host_next_request_at = {}
+
+
+def get_http_session():
+    """সব রিকোয়েস্টের জন্য একটি keep-alive কানেকশন পুল সহ শেয়ার্ড Session ফেরত দেয়।"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            pool_size = max(SCRAPE_WORKERS, PER_HOST_CONCURRENCY)
+            cassette = get_cassette()
+            if cassette is not None:
+                adapter = CassetteAdapter(cassette, pool_connections=pool_size, pool_maxsize=pool_size)
+            else:
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _http_session = session
+    return _http_session
+
+
+def get_host_semaphore(url):
+    """একই হোস্টে একসাথে সর্বোচ্চ PER_HOST_CONCURRENCY টি রিকোয়েস্ট চলবে।"""
+    host = urlsplit(url).netloc.lower()
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(max(1, PER_HOST_CONCURRENCY))
+        return _host_semaphores[host]
+
+
+def _wait_for_host_turn(host):
+    """PER_HOST_MIN_INTERVAL_SECONDS অনুযায়ী এই হোস্টের পরের রিকোয়েস্টের সময় সংরক্ষণ করে অপেক্ষা করে।"""
+    if PER_HOST_MIN_INTERVAL_SECONDS <= 0:
+        return
+    with _host_semaphores_lock:
+        now = time.monotonic()
+        turn = max(now, _host_next_request_at.get(host, 0.0))
+        _host_next_request_at[host] = turn + PER_HOST_MIN_INTERVAL_SECONDS
+    if turn > now:
+        time.sleep(turn - now)
+        METRICS.inc('http_politeness_wait_seconds_total', turn - now, host=host)
+
+
+def _http_request(method, url, headers=None, timeout=15, **kwargs):
+    """শেয়ার্ড সেশন ও হোস্ট লিমিট মেনে রিকোয়েস্ট পাঠায়; লেটেন্সি ও স্ট্যাটাস মেট্রিক্সে যোগ হয়।"""
+    host = urlsplit(url).netloc.lower()
+    with get_host_semaphore(url):
+        _wait_for_host_turn(host)
+        started = time.perf_counter()
+        try:
+            response = get_http_session().request(method, url, headers=headers, timeout=timeout, **kwargs)
+        except requests.exceptions.RequestException:
+            METRICS.inc('http_requests_total', host=host, status='error')
+            raise
+        finally:
+            METRICS.observe('http_request_seconds', time.perf_counter() - started, host=host)
+    METRICS.inc('http_requests_total', host=host, status=response.status_code)
+    METRICS.inc('http_response_bytes_total', len(response.content), host=host)
+    return response
+
+
+def http_get(url, headers=None, timeout=15):
+    """শেয়ার্ড সেশন ও হোস্ট লিমিট মেনে GET রিকোয়েস্ট পাঠায়।"""
+    return _http_request('GET', url, headers=headers, timeout=timeout)
+
+
+def http_head(url, headers=None, timeout=15):
+    """বডি না নামিয়ে (রিডাইরেক্ট অনুসরণ করে) HEAD রিকোয়েস্ট পাঠায়; একই সেশন ও হোস্ট লিমিট মানে।"""
+    return _http_request('HEAD', url, headers=headers, timeout=timeout, allow_redirects=True)
+
+# =========================================================
+# সহায়ক ফাংশন: ডিস্ক-ভিত্তিক কন্ডিশনাল GET ক্যাশ (ETag / Last-Modified)
+# =========================================================
+
+HttpPage = namedtuple('HttpPage', ['text', 'not_modified'])
+
+
+def _http_cache_paths(url):
+    """URL-এর হ্যাশ থেকে মেটা (.json) ও বডি (.html) ফাইলের পাথ তৈরি করে।"""
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    base = os.path.join(HTTP_CACHE_DIR, key[:2], key)
+    return base + '.json', base + '.html'
+
+
+def _atomic_write(path, data, mode='w'):
+    """অর্ধেক লেখা ফাইল এড়াতে টেম্প ফাইলে লিখে তারপর রিনেম করে।"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    encoding = None if 'b' in mode else 'utf-8'
+    with open(tmp_path, mode, encoding=encoding) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _read_http_cache(url):
+    """ক্যাশে থাকা মেটা ও বডি ফেরত দেয়; না থাকলে বা নষ্ট হলে None।"""
+    meta_path, body_path = _http_cache_paths(url)
     try:
-        # শুধুমাত্র নির্দিষ্ট ট্যাগ যুক্ত পোস্টগুলি ফিল্টার করা
-        response = service.posts().list(
-            blogId=blog_id, 
-            labels=SCRAPED_POST_TAG, 
-            fetchBodies=False, 
-            maxResults=500 
-        ).execute()
-        
-        posts = response.get('items', [])
-        for post in posts:
-            existing_titles.add(post['title'])
-            
-        # 🌟 টার্মিনালে সর্বশেষ টাইটেল প্রিন্ট করা 
-        latest_title = posts[0].get('title', 'কোনো পোস্ট নেই') if posts else 'কোনো পোস্ট নেই'
-        print(f"        ✅ ব্লগে '{SCRAPED_POST_TAG}' ট্যাগযুক্ত বিদ্যমান পোস্ট পাওয়া গেছে: {len(existing_titles)} টি।")
-        print(f"        ℹ️ আপনার ব্লগের সর্বশেষ পোস্টের টাইটেল (চেকের জন্য): **{latest_title}**")
-        
-    except Exception as e:
-        print(f"        ❌ বিদ্যমান পোস্ট লোড করার সময় ত্রুটি: {e}")
-        
-    return existing_titles
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(body_path, encoding='utf-8') as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    if meta.get('url') != url:
+        return None, None
+    return meta, body
+
+
+def _write_http_cache(url, response):
+    """ভ্যালিডেটর (ETag/Last-Modified) থাকলে রেসপন্স ক্যাশে সংরক্ষণ করে।"""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+
+    meta_path, body_path = _http_cache_paths(url)
+    meta = {'url': url, 'etag': etag, 'last_modified': last_modified, 'stored_at': time.time()}
+    try:
+        _atomic_write(body_path, response.text)
+        _atomic_write(meta_path, json.dumps(meta))
+    except OSError as e:
+        print(f"        ⚠️ HTTP ক্যাশে লেখা যায়নি: {e}")
+
+
+def fetch_page(url, headers=None, timeout=15):
+    """কন্ডিশনাল GET পাঠায়; 304 হলে ডিস্ক থেকে বডি দেয়। ব্যর্থ হলে RequestException তোলে।"""
+    request_headers = dict(headers or {})
+    meta, cached_body = _read_http_cache(url) if HTTP_CACHE_ENABLED else (None, None)
+
+    if meta:
+        if meta.get('etag'):
+            request_headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            request_headers['If-Modified-Since'] = meta['last_modified']
+
+    response = http_get(url, headers=request_headers, timeout=timeout)
+
+    if meta and response.status_code == 304:
+        # ক্যাশ এন্ট্রি এখনো বৈধ, শুধু সময় আপডেট করা (এভিকশনের জন্য)
+        try:
+            os.utime(_http_cache_paths(url)[0], None)
+        except OSError:
+            pass
+        METRICS.inc('http_cache_total', result='not_modified')
+        return HttpPage(cached_body, True)
+
+    response.raise_for_status()
+    METRICS.inc('http_cache_total', result='changed' if meta else 'miss')
+    if HTTP_CACHE_ENABLED:
+        _write_http_cache(url, response)
+    return HttpPage(response.text, False)
+
+
+def prune_http_cache():
+    """পুরোনো এন্ট্রি মুছে এবং সাইজ লিমিটের বাইরে গেলে সবচেয়ে পুরোনোগুলো মুছে ক্যাশ ছোট রাখে।"""
+    if not HTTP_CACHE_ENABLED or not os.path.isdir(HTTP_CACHE_DIR):
+        return
+
+    now = time.time()
+    max_age_seconds = HTTP_CACHE_MAX_AGE_DAYS * 86400
+    max_bytes = HTTP_CACHE_MAX_MB * 1024 * 1024
+    entries = []
+    removed = 0
+
+    for root, _dirs, files in os.walk(HTTP_CACHE_DIR):
+        for name in files:
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(root, name)
+            body_path = meta_path[:-len('.json')] + '.html'
+            try:
+                last_used = os.path.getmtime(meta_path)
+                size = os.path.getsize(meta_path) + (os.path.getsize(body_path) if os.path.exists(body_path) else 0)
+            except OSError:
+                continue
+            entries.append((last_used, size, meta_path, body_path))
+
+    # সবচেয়ে পুরোনো আগে
+    entries.sort()
+    total_size = sum(entry[1] for entry in entries)
+
+    for last_used, size, meta_path, body_path in entries:
+        if now - last_used <= max_age_seconds and total_size <= max_bytes:
+            continue
+        for path in (meta_path, body_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total_size -= size
+        removed += 1
+
+    if removed:
+        print(f"🧹 HTTP ক্যাশ থেকে {removed} টি পুরোনো এন্ট্রি মুছে ফেলা হয়েছে।")
 
 # =========================================================
-# 🚀 ধাপ ৩: পোস্টের তালিকা সংগ্রহ ও তারিখ ফিল্টারিং
+# সহায়ক ফাংশন: অ্যাডাপটিভ রেট লিমিটার ও কোটা হিসাব
+# =========================================================
+
+class QuotaExceededError(Exception):
+    """দৈনিক API কোটা শেষ হলে তোলা হয়; এরপর আর রিকোয়েস্ট পাঠানো অর্থহীন।"""
+
+
+class AdaptiveRateLimiter:
+    """
+    টোকেন-বাকেট রেট লিমিটার। প্রতিটি সফল কলে হার ধীরে বাড়ে, 429/rateLimitExceeded
+    পেলে হার অর্ধেক হয় এবং Retry-After পর্যন্ত সব কল থেমে থাকে। সাময়িক 5xx এ শুধু বিরতি, হার বদলায় না।
+    """
+
+    def __init__(self, rate_per_minute, min_rate_per_minute, max_rate_per_minute):
+        self.rate_per_minute = rate_per_minute
+        self.min_rate_per_minute = min_rate_per_minute
+        self.max_rate_per_minute = max_rate_per_minute
+        self.quota_units = 0
+        self.calls = {}
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, kind):
+        """থ্রটল বিরতি শেষ হওয়া পর্যন্ত এবং (লেখার কলের জন্য) একটি টোকেন পাওয়া পর্যন্ত অপেক্ষা করে।"""
+        consume = kind in RATE_LIMITED_API_KINDS
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                rate_per_second = self.rate_per_minute / 60
+                self._tokens = min(1.0, self._tokens + (now - self._last_refill) * rate_per_second)
+                self._last_refill = now
+
+                if now >= self._blocked_until and (not consume or self._tokens >= 1):
+                    if consume:
+                        self._tokens -= 1
+                    break
+                wait = self._blocked_until - now
+                if consume:
+                    wait = max(wait, (1 - self._tokens) / rate_per_second)
+            time.sleep(wait)
+            waited += wait
+        if waited:
+            METRICS.inc('rate_limit_wait_seconds_total', waited, kind=kind)
+
+    def on_success(self):
+        with self._lock:
+            self.rate_per_minute = min(self.max_rate_per_minute, self.rate_per_minute + 1)
+
+    def on_throttle(self, retry_after_seconds, slow_down=True):
+        """retry_after_seconds পর্যন্ত সব কল থামায়; slow_down হলে (আসল রেট-লিমিট) হারও অর্ধেক করে।"""
+        with self._lock:
+            if slow_down:
+                self.rate_per_minute = max(self.min_rate_per_minute, self.rate_per_minute / 2)
+                self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after_seconds)
+        if not slow_down:
+            print(f"      ⏳ সাময়িক সার্ভার ত্রুটি: {retry_after_seconds:.1f} সেকেন্ড বিরতি, হার অপরিবর্তিত।")
+            return
+        METRICS.inc('api_throttled_total')
+        print(f"      🐢 রেট লিমিট: {retry_after_seconds:.1f} সেকেন্ড বিরতি, নতুন হার {self.rate_per_minute:.1f}/মিনিট।")
+
+    def record_quota(self, kind, count=1):
+        with self._lock:
+            self.calls[kind] = self.calls.get(kind, 0) + count
+            self.quota_units += API_QUOTA_COSTS.get(kind, 1) * count
+        METRICS.inc('api_quota_units_total', API_QUOTA_COSTS.get(kind, 1) * count, kind=kind)
+
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(blog_id):
+    """প্রতিটি ব্লগের জন্য আলাদা রেট লিমিটার ও কোটা হিসাব রাখে।"""
+    with _rate_limiters_lock:
+        if blog_id not in _rate_limiters:
+            _rate_limiters[blog_id] = AdaptiveRateLimiter(
+                POST_RATE_PER_MINUTE, POST_RATE_MIN_PER_MINUTE, POST_RATE_MAX_PER_MINUTE
+            )
+        return _rate_limiters[blog_id]
+
+
+def _http_error_status(exception):
+    """HttpError থেকে HTTP স্ট্যাটাস কোড বের করে; অন্য ত্রুটিতে None।"""
+    if isinstance(exception, HttpError):
+        return exception.resp.status
+    return None
+
+
+def _http_error_reason(exception):
+    """HttpError এর JSON বডি থেকে প্রথম reason (যেমন rateLimitExceeded) বের করে।"""
+    try:
+        error = json.loads(exception.content.decode('utf-8'))['error']
+        return error['errors'][0]['reason']
+    except (AttributeError, ValueError, KeyError, IndexError, TypeError):
+        return None
+
+
+def _retry_delay_seconds(exception, attempt):
+    """Retry-After হেডার থাকলে সেটি, না হলে জিটারসহ এক্সপোনেনশিয়াল ব্যাকঅফ।"""
+    retry_after = exception.resp.get('retry-after') if isinstance(exception, HttpError) else None
+    try:
+        if retry_after is not None:
+            return float(retry_after) + random.uniform(0, 1)
+    except ValueError:
+        pass
+    return min(60, 2 ** attempt) + random.uniform(0, 1)
+
+
+def is_rate_limit_error(exception):
+    """429 বা rate-limit reason (403 rateLimitExceeded/userRateLimitExceeded) হলে True।"""
+    return (_http_error_status(exception) == 429
+            or _http_error_reason(exception) in ('rateLimitExceeded', 'userRateLimitExceeded'))
+
+
+def classify_api_error(exception, kind=None):
+    """
+    ত্রুটিকে 'quota' (থামতে হবে), 'retry' (আবার চেষ্টা) বা 'fatal' এ ভাগ করে। আইডেমপোটেন্ট নয় এমন
+    কলে (insert) শুধু রেট-লিমিট (429) আবার চেষ্টাযোগ্য, কারণ তখন সার্ভার রিকোয়েস্টটি প্রক্রিয়া করেনি।
+    """
+    reason = _http_error_reason(exception)
+    status = _http_error_status(exception)
+    if reason in ('quotaExceeded', 'dailyLimitExceeded'):
+        return 'quota'
+    if is_rate_limit_error(exception):
+        return 'retry'
+    if status in RETRYABLE_STATUS_CODES and kind not in NON_IDEMPOTENT_API_KINDS:
+        return 'retry'
+    return 'fatal'
+
+
+def execute_api_request(request, blog_id, kind):
+    """রেট লিমিটার মেনে একটি API রিকোয়েস্ট চালায়; থ্রটল হলে ব্যাকঅফ দিয়ে আবার চেষ্টা করে।"""
+    limiter = get_rate_limiter(blog_id)
+
+    for attempt in range(API_MAX_RETRIES + 1):
+        limiter.acquire(kind)
+        started = time.perf_counter()
+        try:
+            response = request.execute()
+            limiter.record_quota(kind)
+            if kind in RATE_LIMITED_API_KINDS:
+                limiter.on_success()
+            METRICS.inc('api_requests_total', kind=kind, outcome='ok')
+            return response
+        except HttpError as e:
+            limiter.record_quota(kind)
+            error_type = classify_api_error(e, kind)
+            METRICS.inc('api_requests_total', kind=kind, outcome=error_type)
+            if error_type == 'quota':
+                raise QuotaExceededError(str(e)) from e
+            if error_type == 'fatal' or attempt == API_MAX_RETRIES:
+                raise
+            limiter.on_throttle(_retry_delay_seconds(e, attempt + 1), slow_down=is_rate_limit_error(e))
+        finally:
+            METRICS.observe('api_request_seconds', time.perf_counter() - started, kind=kind)
+
+# =========================================================
+# সহায়ক ফাংশন: Google API ব্যাচ রিকোয়েস্ট (প্রতি আইটেমে রিট্রাই সহ)
+# =========================================================
+
+def execute_batch_with_retry(service, request_factories, blog_id, kind, batch_size=DELETE_BATCH_SIZE,
+                             ignore_statuses=(), pause_seconds=0):
+    """
+    {request_id: রিকোয়েস্ট তৈরির ফাংশন} কে BatchHttpRequest এ ভাগ করে চালায়।
+    থ্রটল হওয়া আইটেমগুলো Retry-After/ব্যাকঅফ মেনে আবার পাঠানো হয়; কোটা শেষ হলে বাকিগুলো বাদ।
+    (সফল {id: response}, ব্যর্থ {id: exception}) ফেরত দেয়।
+    """
+    limiter = get_rate_limiter(blog_id)
+    succeeded = {}
+    failed = {}
+    pending = list(request_factories)
+    quota_exhausted = False
+
+    for attempt in range(API_MAX_RETRIES + 1):
+        if not pending or quota_exhausted:
+            break
+        if attempt:
+            print(f"      🔁 {len(pending)} টি রিকোয়েস্ট আবার চেষ্টা করা হচ্ছে (চেষ্টা {attempt}/{API_MAX_RETRIES})...")
+
+        retry = []
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            if quota_exhausted:
+                break
+            if start and pause_seconds:
+                time.sleep(pause_seconds)
+                METRICS.inc('rate_limit_wait_seconds_total', pause_seconds, kind=kind)
+            throttle_delays = []
+            rate_limited = []
+
+            def callback(request_id, response, exception):
+                nonlocal quota_exhausted
+                if exception is None or _http_error_status(exception) in ignore_statuses:
+                    succeeded[request_id] = response
+                    failed.pop(request_id, None)
+                    METRICS.inc('api_requests_total', kind=kind, outcome='ok' if exception is None else 'ignored')
+                    return
+
+                error_type = classify_api_error(exception, kind)
+                METRICS.inc('api_requests_total', kind=kind, outcome=error_type)
+                if error_type == 'quota':
+                    quota_exhausted = True
+                    failed[request_id] = QuotaExceededError(str(exception))
+                elif error_type == 'retry':
+                    retry.append(request_id)
+                    failed[request_id] = exception
+                    throttle_delays.append(_retry_delay_seconds(exception, attempt + 1))
+                    rate_limited.append(is_rate_limit_error(exception))
+                else:
+                    failed[request_id] = exception
+
+            batch = new_api_batch(service, callback)
+            for request_id in chunk:
+                limiter.acquire(kind)
+                batch.add(request_factories[request_id](), request_id=request_id)
+            started = time.perf_counter()
+            try:
+                batch.execute()
+            except Exception as e:
+                METRICS.inc('api_batch_failures_total', kind=kind)
+                # পুরো ব্যাচ ব্যর্থ হলে এর বাকি আইটেম আবার চেষ্টা করা হবে; insert শুধু রেট-লিমিটে,
+                # নইলে সার্ভারে আগেই তৈরি হওয়া পোস্ট দ্বিতীয়বার তৈরি হতে পারে
+                resend = kind not in NON_IDEMPOTENT_API_KINDS or classify_api_error(e, kind) == 'retry'
+                for request_id in chunk:
+                    if request_id not in succeeded and request_id not in retry:
+                        failed[request_id] = e
+                        if resend:
+                            retry.append(request_id)
+                if resend:
+                    throttle_delays.append(_retry_delay_seconds(e, attempt + 1))
+                    rate_limited.append(is_rate_limit_error(e))
+            finally:
+                # ব্যর্থ ব্যাচও কোটা খরচ করে থাকতে পারে, তাই হিসাব সবসময় হয়
+                limiter.record_quota(kind, len(chunk))
+            METRICS.observe('api_batch_seconds', time.perf_counter() - started, kind=kind)
+
+            if throttle_delays:
+                # শুধু আসল রেট-লিমিটে হার কমে; সাময়িক 5xx এ শুধু ব্যাকঅফ বিরতি
+                limiter.on_throttle(max(throttle_delays), slow_down=any(rate_limited))
+            elif kind in RATE_LIMITED_API_KINDS:
+                limiter.on_success()
+
+        pending = [] if quota_exhausted else retry
+
+    return succeeded, failed
+
 # =========================================================
+# সহায়ক ফাংশন: টাইটেল/URL নরমালাইজেশন ও near-duplicate ইনডেক্স
+# =========================================================
+
+_BENGALI_DIGITS = str.maketrans('০১২৩৪৫৬৭৮৯', '0123456789')
+# বাংলা ব্লক ও ASCII অক্ষর/অঙ্ক ছাড়া সব (বিরাম চিহ্ন, দাঁড়ি, ইমোজি) স্পেস হয়ে যায়
+_TITLE_SEPARATOR_RE = re.compile(r'[^0-9a-z\u0980-\u09ff]+')
+_TITLE_NUMBER_RE = re.compile(r'\d+')
+# একই বিজ্ঞপ্তির পুনঃপ্রকাশে যোগ হওয়া শব্দ, তুলনার সময় বাদ
+_TITLE_NOISE_WORDS = {
+    unicodedata.normalize('NFC', word)
+    for word in ('সংশোধিত', 'সংশোধনী', 'আপডেট', 'updated', 'update', 'revised', 'corrigendum')
+}
+# একই বিজ্ঞপ্তির ফলো-আপ পোস্ট (ফলাফল, প্রবেশপত্র, পরীক্ষা...) আলাদা পোস্ট; শব্দের শুরু মিললেই (বাংলা বিভক্তি সহ)
+_TITLE_POST_TYPE_WORDS = {
+    unicodedata.normalize('NFC', word): kind for kind, words in (
+        ('result', ('result', 'ফলাফল')),
+        ('admit', ('admit', 'প্রবেশপত্র')),
+        ('exam', ('exam', 'পরীক্ষা', 'written', 'লিখিত', 'mcq', 'preliminary', 'প্রিলিমিনারি')),
+        ('viva', ('viva', 'ভাইভা', 'interview', 'সাক্ষাৎকার')),
+        ('seat', ('seat', 'আসন')),
+        ('syllabus', ('syllabus', 'সিলেবাস')),
+    ) for word in words
+}
+_TITLE_POST_TYPE_RE = re.compile('(?:^| )(' + '|'.join(map(re.escape, _TITLE_POST_TYPE_WORDS)) + ')')
+_URL_TRACKING_PARAMS = {'m', 'fbclid', 'gclid'}
+
+MINHASH_BINS = 32
+MINHASH_ROWS_PER_BAND = 4
+TITLE_SHINGLE_SIZE = 3
+
+
+def normalize_title(title):
+    """তুলনার জন্য টাইটেল: NFC, ছোট হাতের, বাংলা অঙ্ক → ASCII, বিরাম চিহ্ন ও 'সংশোধিত' জাতীয় শব্দ বাদ।"""
+    text = unicodedata.normalize('NFC', title or '').casefold().translate(_BENGALI_DIGITS)
+    return ' '.join(word for word in _TITLE_SEPARATOR_RE.split(text) if word and word not in _TITLE_NOISE_WORDS)
+
+
+def title_post_types(normalized):
+    """নরমালাইজড টাইটেলে থাকা পোস্টের ধরন (result, admit, exam...) এর সাজানো tuple।"""
+    return tuple(sorted({_TITLE_POST_TYPE_WORDS[word] for word in _TITLE_POST_TYPE_RE.findall(normalized)}))
+
+
+def canonical_source_url(url):
+    """
+    একই পোস্টের বিভিন্ন রূপ (http/https, www, ?m=1, utm_*, #fragment, blogspot এর দেশভিত্তিক
+    ডোমেইন) কে একটি কী তে আনে।
+    """
+    if not url:
+        return url
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if '.blogspot.' in host:
+        host = host.split('.blogspot.', 1)[0] + '.blogspot.com'
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in _URL_TRACKING_PARAMS and not key.startswith('utm_')
+    ])
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit(('https' if parts.scheme in ('http', 'https') else parts.scheme, host, path, query, ''))
+
+
+def _title_shingles(normalized):
+    if len(normalized) <= TITLE_SHINGLE_SIZE:
+        return {normalized}
+    return {normalized[i:i + TITLE_SHINGLE_SIZE] for i in range(len(normalized) - TITLE_SHINGLE_SIZE + 1)}
+
+
+def _minhash_band_keys(shingles):
+    """
+    one-permutation MinHash: প্রতিটি shingle একবার হ্যাশ করে MINHASH_BINS টি বিনে ভাগ,
+    প্রতিটি বিনের সর্বনিম্ন মান সিগনেচার। খালি বিন পাশের বিন থেকে পূরণ (densification)।
+    সিগনেচারকে ব্যান্ডে ভাগ করে LSH বাকেট কী ফেরত দেয়।
+    """
+    bins = [None] * MINHASH_BINS
+    for shingle in shingles:
+        value = zlib.crc32(shingle.encode('utf-8'))
+        slot = value % MINHASH_BINS
+        value //= MINHASH_BINS
+        if bins[slot] is None or value < bins[slot]:
+            bins[slot] = value
+
+    if None in bins:
+        source = bins[:]
+        for i in range(MINHASH_BINS):
+            if source[i] is None:
+                distance = 1
+                while source[(i + distance) % MINHASH_BINS] is None:
+                    distance += 1
+                bins[i] = source[(i + distance) % MINHASH_BINS] + distance * 0x9E3779B1
+
+    return [
+        (band,) + tuple(bins[band * MINHASH_ROWS_PER_BAND:(band + 1) * MINHASH_ROWS_PER_BAND])
+        for band in range(MINHASH_BINS // MINHASH_ROWS_PER_BAND)
+    ]
+
+
+class NearDuplicateIndex:
+    """
+    নরমালাইজড টাইটেলের MinHash LSH ইনডেক্স। লুকআপে শুধু একই বাকেটের প্রার্থীদের সাথে
+    আসল Jaccard মিল মাপা হয়, তাই হাজার হাজার পোস্টেও সব জোড়া তুলনা (O(n²)) লাগে না।
+    টাইটেলের সংখ্যাগুলো (সাল, বিজ্ঞপ্তি নম্বর) বা পোস্টের ধরন (ফলাফল, প্রবেশপত্র...) হুবহু না মিললে
+    ডুপ্লিকেট ধরা হয় না, কারণ একটি শব্দ যোগ হলেও Jaccard মিল সীমার উপরে থাকতে পারে।
+    """
+
+    def __init__(self, threshold=NEAR_DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        # বাকেট: {ব্যান্ড হ্যাশ: key, বা একাধিক হলে key এর set}; বেশিরভাগ বাকেটে একটিই পোস্ট থাকে
+        self._buckets = {}
+        self._entries = {}
+
+    @staticmethod
+    def _bucket_keys(normalized):
+        # সংখ্যা ও পোস্টের ধরন বাকেট কী এর অংশ, তাই ভিন্ন সাল/নম্বর বা বিজ্ঞপ্তি বনাম ফলাফল প্রার্থীই হয় না
+        exact_parts = (tuple(_TITLE_NUMBER_RE.findall(normalized)), title_post_types(normalized))
+        return tuple(hash((exact_parts, band_key)) for band_key in _minhash_band_keys(_title_shingles(normalized)))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, key, title):
+        self.remove(key)
+        normalized = normalize_title(title)
+        bucket_keys = self._bucket_keys(normalized) if normalized else ()
+        self._entries[key] = (normalized, bucket_keys)
+        for bucket_key in bucket_keys:
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                self._buckets[bucket_key] = key
+            elif isinstance(bucket, set):
+                bucket.add(key)
+            else:
+                self._buckets[bucket_key] = {bucket, key}
+
+    def remove(self, key):
+        entry = self._entries.pop(key, None)
+        if not entry:
+            return
+        for bucket_key in entry[1]:
+            bucket = self._buckets.get(bucket_key)
+            if isinstance(bucket, set):
+                bucket.discard(key)
+                if len(bucket) == 1:
+                    self._buckets[bucket_key] = bucket.pop()
+            elif bucket == key:
+                del self._buckets[bucket_key]
+
+    def find(self, title):
+        """সবচেয়ে মিলে যাওয়া (key, মিল) বা None ফেরত দেয়।"""
+        normalized = normalize_title(title)
+        if self.threshold >= 1 or not self._entries or not normalized:
+            return None
+        shingles = _title_shingles(normalized)
+
+        candidates = set()
+        for bucket_key in self._bucket_keys(normalized):
+            bucket = self._buckets.get(bucket_key)
+            if isinstance(bucket, set):
+                candidates.update(bucket)
+            elif bucket is not None:
+                candidates.add(bucket)
+
+        best = None
+        for key in candidates:
+            other_normalized = self._entries[key][0]
+            other_shingles = _title_shingles(other_normalized)
+            similarity = len(shingles & other_shingles) / len(shingles | other_shingles)
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+# =========================================================
+# 🔄 ধাপ ৩.১: বিদ্যমান পোস্ট টাইটেল সংগ্রহ (সকল)
+# =========================================================
+
+def parse_web_end_date(labels):
+    """লেবেল তালিকা থেকে WebEndDate ট্যাগ পার্স করে date ফেরত দেয়; না পেলে None।"""
+    for label in labels or []:
+        if label.startswith(WEB_END_DATE_TAG_PREFIX):
+            date_part = label[len(WEB_END_DATE_TAG_PREFIX):]
+            try:
+                return datetime.strptime(date_part, '%d-%m-%Y').date()
+            except ValueError:
+                print(f"      ⚠️ ট্যাগ ডেট পার্সিং ব্যর্থ: '{label}'")
+    return None
+
+
+def _parse_rfc3339(value):
+    """Blogger-এর RFC3339 টাইমস্ট্যাম্পকে timezone-সহ datetime এ রূপান্তর করে।"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _post_updated_timestamp(post):
+    updated_dt = _parse_rfc3339(post.get('updated'))
+    return updated_dt.timestamp() if updated_dt else 0
+
+
+_post_index_cache = {}
+# শুধু মেমোরিতে তৈরি লুকআপ, ডিস্কে সংরক্ষিত হয় না
+_POST_INDEX_LOOKUP_KEYS = ('by_title', 'by_url', 'by_normalized_title', 'near_duplicates')
+
+
+def _post_index_path(blog_id):
+    return os.path.join(STATE_DIR, f'post_index_{blog_id}.json')
+
+
+def _add_index_lookups(index, post_id, post):
+    index['by_title'][post['title']] = post_id
+    normalized = normalize_title(post['title'])
+    if normalized:
+        index['by_normalized_title'][normalized] = post_id
+    index['near_duplicates'].add(post_id, post['title'])
+    if post.get('source_url'):
+        index['by_url'][canonical_source_url(post['source_url'])] = post_id
+
+
+def _remove_index_lookups(index, post_id, post):
+    for lookup, key in (('by_title', post['title']), ('by_normalized_title', normalize_title(post['title']))):
+        if index[lookup].get(key) == post_id:
+            del index[lookup][key]
+    index['near_duplicates'].remove(post_id)
+    if post.get('source_url'):
+        url_key = canonical_source_url(post['source_url'])
+        if index['by_url'].get(url_key) == post_id:
+            del index['by_url'][url_key]
+
+
+def _rebuild_post_index_lookups(index):
+    """টাইটেল, নরমালাইজড টাইটেল ও ক্যানোনিকাল সোর্স URL লুকআপ এবং near-duplicate ইনডেক্স তৈরি করে।"""
+    index['by_title'] = {}
+    index['by_url'] = {}
+    index['by_normalized_title'] = {}
+    index['near_duplicates'] = NearDuplicateIndex()
+    for post_id, post in index['posts'].items():
+        _add_index_lookups(index, post_id, post)
+
+
+def _upsert_index_post(index, post_id, title, labels, updated, source_url=None, content_hash=None, source_hash=None):
+    """ইনডেক্সে একটি পোস্ট যোগ বা আপডেট করে (আগের source_url ও হ্যাশগুলো হারায় না)।"""
+    previous = index['posts'].get(post_id)
+    if previous:
+        _remove_index_lookups(index, post_id, previous)
+
+    previous = previous or {}
+    web_end_date = parse_web_end_date(labels)
+    post = {
+        'title': title,
+        'labels': labels,
+        'updated': updated,
+        'web_end_date': web_end_date.isoformat() if web_end_date else None,
+        'source_url': source_url or previous.get('source_url'),
+        # এই স্ক্রিপ্টের রেন্ডার করা কন্টেন্ট ও সোর্সের হ্যাশ (ইন-প্লেস আপডেটের জন্য)
+        'content_hash': content_hash or previous.get('content_hash'),
+        'source_hash': source_hash or previous.get('source_hash'),
+        # শেষ কবে সোর্স পেজ এনে আপডেট যাচাই হয়েছিল (ISO সময়)
+        'checked_at': previous.get('checked_at'),
+    }
+    index['posts'][post_id] = post
+    _add_index_lookups(index, post_id, post)
+
+
+def load_post_index(blog_id):
+    """ডিস্ক থেকে পোস্ট ইনডেক্স লোড করে; ব্লগ বা ট্যাগ না মিললে খালি ইনডেক্স দেয়।"""
+    index = None
+    try:
+        with open(_post_index_path(blog_id), encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if not index or index.get('blog_id') != blog_id or index.get('label') != SCRAPED_POST_TAG:
+        index = {'blog_id': blog_id, 'label': SCRAPED_POST_TAG, 'watermark': None, 'full_synced_at': 0, 'posts': {}}
+
+    _rebuild_post_index_lookups(index)
+    return index
+
+
+def save_post_index(index):
+    """লুকআপ ডিকশনারি বাদ দিয়ে ইনডেক্স ডিস্কে সংরক্ষণ করে।"""
+    data = {key: value for key, value in index.items() if key not in _POST_INDEX_LOOKUP_KEYS}
+    try:
+        _atomic_write(_post_index_path(index['blog_id']), json.dumps(data, ensure_ascii=False))
+    except OSError as e:
+        print(f"        ⚠️ পোস্ট ইনডেক্স সংরক্ষণ করা যায়নি: {e}")
+
+
+@METRICS.stage('post_index_sync')
+def sync_post_index(service, blog_id, index):
+    """
+    updated ক্রমে পেজিনেশন করে শুধুমাত্র শেষ সিঙ্কের পর পরিবর্তিত পোস্টগুলো আনে।
+    নির্দিষ্ট দিন পরপর পুরো সিঙ্ক করে ব্লগ থেকে হাতে মোছা পোস্টগুলোও ইনডেক্স থেকে বাদ দেয়।
+    """
+    full_sync = (
+        not index['posts']
+        or not index.get('watermark')
+        or time.time() - index.get('full_synced_at', 0) > POST_INDEX_FULL_SYNC_DAYS * 86400
+    )
+    watermark = None if full_sync else _parse_rfc3339(index['watermark'])
+    newest_updated = index.get('watermark')
+    seen_ids = set()
+    changed = 0
+    page_token = None
+
+    while True:
+        request_kwargs = {
+            'blogId': blog_id,
+            'labels': SCRAPED_POST_TAG,
+            'fetchBodies': False,
+            'maxResults': POST_INDEX_PAGE_SIZE if full_sync else POST_INDEX_INCREMENTAL_PAGE_SIZE,
+            'orderBy': 'UPDATED',
+            'fields': POST_INDEX_LIST_FIELDS,
+        }
+        if page_token:
+            request_kwargs['pageToken'] = page_token
+
+        response = execute_api_request(service.posts().list(**request_kwargs), blog_id, 'list')
+        reached_watermark = False
+
+        for post in response.get('items', []):
+            updated = post.get('updated') or post.get('published')
+            updated_dt = _parse_rfc3339(updated)
+
+            # updated ক্রমে আসে, তাই watermark এর আগের পোস্ট পেলেই বাকিগুলো অপরিবর্তিত
+            if watermark and updated_dt and updated_dt < watermark:
+                reached_watermark = True
+                break
+
+            seen_ids.add(post['id'])
+            _upsert_index_post(index, post['id'], post['title'], post.get('labels', []), updated)
+            changed += 1
+
+            newest_dt = _parse_rfc3339(newest_updated)
+            if updated_dt and (newest_dt is None or updated_dt > newest_dt):
+                newest_updated = updated
+
+        page_token = response.get('nextPageToken')
+        if reached_watermark or not page_token:
+            break
+
+    if full_sync:
+        for post_id in [post_id for post_id in index['posts'] if post_id not in seen_ids]:
+            del index['posts'][post_id]
+        _rebuild_post_index_lookups(index)
+        index['full_synced_at'] = time.time()
+
+    index['watermark'] = newest_updated
+    sync_type = 'পূর্ণ' if full_sync else 'ইনক্রিমেন্টাল'
+    print(f"        🔄 পোস্ট ইনডেক্স {sync_type} সিঙ্ক সম্পন্ন: {changed} টি পোস্ট পরিবর্তিত/নতুন, মোট {len(index['posts'])} টি।")
+
+
+def get_post_index(service, blog_id):
+    """প্রসেসে একবার লোড ও সিঙ্ক করা পোস্ট ইনডেক্স ফেরত দেয়।"""
+    if blog_id in _post_index_cache:
+        return _post_index_cache[blog_id]
+
+    print(f"        🔍 ডুপ্লিকেশন চেক: ব্লগের '{SCRAPED_POST_TAG}' ট্যাগযুক্ত পোস্টের লোকাল ইনডেক্স সিঙ্ক করা হচ্ছে...")
+    index = load_post_index(blog_id)
+    try:
+        sync_post_index(service, blog_id, index)
+        save_post_index(index)
+    except Exception as e:
+        print(f"        ❌ বিদ্যমান পোস্ট লোড করার সময় ত্রুটি: {e}")
+
+    latest = max(index['posts'].values(), key=_post_updated_timestamp, default=None)
+    latest_title = latest['title'] if latest else 'কোনো পোস্ট নেই'
+    print(f"        ✅ ব্লগে '{SCRAPED_POST_TAG}' ট্যাগযুক্ত বিদ্যমান পোস্ট পাওয়া গেছে: {len(index['posts'])} টি।")
+    print(f"        ℹ️ আপনার ব্লগের সর্বশেষ পোস্টের টাইটেল (চেকের জন্য): **{latest_title}**")
+
+    _post_index_cache[blog_id] = index
+    return index
+
+
+def record_published_post(blog_id, inserted_post, source_url, content_hash=None, source_hash=None):
+    """প্রকাশিত বা আপডেট হওয়া পোস্ট সোর্স URL ও হ্যাশ সহ লোকাল ইনডেক্সে যোগ করে।"""
+    index = _post_index_cache.get(blog_id)
+    if index is None:
+        return
+    _upsert_index_post(
+        index, inserted_post['id'], inserted_post['title'],
+        inserted_post.get('labels', []), inserted_post.get('updated'), source_url,
+        content_hash, source_hash
+    )
+
+
+def remove_index_posts(index, post_ids):
+    """ডিলিট হওয়া পোস্টগুলো ইনডেক্স থেকে বাদ দেয়।"""
+    for post_id in post_ids:
+        post = index['posts'].pop(post_id, None)
+        if post:
+            _remove_index_lookups(index, post_id, post)
+
+
+def find_duplicate_post(index, title, source_url, near=True):
+    """
+    ইনডেক্সে একই পোস্ট খোঁজে: সোর্স URL, হুবহু টাইটেল, নরমালাইজড টাইটেল, তারপর (near=True হলে)
+    প্রায়-একই টাইটেল। (post_id, কারণ) বা None ফেরত দেয়।
+    """
+    if source_url and canonical_source_url(source_url) in index['by_url']:
+        return index['by_url'][canonical_source_url(source_url)], 'source_url'
+    if title in index['by_title']:
+        return index['by_title'][title], 'title'
+    normalized = normalize_title(title)
+    if normalized and normalized in index['by_normalized_title']:
+        return index['by_normalized_title'][normalized], 'normalized_title'
+    if near:
+        match = index['near_duplicates'].find(title)
+        if match:
+            return match[0], f"near_duplicate {match[1]:.2f}"
+    return None
+
+
+def refresh_post_index(service, blog_id):
+    """
+    মেমোরিতে থাকা ইনডেক্স ইনক্রিমেন্টালি সিঙ্ক করে (ডেমনের প্রতিটি চক্রে, যাতে হাতে মোছা বা
+    এডিট করা পোস্টও ধরা পড়ে)। ইনডেক্স এখনো লোড না হলে সাধারণভাবে লোড করে।
+    """
+    index = _post_index_cache.get(blog_id)
+    if index is None:
+        return get_post_index(service, blog_id)
+    try:
+        sync_post_index(service, blog_id, index)
+        save_post_index(index)
+    except QuotaExceededError:
+        raise
+    except Exception as e:
+        print(f"        ⚠️ পোস্ট ইনডেক্স রিফ্রেশ ব্যর্থ, আগের ইনডেক্স ব্যবহার করা হচ্ছে: {e}")
+    return index
+
+
+def load_blog_indexes(blog_services, refresh=False):
+    """সব ব্লগের পোস্ট ইনডেক্স একসাথে লোড (বা refresh=True হলে ইনক্রিমেন্টাল রিফ্রেশ) করে।"""
+    load = refresh_post_index if refresh else get_post_index
+    with ThreadPoolExecutor(max_workers=max(1, len(blog_services)), thread_name_prefix='blog-index') as executor:
+        futures = {blog_id: executor.submit(load, service, blog_id) for blog_id, service in blog_services.items()}
+    return {blog_id: future.result() for blog_id, future in futures.items()}
+
+
+def get_existing_titles(service, blog_id):
+    """ব্লগ থেকে SCRAPED_POST_TAG যুক্ত পোস্টের বর্তমান টাইটেলগুলির সেট সংগ্রহ করে।"""
+    return set(get_post_index(service, blog_id)['by_title'])
+
+# =========================================================
+# সহায়ক ফাংশন: দ্রুত ডেডলাইন তারিখ পার্সার (dateparser শুধু ফলব্যাক)
+# =========================================================
+
+# সাইটের ফরম্যাট: "30 Dec 2026", "30 December 2026", "৩০ ডিসেম্বর ২০২৬" (মাসের নাম কমপক্ষে দুই অক্ষর: "মে")
+_DEADLINE_TEXT_RE = re.compile(
+    r'(?:Deadline|সময়সীমা)(?:[:\s]+)?\s*(\d{1,2}\s+[A-Za-z\u0980-\u09E5\u09F0-\u09FF]{2,}\.?,?\s+\d{4})',
+    re.IGNORECASE
+)
+_DEADLINE_DATE_RE = re.compile(
+    r'^\s*(\d{1,2})(?:st|nd|rd|th)?[\s\-/]+([A-Za-z\u0980-\u09E5\u09F0-\u09FF]+)\.?,?[\s\-/]+(\d{4})\s*$',
+    re.IGNORECASE
+)
+
+_MONTH_NAMES = {
+    1: ('january', 'jan', 'জানুয়ারি', 'জানুয়ারী'),
+    2: ('february', 'feb', 'ফেব্রুয়ারি', 'ফেব্রুয়ারী'),
+    3: ('march', 'mar', 'মার্চ'),
+    4: ('april', 'apr', 'এপ্রিল'),
+    5: ('may', 'মে'),
+    6: ('june', 'jun', 'জুন'),
+    7: ('july', 'jul', 'জুলাই'),
+    8: ('august', 'aug', 'আগস্ট', 'আগষ্ট'),
+    9: ('september', 'sep', 'sept', 'সেপ্টেম্বর'),
+    10: ('october', 'oct', 'অক্টোবর'),
+    11: ('november', 'nov', 'নভেম্বর'),
+    12: ('december', 'dec', 'ডিসেম্বর'),
+}
+# 'য়' দুইভাবে লেখা যায় (একক কোডপয়েন্ট বা য + নুক্তা), তাই NFC করে তুলনা করা হয়
+_MONTH_LOOKUP = {
+    unicodedata.normalize('NFC', name): month
+    for month, names in _MONTH_NAMES.items()
+    for name in names
+}
+
+
+@lru_cache(maxsize=1024)
+def _dateparser_parse_cached(date_str):
+    """অপরিচিত ফরম্যাটের জন্য dateparser; প্রথম প্রয়োজনে ইমপোর্ট ও ফলাফল মেমোইজ করা হয়।"""
+    import dateparser
+    return dateparser.parse(date_str, languages=['en', 'bn'])
+
+
+def parse_deadline_date(date_str):
+    """পরিচিত ফরম্যাট টেবিল দিয়ে পার্স করে; না মিললে dateparser ফলব্যাক। datetime বা None ফেরত দেয়।"""
+    match = _DEADLINE_DATE_RE.match(date_str)
+    if match:
+        month = _MONTH_LOOKUP.get(unicodedata.normalize('NFC', match.group(2)).lower())
+        if month:
+            try:
+                # int() বাংলা অঙ্কও (০-৯) সরাসরি বোঝে
+                return datetime(int(match.group(3)), month, int(match.group(1)))
+            except ValueError:
+                pass
+    return _dateparser_parse_cached(date_str)
+
+# =========================================================
+# সহায়ক ফাংশন: HTML এক্সট্র্যাকশন ইঞ্জিন (নেটওয়ার্ক ছাড়া, শুধু পার্সিং)
+# =========================================================
+
+_POST_LINK_HREF_RE = re.compile(r'/(\d{4})/(\d{2})/')
+_OLDER_LINK_TAG_RE = re.compile(r'<a\b[^>]*\bblog-pager-older-link\b[^>]*>', re.IGNORECASE)
+_HREF_ATTR_RE = re.compile(r'\bhref\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+_DEADLINE_KEYWORD_RE = re.compile(r'deadline|সময়সীমা', re.IGNORECASE)
+_APPLY_RE = re.compile(r'apply', re.IGNORECASE)
+# পার্সের সময় class অ্যাট্রিবিউট পুরো স্ট্রিং হিসেবে আসে, তাই শব্দ-সীমা দিয়ে মেলানো
+_POST_CONTAINER_CLASS_RE = re.compile(r'(?:^|\s)(?:post-body|entry-content|post-labels|post-footer)(?:\s|$)')
+
+_listing_strainer = None
+_post_strainer = None
+
+
+def _get_strainers():
+    """bs4 লেজি ইমপোর্ট হওয়ায় SoupStrainer গুলো প্রথম ব্যবহারে তৈরি হয়।"""
+    global _listing_strainer, _post_strainer
+    if _listing_strainer is None:
+        from bs4 import SoupStrainer
+
+        # আর্কাইভ পেজে শুধু পোস্ট লিংক (<a href=".../yyyy/mm/...">) এর সাবট্রি পার্স করা হয়
+        _listing_strainer = SoupStrainer('a', href=_POST_LINK_HREF_RE)
+        # পোস্ট পেজে শুধু বডি ও লেবেল কন্টেইনার পার্স করা হয়
+        _post_strainer = SoupStrainer(['div', 'span'], class_=_POST_CONTAINER_CLASS_RE)
+    return _listing_strainer, _post_strainer
+
+
+def _empty_media_data():
+    return {'images': [], 'download_links': [], 'labels': [], 'application_link': None, 'application_text': None}
+
+
+def extract_listing_entries(html):
+    """আর্কাইভ পেজের HTML থেকে (title, url, deadline_text) এন্ট্রিগুলো বের করে।"""
+    from bs4 import BeautifulSoup
+
+    listing_strainer, _ = _get_strainers()
+    soup = BeautifulSoup(html, 'lxml', parse_only=listing_strainer)
+    entries = []
+
+    for a_tag in soup.find_all('a'):
+        post_url = a_tag.get('href')
+        r_snippetized_div = a_tag.find('div', class_='r-snippetized')
+        if not r_snippetized_div:
+            continue
+
+        snippet_body_tag = r_snippetized_div.find('div', class_='snippet-body')
+        deadline_text = snippet_body_tag.text.strip() if snippet_body_tag else ""
+
+        # এই ট্রি আর ব্যবহার হয় না, তাই কপি না করে snippet-body সরিয়ে বাকি টেক্সটই শিরোনাম
+        if snippet_body_tag:
+            snippet_body_tag.extract()
+        title = r_snippetized_div.text.strip()
+
+        if 'blogspot.com/' in post_url and len(title) > 5:
+            entries.append({'title': title, 'url': post_url, 'deadline_text': deadline_text})
+
+    return entries
+
+
+def extract_older_page_url(html):
+    """Blogger-এর "Older posts" (updated-max) লিংক রেজেক্স দিয়ে বের করে; না থাকলে None।"""
+    tag_match = _OLDER_LINK_TAG_RE.search(html)
+    if not tag_match:
+        return None
+    href_match = _HREF_ATTR_RE.search(tag_match.group(0))
+    return html_lib.unescape(href_match.group(1)) if href_match else None
+
+
+def classify_listing_entry(entry, today):
+    """
+    এন্ট্রিকে ডেডলাইন বা ফলাফল পোস্ট হিসেবে চিহ্নিত করে; মেয়াদোত্তীর্ণ বা অন্য ধরনের
+    পোস্ট হলে None ফেরত দেয়।
+    """
+    title = entry['title']
+    deadline_text = entry['deadline_text']
+
+    # A. শুধুমাত্র ডেডলাইন পোস্টের ডেট চেক করা হবে
+    if _DEADLINE_KEYWORD_RE.search(deadline_text):
+        # 🎯 ডেডলাইন ডেট এক্সট্র্যাক্ট করা
+        match = _DEADLINE_TEXT_RE.search(deadline_text)
+        if not match:
+            print(f"        ⚠️ ডেডলাইন টেক্সটে তারিখ পাওয়া যায়নি: {title} বাদ দেওয়া হলো। ({deadline_text[:60]})")
+            return None
+
+        # দ্রুত পার্সার (বাংলা মাস ও অঙ্ক সহ), অপরিচিত ফরম্যাটে dateparser
+        with METRICS.stage('deadline_parse'):
+            parsed_date = parse_deadline_date(match.group(1))
+        if not parsed_date:
+            print(f"        ⚠️ ডেট পার্সে ব্যর্থ: {title} বাদ দেওয়া হলো।")
+            return None
+
+        post_date = parsed_date.date()
+        # 🛑 ফিল্টারিং: ডেডলাইন আজকের বা তার পরের দিন হতে হবে
+        if post_date < today:
+            print(f"        ❌ ডেট ফিল্টার: {title} বাদ দেওয়া হলো। (ডেডলাইন: {post_date})")
+            return None
+
+        return dict(entry, type='deadline', parsed_date=parsed_date)
+
+    # B. ফলাফল পোস্ট
+    if 'চূড়ান্ত ফলাফল' in deadline_text:
+        return dict(entry, type='result', parsed_date=None)
+
+    # C. অন্যান্য পোস্ট বাদ দেওয়া 
+    print(f"        ⚠️ টাইপ ফিল্টার: {title} বাদ দেওয়া হলো (ডেডলাইন বা ফলাফল নয়)।")
+    return None
+
+
+@METRICS.stage('post_extract')
+def extract_post_media(html):
+    """একক পোস্ট পেজের HTML থেকে ইমেজ, লেবেল এবং আবেদনের লিংক বের করে।"""
+    from bs4 import BeautifulSoup
+
+    _, post_strainer = _get_strainers()
+    soup = BeautifulSoup(html, 'lxml', parse_only=post_strainer)
+    media_data = _empty_media_data()
+
+    # A. পোস্ট বডি কন্টেইনার খোঁজা
+    post_body = soup.find('div', class_='post-body') 
+    if not post_body:
+        post_body = soup.find('div', class_='entry-content')
+    if not post_body:
+        return media_data
+
+    # B. ইমেজ সংগ্রহ
+    images = post_body.select('div.separator img[src], div.separator img[data-src]')
+    if not images:
+        images = post_body.select('img[src], img[data-src]') 
+
+    if images:
+        for img_tag in images:
+            img_src = img_tag.get('src') or img_tag.get('data-src')
+            if img_src:
+                media_data['images'].append(img_src.replace('/s16000/', '/s1000/')) 
+    else:
+        print("        ❌ WARNING: কোনো ইমেজ খুঁজে পাওয়া যায়নি।")
+
+    # 🎯 E. আবেদনের লিংক (Application Link) সংগ্রহ - (আপডেটেড লজিক) 🎯
+    
+    # ১. প্রথম চেষ্টা: সরাসরি 'আবেদনের লিংকঃ' টেক্সট খোঁজা (বাংলা)
+    p_tags = post_body.find_all('p')
+    for p_tag in p_tags:
+        if 'আবেদনের লিংকঃ' in p_tag.text:
+            link_tag = p_tag.find('a', href=True)
+            if link_tag:
+                media_data['application_link'] = link_tag['href']
+                media_data['application_text'] = p_tag.text.strip()
+                break 
+
+    # ২. দ্বিতীয় চেষ্টা: যদি উপরে না পাওয়া যায়, ইংরেজি 'Apply' শব্দটি খোঁজা
+    if not media_data['application_link']:
+        # সব লিংক ট্যাগ খোঁজা
+        all_links = post_body.find_all('a', href=True)
+        
+        for link in all_links:
+            link_text = link.get_text().strip()
+            # প্যারেন্ট এলিমেন্টের টেক্সট (যেমন: <p>Apply here: <a>Link</a></p>)
+            parent_text = link.parent.get_text().strip() if link.parent else ""
+            
+            # কন্ডিশন ১: লিংকের নিজের টেক্সটে 'Apply' আছে কি না (যেমন: "Apply Now", "Click to Apply")
+            if _APPLY_RE.search(link_text):
+                media_data['application_link'] = link['href']
+                media_data['application_text'] = "Apply Link: " + link_text
+                print("        ℹ️ 'Apply' বাটন/লিংক টেক্সট খুঁজে পাওয়া গেছে।")
+                break
+            
+            # কন্ডিশন ২: লিংকের ঠিক আগের বা প্যারেন্ট টেক্সটে 'Apply' আছে কি না
+            # (এবং প্যারেন্ট টেক্সট খুব বড় যেন না হয়, যাতে ভুল লিংক না আসে)
+            elif len(parent_text) < 150 and _APPLY_RE.search(parent_text):
+                media_data['application_link'] = link['href']
+                media_data['application_text'] = parent_text
+                print("        ℹ️ 'Apply' টেক্সটের পাশে লিংক খুঁজে পাওয়া গেছে।")
+                break
+
+    # C. ট্যাগ/লেবেল সংগ্রহ
+    labels_container = soup.find('span', class_='post-labels')
+    if not labels_container:
+        labels_container = soup.find('div', class_='post-footer') 
+    
+    if labels_container:
+        label_tags = labels_container.select('a[rel="tag"]')
+        if not label_tags:
+            label_tags = labels_container.find_all('a') 
+            
+        if label_tags:
+            media_data['labels'] = [tag.text.strip() for tag in label_tags if tag.text.strip()]
+        
+    # D. ফলব্যাক ট্যাগ
+    if not media_data['labels']:
+             media_data['labels'] = ['জব সার্কুলার']
+            
+    link_status = 'পাওয়া গেছে' if media_data['application_link'] else 'পাওয়া যায়নি'
+    print(f"        ✅ মিডিয়া ও লিংক ডেটা সংগ্রহ সম্পন্ন। মোট ইমেজ: {len(media_data['images'])}, আবেদনের লিংক: {link_status}")
+    return media_data
+
+# =========================================================
+# 🚀 ধাপ ৩: পোস্টের তালিকা সংগ্রহ ও তারিখ ফিল্টারিং
+# =========================================================
+
+LISTING_REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+
+# এই রানে দেখা অবস্থান: {listing_url: {'newest_url', 'visited': [url], 'complete'}}, প্রকাশ শেষে কমিট হয়
+_pending_crawl_positions = {}
+
+
+def _crawl_state_path():
+    return os.path.join(STATE_DIR, 'crawl_state.json')
+
+
+def load_crawl_state():
+    try:
+        with open(_crawl_state_path(), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def commit_crawl_position(listing_url):
+    """
+    এই রানে দেখা সবচেয়ে নতুন পোস্টের URL সংরক্ষণ করে, যাতে পরের রান সেখানে পৌঁছে থামে।
+    max_posts এ ক্রল মাঝপথে থামলে আগের থামার বিন্দু রেখে এই রানে দেখা URL গুলো 'visited' এ জমা হয়,
+    যাতে পরের রান সেগুলো পার হয়ে বাকি পুরোনো পোস্টে পৌঁছায়। সব নতুন পোস্ট সফলভাবে প্রকাশের পরই এটি ডাকা উচিত।
+    """
+    pending = _pending_crawl_positions.pop(listing_url, None)
+    if not pending:
+        return
+    state = load_crawl_state()
+    saved_at = datetime.now().isoformat(timespec='seconds')
+    if pending['complete']:
+        state[listing_url] = {'newest_url': pending['newest_url'], 'saved_at': saved_at}
+    else:
+        previous = state.get(listing_url, {})
+        state[listing_url] = {
+            'newest_url': previous.get('newest_url'),
+            'visited': previous.get('visited', []) + pending['visited'],
+            'saved_at': saved_at,
+        }
+    try:
+        _atomic_write(_crawl_state_path(), json.dumps(state, ensure_ascii=False))
+    except OSError as e:
+        print(f"        ⚠️ ক্রল অবস্থান সংরক্ষণ করা যায়নি: {e}")
+
+
+def iter_listing_pages(listing_url, max_pages):
+    """আর্কাইভের পেজগুলো নতুন থেকে পুরোনো ক্রমে লেজিভাবে (url, html) হিসেবে দেয়।"""
+    page_url = listing_url
+    for _ in range(max_pages):
+        page = fetch_page(page_url, headers=LISTING_REQUEST_HEADERS, timeout=15)
+        yield page_url, page.text
+        page_url = extract_older_page_url(page.text)
+        if not page_url:
+            return
+
+
+def _is_older_than_watermark(post_url, watermark):
+    """পোস্ট URL এর /yyyy/mm/ অংশ watermark মাসের আগের হলে True।"""
+    match = _POST_LINK_HREF_RE.search(post_url)
+    return bool(match) and (int(match.group(1)), int(match.group(2))) < (watermark.year, watermark.month)
+
+
+def iter_listing_entries(listing_url, known_post=None):
+    """
+    paginated মোডে পুরোনো পেজগুলোতে যেতে যেতে এন্ট্রি দেয়, এবং থামে যখন:
+    ব্লগে আগে থেকেই থাকা পোস্ট, আগের রানের সর্বশেষ দেখা পোস্ট বা watermark তারিখ পাওয়া যায়।
+    আগের মাঝপথে থামা রানে দেখা এন্ট্রিগুলো বাদ দিয়ে তার পরে এগোয়।
+    """
+    paginated = CRAWL_MODE == 'paginated'
+    saved_position = load_crawl_state().get(listing_url, {}) if paginated else {}
+    last_seen_url = saved_position.get('newest_url')
+    visited_urls = set(saved_position.get('visited', ()))
+    watermark = datetime.strptime(CRAWL_WATERMARK_DATE, '%Y-%m-%d').date() if paginated and CRAWL_WATERMARK_DATE else None
+    max_pages = CRAWL_MAX_PAGES if paginated else 1
+    first_entry_seen = False
+    pages_read = 0
+
+    for page_url, html in iter_listing_pages(listing_url, max_pages):
+        pages_read += 1
+        for entry in extract_listing_entries(html):
+            if paginated and not first_entry_seen:
+                pending = _pending_crawl_positions[listing_url] = {'newest_url': entry['url'], 'visited': [], 'complete': True}
+                first_entry_seen = True
+
+            if paginated:
+                if entry['url'] == last_seen_url:
+                    print(f"        ⏹️ আগের রানের সর্বশেষ পোস্টে পৌঁছানো গেছে ({pages_read} টি পেজ পড়া হয়েছে)।")
+                    return
+                if entry['url'] in visited_urls:
+                    continue
+                if known_post and known_post(entry):
+                    print(f"        ⏹️ ব্লগে আগে থেকেই থাকা পোস্ট পাওয়া গেছে: {entry['title']} ({pages_read} টি পেজ পড়া হয়েছে)।")
+                    return
+                if watermark and _is_older_than_watermark(entry['url'], watermark):
+                    print(f"        ⏹️ Watermark তারিখ ({watermark}) এর আগের পোস্টে পৌঁছানো গেছে।")
+                    return
+                pending['visited'].append(entry['url'])
+
+            yield entry
+
+        if paginated:
+            print(f"        📄 পেজ {pages_read} পড়া শেষ: {page_url}")
+
+
+@METRICS.stage('listing')
+def get_all_post_links_and_details(listing_url, known_post=None, max_posts=None, accept=None):
+    """
+    আর্কাইভ পেজ থেকে পোস্টের URL, শিরোনাম, এবং ডেটলাইন সংগ্রহ করে এবং ফিল্টার করে।
+    accept(details) দিলে সোর্সের নিজস্ব ফিল্টার নিয়মও প্রয়োগ হয়।
+    """
+    print(f"\n▶️ ধাপ ৩: পোস্টের তালিকা সংগ্রহ শুরু হচ্ছে: {listing_url}")
+    max_posts = max_posts or MAX_POSTS_TO_LOAD
+    today = datetime.now().date()
+    all_target_details = []
+
+    try:
+        for entry in iter_listing_entries(listing_url, known_post):
+            details = classify_listing_entry(entry, today)
+            if details and accept and not accept(details):
+                print(f"        ⚠️ সোর্স ফিল্টার: {details['title']} বাদ দেওয়া হলো।")
+                details = None
+            METRICS.inc('listing_entries_total', outcome='accepted' if details else 'filtered')
+            if details:
+                all_target_details.append(details)
+                if len(all_target_details) >= max_posts and CRAWL_MODE == 'paginated':
+                    # বাকি পোস্টগুলো পরের রানে, তাই ক্রল অবস্থান সবচেয়ে নতুন পোস্টে এগোবে না
+                    if listing_url in _pending_crawl_positions:
+                        _pending_crawl_positions[listing_url]['complete'] = False
+                    print(f"        ⏸️ max_posts ({max_posts}) পূর্ণ; বাকি পোস্ট পরের রানে এখান থেকে নেওয়া হবে।")
+                    break
+    except requests.exceptions.RequestException as e:
+        print(f"❌ পোস্ট তালিকা রিকোয়েস্ট ব্যর্থ হয়েছে: {e}")
+        if not all_target_details:
+            return []
+
+    print(f"✅ পোস্টের তালিকা সংগ্রহ ও তারিখ ফিল্টারিং সম্পন্ন হয়েছে। ভ্যালিড পোস্ট পাওয়া গেছে: {len(all_target_details)} টি")
+    
+    final_list = all_target_details[:max_posts] 
+    return final_list
+
+
+# =========================================================
+# 🌐 ধাপ ৩.২: একাধিক সোর্স একসাথে ক্রল
+# =========================================================
+
+Source = namedtuple('Source', ['url', 'max_posts', 'tag', 'include', 'exclude', 'types'])
+SOURCE_POST_TYPES = ('deadline', 'result')
+
+
+def _compile_source_pattern(pattern):
+    return re.compile(pattern, re.IGNORECASE) if pattern else None
+
+
+def load_sources():
+    """SOURCES_FILE বা SOURCES থেকে সোর্স তালিকা পড়ে; কোনোটি না থাকলে TARGET_URL একমাত্র সোর্স।"""
+    if SOURCES_FILE:
+        with open(SOURCES_FILE, encoding='utf-8') as f:
+            raw_sources = json.load(f)
+    elif SOURCES_JSON:
+        raw_sources = json.loads(SOURCES_JSON)
+    else:
+        raw_sources = [TARGET_LISTING_URL] if TARGET_LISTING_URL else []
+
+    sources = []
+    seen_urls = set()
+    for raw in raw_sources:
+        if isinstance(raw, str):
+            raw = {'url': raw}
+        if not raw.get('url'):
+            raise ValueError(f"সোর্স কনফিগারেশনে 'url' নেই: {raw}")
+        types = tuple(raw.get('types') or SOURCE_POST_TYPES)
+        unknown_types = set(types) - set(SOURCE_POST_TYPES)
+        if unknown_types:
+            raise ValueError(f"অজানা পোস্ট টাইপ {sorted(unknown_types)} (সোর্স: {raw['url']})")
+        if raw['url'] in seen_urls:
+            continue
+        seen_urls.add(raw['url'])
+        sources.append(Source(
+            url=raw['url'],
+            max_posts=int(raw.get('max_posts') or MAX_POSTS_TO_LOAD),
+            tag=raw.get('tag') or None,
+            include=_compile_source_pattern(raw.get('include')),
+            exclude=_compile_source_pattern(raw.get('exclude')),
+            types=types,
+        ))
+    return sources
+
+
+def source_accepts(source, details):
+    """সোর্সের টাইপ ও include/exclude টাইটেল নিয়ম মিলিয়ে দেখে।"""
+    if details['type'] not in source.types:
+        return False
+    if source.include and not source.include.search(details['title']):
+        return False
+    return not (source.exclude and source.exclude.search(details['title']))
+
+
+def _crawl_source(source, known_post, parse_pool=None):
+    if parse_pool:
+        return backfill_listing(parse_pool, source)
+    details_list = get_all_post_links_and_details(
+        source.url, known_post, source.max_posts, accept=lambda details: source_accepts(source, details)
+    )
+    return [dict(details, listing_url=source.url, source_tag=source.tag) for details in details_list]
+
+
+def crawl_sources(sources, known_post=None, parse_pool=None):
+    """
+    সব সোর্স একসাথে ক্রল করে: মোট থ্রেড SCRAPE_WORKERS এর মধ্যে, আর প্রতি হোস্টে
+    PER_HOST_CONCURRENCY ও PER_HOST_MIN_INTERVAL_SECONDS মেনে (http_get এ প্রয়োগ হয়)।
+    কনফিগারেশনের ক্রমে [(সোর্স, details তালিকা)] ফেরত দেয়; একটি সোর্স ব্যর্থ হলে বাকিগুলো চলে।
+    parse_pool দিলে ব্যাকফিল ক্রল হয় (known_post উপেক্ষিত)।
+    """
+    workers = max(1, min(SCRAPE_WORKERS, len(sources)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='source-crawl') as executor:
+        futures = [executor.submit(_crawl_source, source, known_post, parse_pool) for source in sources]
+
+    results = []
+    for source, future in zip(sources, futures):
+        try:
+            results.append((source, future.result()))
+        except Exception as e:
+            print(f"❌ সোর্স ক্রল ব্যর্থ: {source.url} ({e})")
+            results.append((source, []))
+    return results
+
+
+# =========================================================
+# 📚 ধাপ ৩.৩: ব্যাকফিল (প্রসেস পুলে HTML পার্সিং)
+# =========================================================
+
+def start_parse_pool():
+    """
+    PARSE_WORKERS টি প্রসেসের পুল তৈরি করে একটি খালি কাজ দিয়ে সব ওয়ার্কার আগেই চালু করে।
+    fork এর মুহূর্তে অন্য থ্রেড কোনো লক ধরে থাকলে চাইল্ডে তা চিরকাল আটকে থাকে, তাই main এটি কোনো
+    সেশন বা থ্রেড চালুর আগেই ডাকে। তবুও অন্য থ্রেড চালু থাকলে fork এর বদলে spawn ব্যবহার হয়।
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    start_method = 'fork' if threading.active_count() == 1 and 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+    pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context(start_method))
+    pool.submit(int).result()
+    return pool
+
+
+def _parse_listing_pages(pages, today):
+    """
+    প্রসেস পুলের ওয়ার্কার: [(page_url, html)] চাংক পার্স ও শ্রেণিবিন্যাস করে প্রতি পেজের জন্য
+    (এন্ট্রি সংখ্যা, পেজের সবচেয়ে পুরোনো পোস্ট URL, ভ্যালিড details তালিকা) ফেরত দেয়।
+    """
+    results = []
+    for _page_url, html in pages:
+        entries = extract_listing_entries(html)
+        classified = [classify_listing_entry(entry, today) for entry in entries]
+        results.append((len(entries), entries[-1]['url'] if entries else None, [details for details in classified if details]))
+    return results
+
+
+def _parse_post_pages(pages):
+    """প্রসেস পুলের ওয়ার্কার: [(post_url, html)] চাংক থেকে [(post_url, media_data)] ফেরত দেয়।"""
+    return [(post_url, dict(extract_post_media(html), page_hash=text_hash(html))) for post_url, html in pages]
+
+
+@METRICS.stage('backfill_listing')
+def backfill_listing(pool, source):
+    """
+    একটি সোর্সের আর্কাইভ CRAWL_MAX_PAGES বা CRAWL_WATERMARK_DATE পর্যন্ত পড়ে। পেজ আনা হয় ক্রমানুসারে
+    (পরের পেজের লিংক রেজেক্সে, পার্সিং ছাড়া), আর PARSE_CHUNK_SIZE টি করে পেজ প্রসেস পুলে পার্স হয়,
+    তাই আনা ও পার্সিং একসাথে চলে। আগের রানের অবস্থান, ব্লগে থাকা পোস্ট বা max_posts এ থামে না।
+    """
+    print(f"\n▶️ ব্যাকফিল: পোস্টের তালিকা সংগ্রহ শুরু হচ্ছে: {source.url}")
+    today = datetime.now().date()
+    watermark = datetime.strptime(CRAWL_WATERMARK_DATE, '%Y-%m-%d').date() if CRAWL_WATERMARK_DATE else None
+    details_list = []
+    pending = deque()
+    chunk = []
+    pages_read = 0
+    reached_watermark = False
+
+    def collect(future):
+        nonlocal reached_watermark
+        for entry_count, oldest_url, page_details in future.result():
+            if watermark:
+                reached_watermark = reached_watermark or (oldest_url and _is_older_than_watermark(oldest_url, watermark))
+                page_details = [details for details in page_details if not _is_older_than_watermark(details['url'], watermark)]
+            accepted = [
+                dict(details, listing_url=source.url, source_tag=source.tag)
+                for details in page_details if source_accepts(source, details)
+            ]
+            METRICS.inc('backfill_pages_total', kind='listing')
+            METRICS.inc('listing_entries_total', len(accepted), outcome='accepted')
+            METRICS.inc('listing_entries_total', entry_count - len(accepted), outcome='filtered')
+            details_list.extend(accepted)
+
+    try:
+        for page_url, html in iter_listing_pages(source.url, CRAWL_MAX_PAGES):
+            pages_read += 1
+            chunk.append((page_url, html))
+            if len(chunk) >= PARSE_CHUNK_SIZE:
+                pending.append(pool.submit(_parse_listing_pages, chunk, today))
+                chunk = []
+            while pending and pending[0].done():
+                collect(pending.popleft())
+            if reached_watermark:
+                print(f"        ⏹️ Watermark তারিখ ({watermark}) এর আগের পোস্টে পৌঁছানো গেছে।")
+                break
+    except requests.exceptions.RequestException as e:
+        print(f"❌ পোস্ট তালিকা রিকোয়েস্ট ব্যর্থ হয়েছে: {e}")
+
+    if chunk:
+        pending.append(pool.submit(_parse_listing_pages, chunk, today))
+    while pending:
+        collect(pending.popleft())
+
+    print(f"✅ ব্যাকফিল তালিকা সম্পন্ন: {pages_read} টি পেজ থেকে {len(details_list)} টি ভ্যালিড পোস্ট ({source.url})")
+    return details_list
+
+
+@METRICS.stage('backfill_media')
+def backfill_post_media(pool, details_list):
+    """
+    নতুন পোস্টের পেজ থ্রেড পুলে এনে কাঁচা HTML চাংক করে প্রসেস পুলে পার্স করায়, এবং ফলাফল জার্নালে
+    'scraped' হিসেবে লেখে, যাতে প্রকাশ পাইপলাইন আবার না এনে সরাসরি রেন্ডার করে। এক উইন্ডো পার্স হওয়ার
+    সময় পরের উইন্ডো আনা হয়, তাই মেমরিতে সর্বোচ্চ দুই উইন্ডো পেজ থাকে। ইমেজহীন পোস্ট বাদ দিয়ে details ফেরত দেয়।
+    """
+    journal = load_journal()
+    to_fetch = [details for details in details_list if not _cached_preparation(journal, details, ())]
+    window = PARSE_CHUNK_SIZE * PARSE_WORKERS * 2
+    without_images = set()
+    print(f"\n▶️ ব্যাকফিল: {len(to_fetch)} টি পোস্ট পেজ আনা ও {PARSE_WORKERS} টি প্রসেসে পার্স শুরু "
+          f"({len(details_list) - len(to_fetch)} টি জার্নালে আগে থেকেই আছে)")
+
+    def fetch(details):
+        try:
+            return details['url'], fetch_page(details['url'], timeout=15).text
+        except requests.exceptions.RequestException as e:
+            # পাইপলাইন এই পোস্ট আবার স্ক্র্যাপের চেষ্টা করবে
+            print(f"        ❌ একক পোস্ট রিকোয়েস্ট ব্যর্থ হয়েছে: {e}")
+            return details['url'], None
+
+    def collect(futures):
+        for future in futures:
+            for post_url, media_data in future.result():
+                METRICS.inc('backfill_pages_total', kind='post')
+                if media_data['images']:
+                    append_journal(None, post_url, 'scraped', media=media_data)
+                else:
+                    without_images.add(post_url)
+
+    previous = []
+    with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS, thread_name_prefix='backfill-fetch') as fetchers:
+        for start in range(0, len(to_fetch), window):
+            pages = [page for page in fetchers.map(fetch, to_fetch[start:start + window]) if page[1] is not None]
+            current = [
+                pool.submit(_parse_post_pages, pages[offset:offset + PARSE_CHUNK_SIZE])
+                for offset in range(0, len(pages), PARSE_CHUNK_SIZE)
+            ]
+            collect(previous)
+            previous = current
+    collect(previous)
+
+    if without_images:
+        print(f"        ⚠️ ইমেজ না থাকায় {len(without_images)} টি পোস্ট বাদ দেওয়া হলো।")
+    return [details for details in details_list if details['url'] not in without_images]
+
+
+# =========================================================
+# ধাপ ২: সিঙ্গেল পোস্ট থেকে ইমেজ/ট্যাগ/লিঙ্ক নিষ্কাশন (আপডেটেড)
+# =========================================================
+
+@METRICS.stage('post_scrape')
+def scrape_single_post_media(post_url):
+    """একটি একক ব্লগ পোস্ট URL থেকে ইমেজ, লেবেল এবং আবেদনের লিংক (স্মার্ট ফলব্যাক সহ) বের করে আনে।"""
+    print(f"        🔄 ধাপ ২: মিডিয়া ও লিংক ডেটা সংগ্রহ শুরু: {post_url[-40:]}...")
+    
+    try:
+        page = fetch_page(post_url, timeout=15)
+    except requests.exceptions.RequestException as e:
+        print(f"        ❌ একক পোস্ট রিকোয়েস্ট ব্যর্থ হয়েছে: {e}")
+        return _empty_media_data()
+
+    media_data = extract_post_media(page.text)
+    media_data['page_hash'] = text_hash(page.text)
+    return media_data
+
+
+# =========================================================
+# ধাপ ২.১: ইমেজ স্টেজ (URL ক্যানোনিকালাইজেশন, ডুপ্লিকেট বাদ, HEAD যাচাই)
+# =========================================================
+
+_BLOGGER_IMAGE_HOST_RE = re.compile(r'(?:^|\.)(?:bp\.blogspot\.com|googleusercontent\.com)$')
+# s1600, s72-c, w640-h400, s320-rw, w640-h400-p-k-no-nu ইত্যাদি
+_IMAGE_SIZE_PATTERN = r'[swh]\d+(?:-[a-z0-9]+)*'
+_IMAGE_SIZE_SEGMENT_RE = re.compile(rf'^{_IMAGE_SIZE_PATTERN}$')
+_IMAGE_SIZE_SUFFIX_RE = re.compile(rf'=({_IMAGE_SIZE_PATTERN})$')
+# এই স্ট্যাটাসগুলোতে ইমেজ ভাঙা কিনা নিশ্চিত বলা যায় না, তাই ফলাফল ক্যাশ হয় না
+_IMAGE_CHECK_UNCERTAIN_STATUSES = {405, 408, 429}
+
+_image_check_cache = None
+_image_check_dirty = False
+_image_check_lock = threading.Lock()
+_image_checks_inflight = {}
+_image_check_pool = None
+
+
+@lru_cache(maxsize=4096)
+def _split_image_size(url):
+    """
+    Blogger ইমেজ URL কে (সাইজের আগের অংশ, সাইজ, পরের অংশ) এ ভাগ করে।
+    পাথ সেগমেন্ট (/s1600/name.jpg, /w640-h400/name.jpg) ও সাফিক্স (/img/a/ID=s16000) দুই ধরনই বোঝে;
+    Blogger হোস্ট না হলে বা সাইজ অংশ না পেলে None।
+    """
+    if url.startswith('//'):
+        url = 'https:' + url
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if not _BLOGGER_IMAGE_HOST_RE.search(host):
+        return None
+    origin = f"https://{host}"
+    query = f"?{parts.query}" if parts.query else ''
+
+    match = _IMAGE_SIZE_SUFFIX_RE.search(parts.path)
+    if match:
+        return origin + parts.path[:match.start(1)], match.group(1), query
+
+    directory, _, filename = parts.path.rpartition('/')
+    parent, _, segment = directory.rpartition('/')
+    if filename and _IMAGE_SIZE_SEGMENT_RE.match(segment):
+        return f"{origin}{parent}/", segment, f"/{filename}{query}"
+    return None
+
+
+def image_variant(url, size):
+    """Blogger ইমেজের নির্দিষ্ট সাইজের URL; সাইজ অংশ না থাকা URL অপরিবর্তিত থাকে।"""
+    parts = _split_image_size(url)
+    return f"{parts[0]}{size}{parts[2]}" if parts else url
+
+
+def canonical_image_key(url):
+    """সাইজ বাদ দেওয়া কী, যাতে একই ছবির ভিন্ন সাইজ (s1000/s16000/w640-h400) একটাই ধরা হয়।"""
+    parts = _split_image_size(url)
+    return f"{parts[0]}*{parts[2]}" if parts else url
+
+
+def dedupe_image_urls(urls):
+    """ক্যানোনিকাল কী অনুযায়ী ডুপ্লিকেট ইমেজ বাদ দেয় (প্রথমটির ক্রম বজায় থাকে)।"""
+    unique = {}
+    for url in urls:
+        unique.setdefault(canonical_image_key(url), url)
+    return list(unique.values())
+
+
+def _image_check_cache_path():
+    return os.path.join(STATE_DIR, 'image_checks.json')
+
+
+def _image_check_fresh(entry, now):
+    """{url: [ঠিক আছে কিনা, যাচাইয়ের সময়]} এন্ট্রি এখনো TTL এর মধ্যে কিনা।"""
+    ok, checked_at = entry
+    ttl = IMAGE_CHECK_TTL_DAYS * 86400 if ok else IMAGE_CHECK_FAILURE_TTL_HOURS * 3600
+    return now - checked_at < ttl
+
+
+def _load_image_check_cache():
+    """ডিস্ক থেকে মেয়াদ না পেরোনো যাচাই ফলাফল একবারই লোড করে (_image_check_lock ধরে ডাকতে হবে)।"""
+    global _image_check_cache
+    if _image_check_cache is None:
+        try:
+            with open(_image_check_cache_path(), encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        now = time.time()
+        _image_check_cache = {url: entry for url, entry in entries.items() if _image_check_fresh(entry, now)}
+    return _image_check_cache
+
+
+def save_image_check_cache():
+    """নতুন যাচাই ফলাফল থাকলে মেয়াদোত্তীর্ণগুলো বাদ দিয়ে ক্যাশ ফাইলটি অ্যাটমিকভাবে লিখে।"""
+    global _image_check_dirty
+    with _image_check_lock:
+        if not _image_check_dirty:
+            return
+        now = time.time()
+        for url in [url for url, entry in _image_check_cache.items() if not _image_check_fresh(entry, now)]:
+            del _image_check_cache[url]
+        data = json.dumps(_image_check_cache, separators=(',', ':'))
+        _image_check_dirty = False
+    _atomic_write(_image_check_cache_path(), data)
+
+
+def _get_image_check_pool():
+    """সব পোস্টের HEAD রিকোয়েস্টের জন্য একটি শেয়ার্ড থ্রেড পুল (_image_check_lock ধরে ডাকতে হবে)।"""
+    global _image_check_pool
+    if _image_check_pool is None:
+        _image_check_pool = ThreadPoolExecutor(max_workers=max(1, IMAGE_CHECK_WORKERS), thread_name_prefix='image-check')
+    return _image_check_pool
+
+
+def check_image_url(url):
+    """HEAD রিকোয়েস্টে ইমেজ যাচাই: True চালু, False ভাঙা, None নিশ্চিত নয় (নেটওয়ার্ক সমস্যা/5xx)।"""
+    try:
+        response = http_head(url, timeout=IMAGE_CHECK_TIMEOUT_SECONDS)
+    except requests.exceptions.RequestException:
+        return None
+    if response.status_code < 400:
+        content_type = response.headers.get('Content-Type', '')
+        return not content_type or content_type.startswith('image/')
+    if response.status_code >= 500 or response.status_code in _IMAGE_CHECK_UNCERTAIN_STATUSES:
+        return None
+    return False
+
+
+def _run_image_check(url):
+    """পুলে চলে: যাচাই করে ফলাফল মেমরি ক্যাশে রাখে এবং চলমান তালিকা থেকে সরায়।"""
+    global _image_check_dirty
+    result = None
+    try:
+        result = check_image_url(url)
+        return result
+    finally:
+        METRICS.inc('image_checks_total', result={True: 'ok', False: 'broken', None: 'unknown'}[result])
+        with _image_check_lock:
+            _image_checks_inflight.pop(url, None)
+            if result is not None:
+                _image_check_cache[url] = [result, time.time()]
+                _image_check_dirty = True
+
+
+def validate_image_urls(urls):
+    """
+    প্রতিটি URL এর যাচাই ফলাফল {url: True/False/None} ফেরত দেয়।
+    TTL এর মধ্যে ক্যাশে থাকা URL এ কোনো রিকোয়েস্ট যায় না; বাকিগুলো শেয়ার্ড পুলে একসাথে HEAD হয়,
+    আর একই URL অন্য পোস্টের জন্য আগে থেকেই চলমান থাকলে সেই ফলাফলের অপেক্ষা করা হয়।
+    """
+    urls = list(dict.fromkeys(urls))
+    if not IMAGE_CHECK_ENABLED:
+        return dict.fromkeys(urls)
+
+    results, pending = {}, {}
+    now = time.time()
+    with _image_check_lock:
+        cache = _load_image_check_cache()
+        for url in urls:
+            entry = cache.get(url)
+            if entry and _image_check_fresh(entry, now):
+                results[url] = entry[0]
+                METRICS.inc('image_checks_total', result='cached')
+                continue
+            if url not in _image_checks_inflight:
+                _image_checks_inflight[url] = _get_image_check_pool().submit(_run_image_check, url)
+            pending[url] = _image_checks_inflight[url]
+
+    for url, future in pending.items():
+        results[url] = future.result()
+    if pending:
+        save_image_check_cache()
+    return results
+
+
+def _first_working(candidates, checks):
+    return next((url for url in candidates if checks.get(url) is not False), None)
+
+
+@METRICS.stage('image_stage')
+def prepare_post_images(image_urls):
+    """
+    ছবিগুলো ক্যানোনিকালাইজ ও ডুপ্লিকেট মুক্ত করে প্রদর্শন (s1000) ও ডাউনলোড (s16000) সাইজ যাচাই করে।
+    কোনো সাইজ ভাঙা হলে মূল URL এ ফলব্যাক করে; দেখানোর মতো কোনো URL না থাকলে ছবিটি বাদ যায়।
+    ফলাফল: [{'src': ..., 'download': ...}]
+    """
+    candidates = []
+    for url in dedupe_image_urls(image_urls):
+        candidates.append((url, image_variant(url, IMAGE_DISPLAY_SIZE), image_variant(url, IMAGE_DOWNLOAD_SIZE)))
+
+    checks = validate_image_urls([u for _, display, download in candidates for u in (display, download)])
+    # কোনো সাইজ ভাঙা হলেই শুধু মূল URL যাচাই করা হয়
+    fallbacks = [url for url, display, download in candidates
+                 if url not in checks and (checks[display] is False or checks[download] is False)]
+    if fallbacks:
+        checks.update(validate_image_urls(fallbacks))
+
+    image_links = []
+    for url, display, download in candidates:
+        src = _first_working((display, url), checks)
+        if src is None:
+            print(f"        ⚠️ ভাঙা ইমেজ বাদ দেওয়া হলো: {url[-60:]}")
+            continue
+        image_links.append({'src': src, 'download': _first_working((download, url), checks) or src})
+    return image_links
+
+
+def _unvalidated_image_links(image_urls):
+    """যাচাই ছাড়া (যেমন বেঞ্চমার্কে সরাসরি রেন্ডার) প্রদর্শন ও ডাউনলোড সাইজের লিংক।"""
+    return [{'src': image_variant(url, IMAGE_DISPLAY_SIZE), 'download': image_variant(url, IMAGE_DOWNLOAD_SIZE)}
+            for url in dedupe_image_urls(image_urls)]
+
+
+# =========================================================
+# সহায়ক ফাংশন: রিজিউমেবল চেকপয়েন্ট জার্নাল (append-only)
+# =========================================================
+
+_journal_lock = threading.Lock()
+
+
+def _journal_path():
+    return os.path.join(STATE_DIR, 'journal.jsonl')
+
+
+def _journal_key(blog_id, source_url):
+    # scraped/rendered অবস্থা সব ব্লগের জন্য একই (blog_id None), published প্রতি ব্লগে আলাদা
+    return f"{blog_id} {source_url}"
+
+
+def load_journal():
+    """
+    জার্নাল রিপ্লে করে প্রতিটি (ব্লগ, সোর্স URL) এর সর্বশেষ অবস্থা ফেরত দেয়। published রেকর্ড
+    JOURNAL_RETENTION_DAYS, আর অসম্পূর্ণ scraped/rendered রেকর্ড JOURNAL_PENDING_RETENTION_DAYS পর বাদ যায়।
+    ফাইল অনেক বড় হলে শুধু রাখা রেকর্ডগুলো দিয়ে ফাইলটি ছোট করা হয়।
+    """
+    latest = {}
+    line_count = 0
+    try:
+        with open(_journal_path(), encoding='utf-8') as f:
+            for line in f:
+                line_count += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # মাঝপথে বন্ধ হলে শেষ লাইন অসম্পূর্ণ থাকতে পারে
+                    continue
+                latest[_journal_key(record['blog_id'], record['url'])] = record
+    except OSError:
+        return latest
+
+    now = time.time()
+    cutoffs = {'published': now - JOURNAL_RETENTION_DAYS * 86400}
+    pending_cutoff = now - JOURNAL_PENDING_RETENTION_DAYS * 86400
+    kept = {
+        key: record for key, record in latest.items()
+        if record.get('ts', 0) >= cutoffs.get(record['state'], pending_cutoff)
+    }
+    if line_count > 2 * len(kept) + 100:
+        with _journal_lock:
+            _atomic_write(_journal_path(), ''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in kept.values()))
+    return kept
+
+
+def append_journal(blog_id, source_url, state, **fields):
+    """একটি পোস্টের নতুন অবস্থা জার্নালের শেষে লিখে সাথে সাথে ডিস্কে ফ্লাশ করে।"""
+    record = dict(fields, blog_id=blog_id, url=source_url, state=state, ts=time.time())
+    line = json.dumps(record, ensure_ascii=False) + '\n'
+    with _journal_lock:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        with open(_journal_path(), 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+# =========================================================
+# ধাপ ৪: পোস্ট রেন্ডারিং
+# =========================================================
+
+_APPLICATION_BOX_TEMPLATE = Template('''
+        <div style="border: 2px solid #4CAF50; padding: 15px; margin: 20px 0; border-radius: 8px; background-color: #f9fff9;">
+            <p style="font-weight: bold; color: #333;">আবেদনের তথ্য:</p>
+            <p style="margin-top: 5px;">$app_text</p>
+            <a href="$application_link" target="_blank" 
+               style="display: inline-block; padding: 10px 20px; text-decoration: none; 
+                      background-color: #f44336; color: white; border-radius: 5px; 
+                      font-weight: bold; margin-top: 10px;">
+                ➡️ অনলাইনে আবেদন করুন
+            </a>
+        </div>
+        ''')
+
+_IMAGE_BLOCK_TEMPLATE = Template('''<img src="$src" style="max-width:100%; height:auto; margin: 10px 0;" />
+        <a href="$download" download="image_$number" target="_blank" 
+            style="display: block; margin: 10px auto; padding: 10px 20px; text-decoration: none; 
+                    background-color: #4CAF50; color: white; border-radius: 5px; width: fit-content; font-weight: bold;">
+                    Download (Image-$number)
+        </a>
+        ''')
+
+
+def text_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def post_content_hash(post):
+    """
+    টাইটেল, কন্টেন্ট ও লেবেলের হ্যাশ। WebEndDate লেবেল বাদ থাকে, কারণ ডেডলাইন না থাকলে সেটা
+    প্রতিদিন বদলায়; আসল ডেডলাইন বদলালে কন্টেন্টের ডেডলাইন টেক্সটও বদলায়।
+    """
+    labels = [label for label in post['labels'] if not label.startswith(WEB_END_DATE_TAG_PREFIX)]
+    digest = hashlib.sha1()
+    for part in [post['title'], post['content']] + labels:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
 
-def get_all_post_links_and_details(listing_url):
-    """আর্কাইভ পেজ থেকে পোস্টের URL, শিরোনাম, এবং ডেটলাইন সংগ্রহ করে এবং ফিল্টার করে।"""
-    print(f"\n▶️ ধাপ ৩: পোস্টের তালিকা সংগ্রহ শুরু হচ্ছে: {listing_url}")
-    today = datetime.now().date()
-    
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(listing_url, headers=headers, timeout=15)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"❌ পোস্ট তালিকা রিকোয়েস্ট ব্যর্থ হয়েছে: {e}")
-        return []
 
-    soup = BeautifulSoup(response.text, 'lxml')
-    all_target_details = []
+def source_fingerprint(details, page_hash):
+    """লিস্টিং এন্ট্রি ও সোর্স পেজের হ্যাশ; না বদলালে পোস্ট পার্স বা রেন্ডার করার দরকার নেই।"""
+    if not page_hash:
+        return None
+    fields = [details['title'], details['deadline_text'], details['type'], details.get('source_tag'), page_hash]
+    return text_hash(json.dumps(fields, ensure_ascii=False))
 
-    # শুধুমাত্র পোস্ট লিঙ্ক টার্গেট করা
-    all_links = soup.find_all('a', href=re.compile(r'/\d{4}/\d{2}/')) 
 
-    for a_tag in all_links:
-        post_url = a_tag.get('href')
-        r_snippetized_div = a_tag.find('div', class_='r-snippetized')
+@METRICS.stage('render')
+def render_post(details, media_data):
+    """স্ক্র্যাপ করা ডেটা থেকে ব্লগ পোস্টের টাইটেল, HTML কন্টেন্ট ও লেবেল তৈরি করে; ইমেজ না থাকলে None।"""
+    current_target_title = details['title']
 
-        if r_snippetized_div:
-            snippet_body_tag = r_snippetized_div.find('div', class_='snippet-body')
-            deadline_text = snippet_body_tag.text.strip() if snippet_body_tag else ""
+    # 🌟 ইমেজ ফিল্টার (ইমেজ স্টেজ চললে শুধু চালু ইমেজগুলো গণ্য হয়)
+    image_links = media_data.get('image_links')
+    if image_links is None:
+        image_links = _unvalidated_image_links(media_data['images'])
+    if not image_links:
+        print(f"        ❌ IMAGE FILTER: {current_target_title} এ কোনো ব্যবহারযোগ্য ইমেজ নেই, পোস্টটি বাদ দেওয়া হলো।")
+        return None
 
-            temp_r_snippetized = copy.copy(r_snippetized_div)
-            
-            # snippet-body ডিকম্পোজ করা 
-            if temp_r_snippetized.find('div', class_='snippet-body'):
-                temp_r_snippetized.find('div', class_='snippet-body').decompose()
-            
-            title = temp_r_snippetized.text.strip()
-            
-            if 'blogspot.com/' in post_url and len(title) > 5:
-                            
-                is_deadline_post = re.search(r'deadline|সময়সীমা', deadline_text, re.IGNORECASE)
-                is_result_post = 'চূড়ান্ত ফলাফল' in deadline_text
-                
-                post_type = None
-                
-                # A. শুধুমাত্র ডেডলাইন পোস্টের ডেট চেক করা হবে
-                if is_deadline_post:
-                    post_type = 'deadline'
-                    
-                    # 🎯 ডেডলাইন ডেট এক্সট্র্যাক্ট করা
-                    match = re.search(r'(?:Deadline|সময়সীমা)(?:[:\s]+)?\s*(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})', deadline_text, re.IGNORECASE)
-                    
-                    if match:
-                        date_str = match.group(1)
-                        # ডেট পার্স করার জন্য বাংলা মাসের নাম সহ এনালিটিক্স যুক্ত করা
-                        parsed_date = dateparser.parse(date_str, languages=['en', 'bn'])
-                        
-                        if parsed_date:
-                            post_date = parsed_date.date()
-                            
-                            # 🛑 ফিল্টারিং: ডেডলাইন আজকের বা তার পরের দিন হতে হবে
-                            if post_date >= today:
-                                all_target_details.append({
-                                    'title': title, 
-                                    'url': post_url, 
-                                    'deadline_text': deadline_text,
-                                    'type': post_type,
-                                    'parsed_date': parsed_date 
-                                })
-                            else:
-                                print(f"        ❌ ডেট ফিল্টার: {title} বাদ দেওয়া হলো। (ডেডলাইন: {post_date})")
-                                continue
-                        else:
-                            print(f"        ⚠️ ডেট পার্সে ব্যর্থ: {title} বাদ দেওয়া হলো।")
-                            continue
-                            
-                # B. ফলাফল পোস্ট
-                elif is_result_post:
-                    post_type = 'result'
-                    all_target_details.append({
-                        'title': title, 
-                        'url': post_url, 
-                        'deadline_text': deadline_text,
-                        'type': post_type,
-                        'parsed_date': None 
-                    })
-                    
-                # C. অন্যান্য পোস্ট বাদ দেওয়া 
-                else:
-                    print(f"        ⚠️ টাইপ ফিল্টার: {title} বাদ দেওয়া হলো (ডেডলাইন বা ফলাফল নয়)।")
+    # 🎯 ডিলিট ডেট গণনার লজিক
+    delete_datetime = None
+    
+    if details['type'] == 'deadline' and details.get('parsed_date'):
+        delete_datetime = details['parsed_date'] + timedelta(days=1)
+        print(f"        ✅ ডেডলাইন পোস্টের ডিলিট ডেট গণনা করা হলো (পরের দিন): {delete_datetime.strftime('%Y-%m-%d')}")
+    
+    if delete_datetime is None:
+        delete_datetime = datetime.now() + timedelta(days=7)
+        print(f"        ⚠️ ফলব্যাক ডিলিট ডেট গণনা করা হলো (৭ দিন পর): {delete_datetime.strftime('%Y-%m-%d')}")
+        
+    web_end_date_tag = f"{WEB_END_DATE_TAG_PREFIX}{delete_datetime.strftime('%d-%m-%Y')}"
+    print(f"        🏷️ WebEndDate ট্যাগ তৈরি: {web_end_date_tag}")
 
-    print(f"✅ পোস্টের তালিকা সংগ্রহ ও তারিখ ফিল্টারিং সম্পন্ন হয়েছে। ভ্যালিড পোস্ট পাওয়া গেছে: {len(all_target_details)} টি")
+    # পোস্ট কন্টেন্ট তৈরি (আগে থেকে কম্পাইল করা টেমপ্লেট, শেষে একবার join)
+    parts = [f"<p>ডেডলাইন/ফলাফল তথ্য: {details['deadline_text']}</p>"]
     
-    final_list = all_target_details[:MAX_POSTS_TO_LOAD] 
-    return final_list
+    # 🎯 আবেদনের লিংক যুক্ত করা (যদি থাকে)
+    if media_data['application_link']:
+        # টেক্সট ক্লিন করা
+        app_text = media_data['application_text'] if media_data['application_text'] else "অনলাইনে আবেদন করুন"
+        # 'আবেদনের লিংকঃ' শব্দটি থাকলে বাদ দেওয়া, না থাকলে যা আছে তাই রাখা
+        app_text = app_text.replace('আবেদনের লিংকঃ', '').strip()
+        parts.append(_APPLICATION_BOX_TEMPLATE.substitute(app_text=app_text, application_link=media_data['application_link']))
+    else:
+         print("        ⚠️ আবেদনের লিংক খুঁজে পাওয়া যায়নি।")
+    
+    # ইমেজ এবং ডাউনলোড লিঙ্ক যোগ
+    parts.append('<h3>সংযুক্ত ছবি:</h3><div style="text-align: center;">')
+    parts.extend(
+        _IMAGE_BLOCK_TEMPLATE.substitute(src=image['src'], download=image['download'], number=i + 1)
+        for i, image in enumerate(image_links)
+    )
+    parts.append('</div><p>--- তথ্যসূত্র: সরকারি চাকরি প্রস্তুতি অ্যাপ ---</p>')
+    post_content = ''.join(parts)
+    
+    final_labels = list(media_data.get('labels', []))
+    # SCRAPED_POST_TAG সবসময় থাকে (ইনডেক্স ও ডিলিট এর উপর নির্ভরশীল), সোর্সের ট্যাগ অতিরিক্ত
+    for tag in (SCRAPED_POST_TAG, details.get('source_tag')):
+        if tag and tag not in final_labels:
+            final_labels.append(tag)
+        
+    final_labels.append(web_end_date_tag)
 
+    post = {
+        'source_url': details['url'],
+        'title': current_target_title,
+        'content': post_content,
+        'labels': final_labels
+    }
+    post['content_hash'] = post_content_hash(post)
+    post['source_hash'] = source_fingerprint(details, media_data.get('page_hash'))
+    return post
 
 # =========================================================
-# ধাপ ২: সিঙ্গেল পোস্ট থেকে ইমেজ/ট্যাগ/লিঙ্ক নিষ্কাশন (আপডেটেড)
+# ধাপ ৪.১: স্ট্রিমিং পাইপলাইন (স্ক্র্যাপ → রেন্ডার → প্রকাশ)
 # =========================================================
 
-def scrape_single_post_media(post_url):
-    """একটি একক ব্লগ পোস্ট URL থেকে ইমেজ, লেবেল এবং আবেদনের লিংক (স্মার্ট ফলব্যাক সহ) বের করে আনে।"""
-    print(f"        🔄 ধাপ ২: মিডিয়া ও লিংক ডেটা সংগ্রহ শুরু: {post_url[-40:]}...")
-    media_data = {'images': [], 'download_links': [], 'labels': [], 'application_link': None, 'application_text': None} 
-    
-    try:
-        response = requests.get(post_url, timeout=15)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"        ❌ একক পোস্ট রিকোয়েস্ট ব্যর্থ হয়েছে: {e}")
-        return media_data
+def _cached_preparation(journal, details, blog_ids):
+    """সব ব্লগের জন্য শেয়ার্ড scraped/rendered রেকর্ড; না থাকলে আগের (ব্লগভিত্তিক) জার্নালের রেকর্ড।"""
+    for blog_id in [None] + list(blog_ids):
+        record = journal.get(_journal_key(blog_id, details['url']))
+        if record and record['state'] in ('scraped', 'rendered'):
+            return record
+    return None
 
-    soup = BeautifulSoup(response.text, 'html.parser') 
-    
-    # A. পোস্ট বডি কন্টেইনার খোঁজা
-    post_body = soup.find('div', class_='post-body') 
-    if not post_body:
-        post_body = soup.find('div', class_='entry-content')
-    if not post_body:
-        return media_data
 
-    # B. ইমেজ সংগ্রহ
-    images = post_body.select('div.separator img[src], div.separator img[data-src]')
-    if not images:
-        images = post_body.select('img[src], img[data-src]') 
+def prepare_post(details, journal_record):
+    """
+    জার্নালে যতদূর কাজ হয়ে আছে সেখান থেকে শুরু করে পোস্ট স্ক্র্যাপ ও রেন্ডার করে।
+    থ্রেড পুলে চলে, প্রতিটি সোর্স পোস্টের জন্য একবারই (যত ব্লগেই যাক); রেন্ডার করা পোস্ট বা None ফেরত দেয়।
+    """
+    state = journal_record['state'] if journal_record else None
 
-    if images:
-        for img_tag in images:
-            img_src = img_tag.get('src') or img_tag.get('data-src')
-            if img_src:
-                media_data['images'].append(img_src.replace('/s16000/', '/s1000/')) 
+    if state == 'rendered':
+        print(f"        ♻️ জার্নাল থেকে রেন্ডার করা পোস্ট নেওয়া হলো: {details['title']}")
+        return journal_record['post']
+
+    if state == 'scraped':
+        print(f"        ♻️ জার্নাল থেকে স্ক্র্যাপ করা ডেটা নেওয়া হলো: {details['title']}")
+        media_data = journal_record['media']
     else:
-        print("        ❌ WARNING: কোনো ইমেজ খুঁজে পাওয়া যায়নি।")
+        media_data = scrape_single_post_media(details['url'])
+        if media_data['images']:
+            append_journal(None, details['url'], 'scraped', media=media_data)
 
-    # 🎯 E. আবেদনের লিংক (Application Link) সংগ্রহ - (আপডেটেড লজিক) 🎯
-    
-    # ১. প্রথম চেষ্টা: সরাসরি 'আবেদনের লিংকঃ' টেক্সট খোঁজা (বাংলা)
-    p_tags = post_body.find_all('p')
-    for p_tag in p_tags:
-        if 'আবেদনের লিংকঃ' in p_tag.text:
-            link_tag = p_tag.find('a', href=True)
-            if link_tag:
-                media_data['application_link'] = link_tag['href']
-                media_data['application_text'] = p_tag.text.strip()
-                break 
+    if media_data['images']:
+        media_data = dict(media_data, image_links=prepare_post_images(media_data['images']))
+    post = render_post(details, media_data)
+    if post:
+        append_journal(None, details['url'], 'rendered', post=post)
+    return post
 
-    # ২. দ্বিতীয় চেষ্টা: যদি উপরে না পাওয়া যায়, ইংরেজি 'Apply' শব্দটি খোঁজা
-    if not media_data['application_link']:
-        # সব লিংক ট্যাগ খোঁজা
-        all_links = post_body.find_all('a', href=True)
-        
-        for link in all_links:
-            link_text = link.get_text().strip()
-            # প্যারেন্ট এলিমেন্টের টেক্সট (যেমন: <p>Apply here: <a>Link</a></p>)
-            parent_text = link.parent.get_text().strip() if link.parent else ""
-            
-            # কন্ডিশন ১: লিংকের নিজের টেক্সটে 'Apply' আছে কি না (যেমন: "Apply Now", "Click to Apply")
-            if re.search(r'apply', link_text, re.IGNORECASE):
-                media_data['application_link'] = link['href']
-                media_data['application_text'] = "Apply Link: " + link_text
-                print("        ℹ️ 'Apply' বাটন/লিংক টেক্সট খুঁজে পাওয়া গেছে।")
-                break
-            
-            # কন্ডিশন ২: লিংকের ঠিক আগের বা প্যারেন্ট টেক্সটে 'Apply' আছে কি না
-            # (এবং প্যারেন্ট টেক্সট খুব বড় যেন না হয়, যাতে ভুল লিংক না আসে)
-            elif re.search(r'apply', parent_text, re.IGNORECASE) and len(parent_text) < 150:
-                media_data['application_link'] = link['href']
-                media_data['application_text'] = parent_text
-                print("        ℹ️ 'Apply' টেক্সটের পাশে লিংক খুঁজে পাওয়া গেছে।")
+
+def run_publish_pipeline(blog_services, new_target_details, target_blogs):
+    """
+    প্রতিটি সোর্স পোস্ট থ্রেড পুলে একবারই স্ক্র্যাপ ও রেন্ডার হয়, তারপর target_blogs ({url: [blog_id]})
+    অনুযায়ী প্রতিটি গন্তব্য ব্লগের নিজস্ব প্রকাশক থ্রেডে যায়। ব্লগগুলো নিজ নিজ রেট লিমিটার ও কোটা
+    মেনে একসাথে প্রকাশ করে। সব কিউ সীমিত, তাই সবচেয়ে ধীর ব্লগ পিছিয়ে পড়লে স্ক্র্যাপিংও অপেক্ষা করে।
+    {blog_id: (প্রকাশিত টাইটেল, সব পোস্ট সম্পূর্ণ হয়েছে কিনা)} ফেরত দেয়।
+    """
+    journal = load_journal()
+    results = {blog_id: {'published': [], 'complete': True} for blog_id in blog_services}
+    # পুরোনো পোস্ট আগে প্রকাশ হবে যাতে ব্লগে নতুনটি উপরে থাকে
+    work_items = []
+    for details in new_target_details[::-1]:
+        pending_blogs = []
+        for blog_id in target_blogs.get(details['url'], ()):
+            record = journal.get(_journal_key(blog_id, details['url']))
+            if record and record['state'] == 'published':
+                print(f"⏭️ জার্নাল অনুযায়ী আগেই প্রকাশিত ({blog_id}): **{details['title']}** (Post ID: {record.get('post_id')})")
+                continue
+            pending_blogs.append(blog_id)
+        if pending_blogs:
+            work_items.append((details, _cached_preparation(journal, details, pending_blogs), pending_blogs))
+
+    if not work_items:
+        return {blog_id: (result['published'], True) for blog_id, result in results.items()}
+
+    publish_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    blog_queues = {blog_id: queue.Queue(maxsize=PIPELINE_QUEUE_SIZE) for blog_id in blog_services}
+    stop_event = threading.Event()
+    quota_stopped = set()
+    results_lock = threading.Lock()
+    # একটি সোর্স পোস্ট সব গন্তব্যে প্রকাশ হলে শেয়ার্ড রেন্ডার রেকর্ড আর দরকার নেই
+    remaining_blogs = {details['url']: len(blog_ids) for details, _record, blog_ids in work_items}
+    workers = max(1, min(SCRAPE_WORKERS, len(work_items)))
+
+    def produce():
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for details, record, blog_ids in work_items:
+                    if stop_event.is_set():
+                        break
+                    future = executor.submit(prepare_post, details, record)
+                    # কিউ ভর্তি থাকলে এখানে অপেক্ষা করে (ব্যাকপ্রেশার)
+                    publish_queue.put((details, future, blog_ids))
+        finally:
+            publish_queue.put(None)
+
+    def mark_incomplete(blog_id):
+        with results_lock:
+            results[blog_id]['complete'] = False
+
+    def mark_published(blog_id, post):
+        with results_lock:
+            results[blog_id]['published'].append(post['title'])
+            remaining_blogs[post['source_url']] -= 1
+            fanned_out = remaining_blogs[post['source_url']] == 0
+        if fanned_out:
+            append_journal(None, post['source_url'], 'published')
+
+    def publish_for_blog(blog_id):
+        service = blog_services[blog_id]
+        batch_posts = []
+        while True:
+            post = blog_queues[blog_id].get()
+            if post is None:
                 break
+            if blog_id in quota_stopped:
+                # কোটা শেষ: এই ব্লগের বাকি কাজ শুধু কিউ খালি করা
+                mark_incomplete(blog_id)
+                continue
+            if PUBLISH_BATCH_SIZE > 1:
+                batch_posts.append(post)
+                continue
 
-    # C. ট্যাগ/লেবেল সংগ্রহ
-    labels_container = soup.find('span', class_='post-labels')
-    if not labels_container:
-        labels_container = soup.find('div', class_='post-footer') 
-    
-    if labels_container:
-        label_tags = labels_container.select('a[rel="tag"]')
-        if not label_tags:
-            label_tags = labels_container.find_all('a') 
-            
-        if label_tags:
-            media_data['labels'] = [tag.text.strip() for tag in label_tags if tag.text.strip()]
-        
-    # D. ফলব্যাক ট্যাগ
-    if not media_data['labels']:
-             media_data['labels'] = ['জব সার্কুলার']
-            
-    link_status = 'পাওয়া গেছে' if media_data['application_link'] else 'পাওয়া যায়নি'
-    print(f"        ✅ মিডিয়া ও লিংক ডেটা সংগ্রহ সম্পন্ন। মোট ইমেজ: {len(media_data['images'])}, আবেদনের লিংক: {link_status}")
-    return media_data
+            try:
+                inserted_post = publish_single_post(service, blog_id, post)
+            except QuotaExceededError:
+                with results_lock:
+                    quota_stopped.add(blog_id)
+                    results[blog_id]['complete'] = False
+                    if quota_stopped >= set(blog_services):
+                        stop_event.set()
+                continue
+            if not inserted_post:
+                mark_incomplete(blog_id)
+                continue
+            mark_published(blog_id, post)
+
+        if batch_posts:
+            # রানের ভেতরের ডুপ্লিকেট বাদ দেওয়া হয়েছে, তাই একটি ব্লগের ব্যাচে টাইটেল অনন্য
+            published_titles = set(publish_posts(service, blog_id, batch_posts))
+            for post in batch_posts:
+                if post['title'] in published_titles:
+                    mark_published(blog_id, post)
+                else:
+                    mark_incomplete(blog_id)
+        else:
+            if blog_id in _post_index_cache:
+                save_post_index(_post_index_cache[blog_id])
+            print_quota_summary(blog_id)
+
+    print(f"        ⚡ {len(work_items)} টি পোস্ট {workers} টি ওয়ার্কার দিয়ে স্ক্র্যাপ ও একই সাথে {len(blog_services)} টি ব্লগে প্রকাশ করা হচ্ছে...")
+    producer = threading.Thread(target=produce, name='scrape-producer', daemon=True)
+    producer.start()
+    publishers = [
+        threading.Thread(target=publish_for_blog, args=(blog_id,), name=f'publish-{blog_id}', daemon=True)
+        for blog_id in blog_services
+    ]
+    for publisher in publishers:
+        publisher.start()
+
+    while True:
+        item = publish_queue.get()
+        if item is None:
+            break
+        details, future, blog_ids = item
+        if stop_event.is_set():
+            # সব ব্লগের কোটা শেষ: বাকি কাজ শুধু কিউ খালি করা
+            for blog_id in blog_ids:
+                mark_incomplete(blog_id)
+            continue
+
+        try:
+            # প্রকাশকরা কতক্ষণ স্ক্র্যাপের জন্য বসে থাকে (বেশি হলে স্ক্র্যাপিং-ই বাধা)
+            with METRICS.stage('pipeline_wait'):
+                post = future.result()
+        except Exception as e:
+            print(f"        ❌ পোস্ট প্রস্তুত করার সময় ত্রুটি: {details['title']} ({e})")
+            for blog_id in blog_ids:
+                mark_incomplete(blog_id)
+            continue
+        if not post:
+            continue
+
+        for blog_id in blog_ids:
+            blog_queues[blog_id].put(post)
+
+    for blog_queue in blog_queues.values():
+        blog_queue.put(None)
+    for publisher in publishers:
+        publisher.join()
+    producer.join()
+
+    return {blog_id: (result['published'], result['complete']) for blog_id, result in results.items()}
 
 # =========================================================
-# ধাপ ৪: ডুপ্লিকেট চেক ও পোস্টিং
+# ধাপ ৪.২: ডুপ্লিকেট চেক ও পোস্টিং
 # =========================================================
 
-def scrape_filter_and_publish(listing_url, blogger_service, blog_id):
-    """সমস্ত প্রক্রিয়া সমন্বয় করে।"""
+def _commit_crawl_positions(sources):
+    for source in sources:
+        commit_crawl_position(source.url)
+
+
+def _is_update_candidate(index_post, today, check_cutoff):
+    """
+    এই স্ক্রিপ্টের প্রকাশ করা (হ্যাশ সহ), মেয়াদ না পেরোনো এবং check_cutoff (ISO সময়) এর পরে
+    যাচাই না হওয়া পোস্টই শুধু আপডেট হতে পারে।
+    """
+    if not index_post.get('content_hash'):
+        return False
+    checked_at = index_post.get('checked_at')
+    if checked_at and checked_at > check_cutoff:
+        return False
+    web_end_date = index_post.get('web_end_date')
+    return not web_end_date or web_end_date >= today.isoformat()
+
+
+@METRICS.stage('scrape_filter_and_publish')
+def scrape_filter_and_publish(sources, blog_services, parse_pool=None):
+    """
+    সমস্ত প্রক্রিয়া সমন্বয় করে: সব সোর্সের ফলাফল একবার স্ক্র্যাপ ও রেন্ডার হয়, তারপর প্রতিটি ব্লগের
+    ({blog_id: সার্ভিস}) নিজস্ব ইনডেক্স অনুযায়ী ডুপ্লিকেট চেক করে প্রকাশ হয়; সোর্সে বদলে যাওয়া আগের পোস্ট patch হয়।
+    parse_pool (প্রসেস পুল) দিলে ব্যাকফিল: তালিকা ও নতুন পোস্টের পেজ সেই পুলে পার্স হয়।
+    (সব ব্লগে প্রকাশিত ও আপডেট হওয়া পোস্টের মোট সংখ্যা, সব কাজ সম্পূর্ণ হয়েছে কিনা) ফেরত দেয়।
+    """
     print("\n--- স্ক্র্যাপিং প্রক্রিয়া শুরু ---")
     
-    # 1. আপনার ব্লগের সকল 'অন্যান্য' ট্যাগযুক্ত পোস্টের টাইটেল সংগ্রহ
-    existing_titles = get_existing_titles(blogger_service, blog_id) 
+    # 1. প্রতিটি ব্লগের সকল 'অন্যান্য' ট্যাগযুক্ত পোস্টের ইনডেক্স (টাইটেল ও সোর্স URL) সংগ্রহ
+    post_indexes = load_blog_indexes(blog_services)
     
-    # 2. টার্গেট সাইট থেকে পোস্টের তালিকা সংগ্রহ
-    all_target_details = get_all_post_links_and_details(listing_url) 
+    # 2. সব টার্গেট সোর্স থেকে একসাথে পোস্টের তালিকা সংগ্রহ
+    crawled = crawl_sources(
+        sources,
+        # ক্রল থামানোর জন্য শুধু নিশ্চিত মিল (URL/টাইটেল), প্রায়-মিল নয়; সব ব্লগে থাকলে তবেই থামে
+        known_post=lambda entry: all(
+            find_duplicate_post(post_index, entry['title'], entry['url'], near=False) is not None
+            for post_index in post_indexes.values()
+        ),
+        parse_pool=parse_pool,
+    )
+    all_target_details = [details for _source, source_details in crawled for details in source_details]
+    if len(sources) > 1:
+        counts = ', '.join(f"{source.tag or source.url}: {len(source_details)}" for source, source_details in crawled)
+        print(f"\n🌐 {len(sources)} টি সোর্স থেকে মোট {len(all_target_details)} টি ভ্যালিড পোস্ট ({counts})")
     
     if not all_target_details:
         print("পোস্টের কোনো লিংক পাওয়া যায়নি।")
-        return
+        _commit_crawl_positions(sources)
+        return 0, True
+
+    # 3. ডুপ্লিকেশন চেক এবং নতুন পোস্ট ফিল্টার করা (এই রানের তালিকার ভেতরের পুনরাবৃত্তিও)
+    new_target_details = []
+    target_blogs = {}
+    run_titles = NearDuplicateIndex()
+    run_keys = set()
+    # একই সোর্স URL থেকে আগে প্রকাশিত পোস্ট: {url: (details, {blog_id: post_id})}; শুধু এই রানের তালিকায়
+    # থাকা এবং POST_UPDATE_CHECK_INTERVAL_HOURS এর মধ্যে যাচাই না হওয়া পোস্ট
+    update_targets = {}
+    today = datetime.now().date()
+    check_cutoff = (datetime.now() - timedelta(hours=POST_UPDATE_CHECK_INTERVAL_HOURS)).isoformat(timespec='seconds')
 
-    # 3. ডুপ্লিকেশন চেক এবং নতুন পোস্ট ফিল্টার করা
-    new_posts_to_publish = []
-    
     for details in all_target_details:
         current_target_title = details['title']
 
-        if current_target_title in existing_titles:
-            print(f"⏭️ ধাপ ৪: স্কিপ করা হচ্ছে: **{current_target_title}** (ডুপ্লিকেট)")
+        blog_ids = []
+        for blog_id, post_index in post_indexes.items():
+            duplicate = find_duplicate_post(post_index, current_target_title, details['url'])
+            if duplicate:
+                post_id, reason = duplicate
+                print(f"⏭️ ধাপ ৪: স্কিপ করা হচ্ছে ({blog_id}): **{current_target_title}** (ডুপ্লিকেট: {reason}, '{post_index['posts'][post_id]['title']}')")
+                METRICS.inc('posts_total', outcome='duplicate')
+                if POST_UPDATES_ENABLED and reason == 'source_url' and _is_update_candidate(post_index['posts'][post_id], today, check_cutoff):
+                    update_targets.setdefault(details['url'], (details, {}))[1][blog_id] = post_id
+            else:
+                blog_ids.append(blog_id)
+        if not blog_ids:
             continue
-            
-        print(f"\n▶️ ধাপ ৪: নতুন পোস্ট পাওয়া গেছে ({details['type']}): {current_target_title}")
-        
-        media_data = scrape_single_post_media(details['url'])
-        
-        # 🌟 ইমেজ ফিল্টার
-        if not media_data['images']:
-            print(f"        ❌ IMAGE FILTER: {current_target_title} এ কোনো ইমেজ নেই, পোস্টটি বাদ দেওয়া হলো।")
-            continue 
 
-        # 🎯 ডিলিট ডেট গণনার লজিক
-        delete_datetime = None
-        
-        if details['type'] == 'deadline' and details.get('parsed_date'):
-            delete_datetime = details['parsed_date'] + timedelta(days=1)
-            print(f"        ✅ ডেডলাইন পোস্টের ডিলিট ডেট গণনা করা হলো (পরের দিন): {delete_datetime.strftime('%Y-%m-%d')}")
-        
-        if delete_datetime is None:
-            delete_datetime = datetime.now() + timedelta(days=7)
-            print(f"        ⚠️ ফলব্যাক ডিলিট ডেট গণনা করা হলো (৭ দিন পর): {delete_datetime.strftime('%Y-%m-%d')}")
+        run_key = canonical_source_url(details['url'])
+        normalized = normalize_title(current_target_title)
+        if run_key in run_keys or normalized in run_keys or run_titles.find(current_target_title):
+            print(f"⏭️ ধাপ ৪: স্কিপ করা হচ্ছে: **{current_target_title}** (তালিকায় একই পোস্ট দুবার)")
+            METRICS.inc('posts_total', outcome='duplicate')
+            continue
+        run_keys.update((run_key, normalized))
+        run_titles.add(run_key, current_target_title)
             
-        web_end_date_tag = f"{WEB_END_DATE_TAG_PREFIX}{delete_datetime.strftime('%d-%m-%Y')}"
-        print(f"        🏷️ WebEndDate ট্যাগ তৈরি: {web_end_date_tag}")
+        print(f"\n▶️ ধাপ ৪: নতুন পোস্ট পাওয়া গেছে ({details['type']}, {len(blog_ids)} টি ব্লগের জন্য): {current_target_title}")
+        new_target_details.append(details)
+        target_blogs[details['url']] = blog_ids
 
-        # পোস্ট কন্টেন্ট তৈরি
-        post_content = f"" 
-        post_content += f"<p>ডেডলাইন/ফলাফল তথ্য: {details['deadline_text']}</p>" 
-        
-        # 🎯 আবেদনের লিংক যুক্ত করা (যদি থাকে)
-        if media_data['application_link']:
-            # টেক্সট ক্লিন করা
-            app_text = media_data['application_text'] if media_data['application_text'] else "অনলাইনে আবেদন করুন"
-            # 'আবেদনের লিংকঃ' শব্দটি থাকলে বাদ দেওয়া, না থাকলে যা আছে তাই রাখা
-            app_text = app_text.replace('আবেদনের লিংকঃ', '').strip()
-            
-            application_link = media_data['application_link']
-            
-            post_content += f'''
-            <div style="border: 2px solid #4CAF50; padding: 15px; margin: 20px 0; border-radius: 8px; background-color: #f9fff9;">
-                <p style="font-weight: bold; color: #333;">আবেদনের তথ্য:</p>
-                <p style="margin-top: 5px;">{app_text}</p>
-                <a href="{application_link}" target="_blank" 
-                   style="display: inline-block; padding: 10px 20px; text-decoration: none; 
-                          background-color: #f44336; color: white; border-radius: 5px; 
-                          font-weight: bold; margin-top: 10px;">
-                    ➡️ অনলাইনে আবেদন করুন
-                </a>
-            </div>
-            '''
-        else:
-             print("        ⚠️ আবেদনের লিংক খুঁজে পাওয়া যায়নি।")
-        
-        # ইমেজ এবং ডাউনলোড লিঙ্ক যোগ
-        post_content += "<h3>সংযুক্ত ছবি:</h3>"
-        post_content += '<div style="text-align: center;">' 
-        for i, img_src in enumerate(media_data['images']):
-            img_src_s1000 = img_src.replace('/s16000/', '/s1000/')
-            post_content += f'<img src="{img_src_s1000}" style="max-width:100%; height:auto; margin: 10px 0;" />'
-            full_res_url = img_src.replace('/s1000/', '/s16000/') 
-            button_text = f"Download (Image-{i+1})"
-            post_content += f'''
-            <a href="{full_res_url}" download="image_{i+1}" target="_blank" 
-                style="display: block; margin: 10px auto; padding: 10px 20px; text-decoration: none; 
-                        background-color: #4CAF50; color: white; border-radius: 5px; width: fit-content; font-weight: bold;">
-                        {button_text}
-            </a>
-            '''
-        post_content += '</div>'
-        post_content += "<p>--- তথ্যসূত্র: সরকারি চাকরি প্রস্তুতি অ্যাপ ---</p>"
-        
-        final_labels = media_data.get('labels', [])
-        if SCRAPED_POST_TAG not in final_labels:
-            final_labels.append(SCRAPED_POST_TAG)
-            
-        final_labels.append(web_end_date_tag)
+    # 4. স্ক্র্যাপিং, রেন্ডারিং ও পোস্টিং একই সাথে (স্ট্রিমিং); ব্যাকফিলে পেজগুলো আগেই প্রসেস পুলে পার্স হয়
+    if parse_pool and new_target_details:
+        new_target_details = backfill_post_media(parse_pool, new_target_details)
+    print(f"\n➡️ ধাপ ৪: মোট **{len(new_target_details)}** টি নতুন পোস্ট প্রক্রিয়াকরণ ও প্রকাশের জন্য প্রস্তুত।")
 
-        new_posts_to_publish.append({
-            'title': current_target_title,
-            'content': post_content,
-            'labels': final_labels
-        })
+    results = {}
+    if new_target_details:
+        print("    🚀 ধাপ ৫: ব্লগারে পোস্ট করা শুরু হচ্ছে...")
+        results = run_publish_pipeline(blog_services, new_target_details, target_blogs)
 
-    # 4. পোস্টিং
-    posts_to_publish_in_order = new_posts_to_publish[::-1]
-    print(f"\n➡️ ধাপ ৪: মোট **{len(posts_to_publish_in_order)}** টি নতুন পোস্ট প্রকাশের জন্য প্রস্তুত।")
+    # 5. আগে প্রকাশিত পোস্টের সোর্স বদলালে ইন-প্লেস আপডেট (নতুন পোস্ট প্রকাশের পরে, যাতে কোটা আগে সেখানে যায়)
+    updated_count = 0
+    if update_targets:
+        updated_count = update_changed_posts(blog_services, post_indexes, list(update_targets.values()))
 
-    if posts_to_publish_in_order:
-        published_titles = publish_posts(blogger_service, blog_id, posts_to_publish_in_order)
-        
-        if published_titles:
-            print(f"\n🎉 প্রক্রিয়া সম্পন্ন! {len(published_titles)} টি নতুন পোস্ট সফলভাবে প্রক্রিয়াকরণ ও প্রকাশিত হয়েছে।")
-    else:
-        print("পোস্ট করার জন্য কোনো নতুন ডেটা পাওয়া যায়নি।")
+    if new_target_details:
+        published_count = sum(len(published_titles) for published_titles, _complete in results.values()) + updated_count
+        complete = all(complete for _published_titles, complete in results.values())
+
+        for blog_id, (published_titles, blog_complete) in results.items():
+            if published_titles:
+                suffix = f" (ব্লগ {blog_id})" if len(results) > 1 else ''
+                print(f"\n🎉 প্রক্রিয়া সম্পন্ন! {len(published_titles)} টি নতুন পোস্ট সফলভাবে প্রক্রিয়াকরণ ও প্রকাশিত হয়েছে{suffix}।")
+
+        # সব ব্লগে সব পোস্ট প্রকাশ হলে তবেই ক্রল অবস্থান এগোবে, নইলে পরের রান আবার এগুলো দেখবে
+        if complete:
+            _commit_crawl_positions(sources)
+        return published_count, complete
+
+    print("পোস্ট করার জন্য কোনো নতুন ডেটা পাওয়া যায়নি।")
+    _commit_crawl_positions(sources)
+    return updated_count, True
 
 
 # =========================================================
 # ধাপ ৫: publish_posts (পাবলিক পোস্টিং)
 # =========================================================
 
+def _build_post_body(post):
+    return {
+        'kind': 'blogger#post',
+        'title': post['title'],
+        'content': post['content'],
+        'labels': post['labels'], 
+        'isDraft': False 
+    }
+
+
+@METRICS.stage('publish')
+def publish_single_post(service, blog_id, post):
+    """
+    একটি পোস্ট প্রকাশ করে জার্নাল ও ইনডেক্সে লিখে রাখে। ব্যর্থ হলে None ফেরত দেয়;
+    কোটা শেষ হলে QuotaExceededError তোলে।
+    """
+    try:
+        inserted_post = execute_api_request(
+            service.posts().insert(blogId=blog_id, body=_build_post_body(post)), blog_id, 'insert'
+        )
+    except QuotaExceededError as e:
+        print(f"      ❌ API ERROR: পোস্ট করার সময় ব্যর্থ হয়েছে: {post['title']}")
+        print(f"      ❌ API ERROR বিবরণ: {e}")
+        print("FATAL ERROR: API Quota Limit এ পৌঁছে গেছেন। 24 ঘন্টা পরে আবার চেষ্টা করুন।")
+        raise
+    except Exception as e:
+        print(f"      ❌ API ERROR: পোস্ট করার সময় ব্যর্থ হয়েছে: {post['title']}")
+        print(f"      ❌ API ERROR বিবরণ: {e}")
+        METRICS.inc('posts_total', outcome='failed')
+        return None
+
+    print(f"      ✅ পোস্ট সফলভাবে প্রকাশিত হয়েছে: {inserted_post['title']}") 
+    _record_published(blog_id, post, inserted_post)
+    return inserted_post
+
+
+def _record_published(blog_id, post, inserted_post):
+    METRICS.inc('posts_total', outcome='published')
+    if post.get('source_url'):
+        append_journal(blog_id, post['source_url'], 'published', post_id=inserted_post['id'], title=post['title'])
+    # পুরোনো জার্নালের রেন্ডার রেকর্ডে হ্যাশ না থাকতে পারে
+    content_hash = post.get('content_hash') or post_content_hash(post)
+    record_published_post(blog_id, inserted_post, post.get('source_url'), content_hash, post.get('source_hash'))
+
+
+def print_quota_summary(blog_id):
+    limiter = get_rate_limiter(blog_id)
+    print(f"    📊 আনুমানিক API কোটা খরচ: {limiter.quota_units} ইউনিট, বর্তমান পোস্টিং হার: {limiter.rate_per_minute:.1f}/মিনিট।")
+
+
+@METRICS.stage('publish_batch')
 def publish_posts(service, blog_id, posts_data):
     """সংগ্রহ করা পোস্ট ডেটা আপনার ব্লগে প্রকাশ করে।"""
-    print("    🚀 ধাপ ৫: ব্লগারে পোস্ট করা শুরু হচ্ছে...")
     if not blog_id:
         print("ERROR: BLOG_ID পূরণ করা হয়নি।")
         return False
         
     posts_published = []
-    
-    for post in posts_data:
-        post_body = {
-            'kind': 'blogger#post',
-            'title': post['title'],
-            'content': post['content'],
-            'labels': post['labels'], 
-            'isDraft': False 
+
+    if PUBLISH_BATCH_SIZE > 1:
+        # 🧺 ব্যাচ মোড: request_id হিসেবে তালিকার ইনডেক্স ব্যবহার করা
+        request_factories = {
+            str(i): (lambda post=post: service.posts().insert(blogId=blog_id, body=_build_post_body(post)))
+            for i, post in enumerate(posts_data)
         }
-        
-        try:
-            inserted_post = service.posts().insert(blogId=blog_id, body=post_body).execute()
-            print(f"      ✅ পোস্ট সফলভাবে প্রকাশিত হয়েছে: {inserted_post['title']}") 
-            posts_published.append(post['title'])
-            
-            time.sleep(POST_DELAY_SECONDS) 
-            
-        except Exception as e:
-            print(f"      ❌ API ERROR: পোস্ট করার সময় ব্যর্থ হয়েছে: {post['title']}")
-            print(f"      ❌ API ERROR বিবরণ: {e}")
-            
-            if 'quotaExceeded' in str(e):
-                print("FATAL ERROR: API Quota Limit এ পৌঁছে গেছেন। 24 ঘন্টা পরে আবার চেষ্টা করুন।")
+        inserted, failed = execute_batch_with_retry(
+            service, request_factories, blog_id, 'insert', batch_size=PUBLISH_BATCH_SIZE
+        )
+        for i, post in enumerate(posts_data):
+            inserted_post = inserted.get(str(i))
+            if inserted_post:
+                print(f"      ✅ পোস্ট সফলভাবে প্রকাশিত হয়েছে: {inserted_post['title']}") 
+                posts_published.append(post['title'])
+                _record_published(blog_id, post, inserted_post)
+            elif str(i) in failed:
+                print(f"      ❌ API ERROR: পোস্ট করার সময় ব্যর্থ হয়েছে: {post['title']}")
+                print(f"      ❌ API ERROR বিবরণ: {failed[str(i)]}")
+        if any(isinstance(e, QuotaExceededError) for e in failed.values()):
+            print("FATAL ERROR: API Quota Limit এ পৌঁছে গেছেন। 24 ঘন্টা পরে আবার চেষ্টা করুন।")
+    else:
+        for post in posts_data:
+            try:
+                if publish_single_post(service, blog_id, post):
+                    posts_published.append(post['title'])
+            except QuotaExceededError:
                 break 
 
+    if blog_id in _post_index_cache:
+        save_post_index(_post_index_cache[blog_id])
+
+    print_quota_summary(blog_id)
     return posts_published
 
 
+# =========================================================
+# ধাপ ৫.১: সোর্সে বদলে যাওয়া পোস্টের ইন-প্লেস আপডেট (patch)
+# =========================================================
+
+def prepare_post_update(details, known_source_hashes):
+    """
+    সোর্স পেজ (HTTP ক্যাশ থাকলে কন্ডিশনাল GET) এনে সোর্স হ্যাশ মেলায়; সব ব্লগে হ্যাশ একই হলে
+    পার্স বা রেন্ডার না করেই None দেয়। নইলে নতুন করে রেন্ডার করা পোস্ট ফেরত দেয়।
+    পেজ আনা না গেলে RequestException তোলে, যাতে পোস্টটি যাচাই হয়েছে বলে ধরা না হয়।
+    """
+    page = fetch_page(details['url'], timeout=15)
+    page_hash = text_hash(page.text)
+    if all(known == source_fingerprint(details, page_hash) for known in known_source_hashes):
+        return None
+
+    media_data = extract_post_media(page.text)
+    media_data['page_hash'] = page_hash
+    if media_data['images']:
+        media_data['image_links'] = prepare_post_images(media_data['images'])
+    return render_post(details, media_data)
+
+
+def _keep_web_end_date(labels, previous_labels):
+    """ডেডলাইন না থাকা পোস্টে নতুন ফলব্যাক তারিখ নয়, আগের WebEndDate লেবেলই থাকবে।"""
+    previous = [label for label in previous_labels if label.startswith(WEB_END_DATE_TAG_PREFIX)]
+    if not previous:
+        return labels
+    return [label for label in labels if not label.startswith(WEB_END_DATE_TAG_PREFIX)] + previous
+
+
+@METRICS.stage('update')
+def update_single_post(service, blog_id, post_id, post):
+    """
+    শুধু title/content/labels patch করে ইনডেক্সের হ্যাশ হালনাগাদ করে। ব্যর্থ হলে None;
+    কোটা শেষ হলে QuotaExceededError তোলে।
+    """
+    body = {'title': post['title'], 'content': post['content'], 'labels': post['labels']}
+    try:
+        patched_post = execute_api_request(
+            service.posts().patch(blogId=blog_id, postId=post_id, body=body), blog_id, 'patch'
+        )
+    except QuotaExceededError as e:
+        print(f"      ❌ API ERROR: পোস্ট আপডেট করার সময় ব্যর্থ হয়েছে: {post['title']} ({e})")
+        raise
+    except Exception as e:
+        print(f"      ❌ API ERROR: পোস্ট আপডেট করার সময় ব্যর্থ হয়েছে: {post['title']} ({e})")
+        METRICS.inc('posts_total', outcome='failed')
+        return None
+
+    print(f"      ✏️ পোস্ট আপডেট হয়েছে ({blog_id}): {patched_post['title']}")
+    METRICS.inc('posts_total', outcome='updated')
+    record_published_post(blog_id, patched_post, post['source_url'], post['content_hash'], post['source_hash'])
+    return patched_post
+
+
+def update_changed_posts(blog_services, post_indexes, update_targets):
+    """
+    update_targets: [(details, {blog_id: post_id})]। সোর্স হ্যাশ না বদলালে কিছুই হয় না, রেন্ডার করা
+    কন্টেন্টের হ্যাশ না বদলালে শুধু ইনডেক্স হালনাগাদ হয়, আর বদলালে প্রতিটি ব্লগে একটি patch।
+    সফলভাবে যাচাই শেষ হওয়া পোস্টের ইনডেক্সে checked_at লেখা হয়। আপডেট হওয়া পোস্টের সংখ্যা ফেরত দেয়।
+    """
+    print(f"\n🔁 ধাপ ৫.১: আগে প্রকাশিত {len(update_targets)} টি পোস্টের সোর্সে পরিবর্তন আছে কিনা দেখা হচ্ছে...")
+    workers = max(1, min(SCRAPE_WORKERS, len(update_targets)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='update-check') as executor:
+        futures = [
+            (details, targets, executor.submit(
+                prepare_post_update, details,
+                [post_indexes[blog_id]['posts'][post_id].get('source_hash') for blog_id, post_id in targets.items()]
+            ))
+            for details, targets in update_targets
+        ]
+
+    updated_count = 0
+    quota_stopped = set()
+    touched_blogs = set()
+    for details, targets, future in futures:
+        try:
+            post = future.result()
+        except requests.exceptions.RequestException as e:
+            print(f"        ⚠️ আপডেট যাচাইয়ের জন্য সোর্স পেজ আনা যায়নি: {details['title']} ({e})")
+            continue
+        except Exception as e:
+            print(f"        ❌ আপডেট প্রস্তুত করার সময় ত্রুটি: {details['title']} ({e})")
+            continue
+        checked_at = datetime.now().isoformat(timespec='seconds')
+
+        for blog_id, post_id in targets.items():
+            index_post = post_indexes[blog_id]['posts'].get(post_id)
+            if blog_id in quota_stopped or index_post is None:
+                continue
+            touched_blogs.add(blog_id)
+            if not post:
+                index_post['checked_at'] = checked_at
+                continue
+            if index_post.get('content_hash') == post['content_hash']:
+                # পেজ বদলেছে কিন্তু প্রকাশযোগ্য কন্টেন্ট একই: API কল ছাড়া শুধু সোর্স হ্যাশ হালনাগাদ
+                index_post['source_hash'] = post['source_hash']
+                index_post['checked_at'] = checked_at
+                continue
+            if not details.get('parsed_date'):
+                post = dict(post, labels=_keep_web_end_date(post['labels'], index_post['labels']))
+            try:
+                if update_single_post(blog_services[blog_id], blog_id, post_id, post):
+                    # patch এর পরে ইনডেক্সে নতুন এন্ট্রি তৈরি হয়, তাই সেখানেই লেখা
+                    post_indexes[blog_id]['posts'][post_id]['checked_at'] = checked_at
+                    updated_count += 1
+            except QuotaExceededError:
+                print(f"FATAL ERROR ({blog_id}): API Quota Limit এ পৌঁছে গেছেন, বাকি আপডেট পরের রানে হবে।")
+                quota_stopped.add(blog_id)
+
+    for blog_id in touched_blogs:
+        save_post_index(post_indexes[blog_id])
+    print(f"        ✅ {updated_count} টি পোস্ট আপডেট হয়েছে, বাকিগুলো অপরিবর্তিত।")
+    return updated_count
+
+
 # =========================================================
 # ধাপ ৬: মেয়াদোত্তীর্ণ পোস্ট ডিলিট (ট্যাগ-ভিত্তিক ডিলিট)
 # =========================================================
 
+def build_expiry_schedule(index):
+    """ইনডেক্সের WebEndDate দিয়ে (তারিখ, post_id) এর min-heap তৈরি করে।"""
+    schedule = [
+        (post['web_end_date'], post_id)
+        for post_id, post in index['posts'].items()
+        if post.get('web_end_date')
+    ]
+    heapq.heapify(schedule)
+    return schedule
+
+
+def pop_due_posts(schedule, today):
+    """heap থেকে শুধুমাত্র আজ বা তার আগে মেয়াদোত্তীর্ণ পোস্টগুলো বের করে।"""
+    today_str = today.isoformat()
+    due = []
+    while schedule and schedule[0][0] <= today_str:
+        due.append(heapq.heappop(schedule))
+    return due
+
+
+@METRICS.stage('delete_expired')
 def delete_expired_posts(service, blog_id):
     """ব্লগের ট্যাগযুক্ত পোস্টগুলি চেক করে এবং মেয়াদোত্তীর্ণ হলে ডিলিট করে।"""
     print("\n--- ধাপ ৬: মেয়াদোত্তীর্ণ পোস্ট ডিলিট প্রক্রিয়া শুরু হচ্ছে (ট্যাগ-ভিত্তিক) ---")
@@ -454,45 +3239,38 @@ def delete_expired_posts(service, blog_id):
     posts_deleted = 0
     
     try:
-        response = service.posts().list(
-            blogId=blog_id, 
-            labels=SCRAPED_POST_TAG, 
-            fetchBodies=False, 
-            maxResults=500
-        ).execute()
-        
-        posts = response.get('items', [])
-        print(f"ℹ️ '{SCRAPED_POST_TAG}' ট্যাগযুক্ত মোট {len(posts)} টি পোস্ট ডিলিটের জন্য চেক করা হচ্ছে।")
-        
-        for post in posts:
-            post_id = post['id']
-            title = post['title']
-            labels = post.get('labels', [])
-            
-            delete_date_str = None
-            
-            # 🎯 WebEndDate ট্যাগ খোঁজা
-            for label in labels:
-                if label.startswith(WEB_END_DATE_TAG_PREFIX):
-                    date_part = label[len(WEB_END_DATE_TAG_PREFIX):]
-                    try:
-                        delete_date = datetime.strptime(date_part, '%d-%m-%Y').date()
-                        delete_date_str = delete_date.strftime('%Y-%m-%d') 
-                        break
-                    except ValueError:
-                        print(f"      ⚠️ ট্যাগ ডেট পার্সিং ব্যর্থ: '{label}'")
-                        pass
-
-            if delete_date_str:
-                if delete_date <= today:
-                    print(f"      🗑️ ডিলিট করা হচ্ছে: '{title}' (ডিলিট ডেট: {delete_date_str})")
-                    service.posts().delete(blogId=blog_id, postId=post_id).execute()
-                    posts_deleted += 1
-                    time.sleep(DELETE_DELAY_SECONDS) 
-                else:
-                    print(f"      ℹ️ স্কিপ করা হচ্ছে: '{title}' (ডিলিট ডেট: {delete_date_str} > আজকের তারিখ: {today})")
-            else:
-                print(f"      ❌ WebEndDate ট্যাগ খুঁজে পাওয়া যায়নি, স্কিপ করা হলো: '{title}'")
+        index = get_post_index(service, blog_id)
+        schedule = build_expiry_schedule(index)
+        without_tag = len(index['posts']) - len(schedule)
+        due_posts = pop_due_posts(schedule, today)
+
+        print(f"ℹ️ '{SCRAPED_POST_TAG}' ট্যাগযুক্ত মোট {len(index['posts'])} টি পোস্টের মধ্যে {len(due_posts)} টি ডিলিটের জন্য নির্ধারিত।")
+        if without_tag:
+            print(f"      ❌ {without_tag} টি পোস্টে WebEndDate ট্যাগ খুঁজে পাওয়া যায়নি, স্কিপ করা হলো।")
+        if schedule:
+            print(f"      ℹ️ পরবর্তী ডিলিট ডেট: {schedule[0][0]} (আজকের তারিখ: {today})")
+
+        request_factories = {}
+        for delete_date_str, post_id in due_posts:
+            print(f"      🗑️ ডিলিট করা হচ্ছে: '{index['posts'][post_id]['title']}' (ডিলিট ডেট: {delete_date_str})")
+            request_factories[post_id] = (
+                lambda post_id=post_id: service.posts().delete(blogId=blog_id, postId=post_id)
+            )
+
+        if request_factories:
+            # 404 মানে পোস্টটি আগেই মুছে ফেলা হয়েছে
+            deleted, failed = execute_batch_with_retry(
+                service, request_factories, blog_id, 'delete',
+                ignore_statuses=(404,), pause_seconds=DELETE_DELAY_SECONDS
+            )
+
+            for post_id, exception in failed.items():
+                print(f"      ❌ ডিলিট ব্যর্থ: '{index['posts'][post_id]['title']}' ({exception})")
+
+            remove_index_posts(index, deleted)
+            save_post_index(index)
+            posts_deleted = len(deleted)
+            METRICS.inc('posts_total', posts_deleted, outcome='deleted')
             
     except Exception as e:
         print(f"❌ পোস্ট ডিলিট করার সময় ত্রুটি: {e}")
@@ -500,21 +3278,177 @@ def delete_expired_posts(service, blog_id):
     print(f"✅ ডিলিট প্রক্রিয়া সম্পন্ন। মোট ডিলিট হয়েছে: {posts_deleted} টি পোস্ট।")
 
 
+def delete_expired_posts_for_blogs(blog_services):
+    """প্রতিটি ব্লগের ডিলিট একসাথে, নিজ নিজ সার্ভিস, রেট লিমিটার ও কোটা হিসাবে চালায়।"""
+    if len(blog_services) == 1:
+        (blog_id, service), = blog_services.items()
+        delete_expired_posts(service, blog_id)
+        return
+    with ThreadPoolExecutor(max_workers=len(blog_services), thread_name_prefix='blog-delete') as executor:
+        for blog_id, service in blog_services.items():
+            executor.submit(delete_expired_posts, service, blog_id)
+
+
+# =========================================================
+# ধাপ ৭: ডেমন মোড (অ্যাডাপটিভ পোলিং, আলাদা ডিলিট সূচি)
+# =========================================================
+
+_shutdown_event = threading.Event()
+
+
+def _request_shutdown(signum, _frame):
+    if _shutdown_event.is_set():
+        # দ্বিতীয়বার সিগন্যাল: চলমান কাজ শেষ হওয়ার অপেক্ষা না করে বের হওয়া
+        raise KeyboardInterrupt
+    print(f"\n🛑 সিগন্যাল {signal.Signals(signum).name} পাওয়া গেছে: চলমান চক্র শেষ করে বন্ধ হচ্ছে...")
+    _shutdown_event.set()
+
+
+def install_shutdown_handlers():
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, _request_shutdown)
+
+
+def listing_fingerprint(listing_url):
+    """
+    প্রথম লিস্টিং পেজের এন্ট্রিগুলোর (URL, টাইটেল, ডেডলাইন) হ্যাশ। পেজের অন্য অংশ (উইজেট,
+    টাইমস্ট্যাম্প) বদলালেও হ্যাশ একই থাকে। পেজটি HTTP ক্যাশে থাকায় পরের ফেচ শুধু 304 হয়।
+    """
+    page = fetch_page(listing_url, headers=LISTING_REQUEST_HEADERS, timeout=15)
+    entries = [(entry['url'], entry['title'], entry['deadline_text']) for entry in extract_listing_entries(page.text)]
+    return hashlib.sha256(json.dumps(entries, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def sources_fingerprint(sources):
+    """সব সোর্সের লিস্টিং হ্যাশ একসাথে; কোনো সোর্স সাময়িক বন্ধ থাকলে সেটির জায়গায় 'unavailable'।"""
+    fingerprints = []
+    for source in sources:
+        try:
+            fingerprints.append(listing_fingerprint(source.url))
+        except requests.exceptions.RequestException as e:
+            print(f"        ⚠️ সোর্স লিস্টিং পাওয়া যায়নি: {source.url} ({e})")
+            fingerprints.append('unavailable')
+    return '|'.join(fingerprints)
+
+
+def next_poll_interval(current, published_count, complete):
+    """নতুন পোস্ট পেলে বিরতি সর্বনিম্নে নামে; কিছু না পেলে বা কাজ আটকে গেলে (যেমন কোটা) বাড়ে।"""
+    if published_count and complete:
+        return POLL_MIN_SECONDS
+    if not complete:
+        return POLL_MAX_SECONDS
+    return min(POLL_MAX_SECONDS, max(POLL_MIN_SECONDS, current * POLL_BACKOFF_FACTOR))
+
+
+def run_daemon(blog_services, sources):
+    """
+    Blogger সার্ভিস, HTTP সেশন ও পোস্ট ইনডেক্স মেমোরিতে রেখে সোর্সগুলো অবিরাম পর্যবেক্ষণ করে।
+    কোনো লিস্টিং না বদলালে (এবং আগের চক্র সম্পূর্ণ হলে) স্ক্র্যাপিং বাদ যায়। SIGTERM/SIGINT এ
+    চলমান চক্র শেষ করে বের হয়।
+    """
+    install_shutdown_handlers()
+    interval = POLL_MIN_SECONDS
+    last_fingerprint = None
+    retry_pending = False
+    next_delete_at = 0.0
+    next_prune_at = time.time() + HTTP_CACHE_PRUNE_INTERVAL_SECONDS
+    print(f"👀 ডেমন মোড চালু: পোলিং {POLL_MIN_SECONDS}-{POLL_MAX_SECONDS} সেকেন্ড, ডিলিট প্রতি {DELETE_SWEEP_INTERVAL_SECONDS} সেকেন্ডে।")
+
+    while not _shutdown_event.is_set():
+        cycle_started = time.time()
+
+        if cycle_started >= next_delete_at:
+            print("\n=== 🔄 নির্ধারিত ডিলিট চক্র ===")
+            delete_expired_posts_for_blogs(blog_services)
+            next_delete_at = cycle_started + DELETE_SWEEP_INTERVAL_SECONDS
+
+        try:
+            fingerprint = sources_fingerprint(sources)
+            if fingerprint == last_fingerprint and not retry_pending:
+                interval = next_poll_interval(interval, 0, True)
+                METRICS.inc('daemon_cycles_total', result='unchanged')
+                print("💤 লিস্টিং অপরিবর্তিত, স্ক্র্যাপিং বাদ।")
+            else:
+                load_blog_indexes(blog_services, refresh=True)
+                published_count, complete = scrape_filter_and_publish(sources, blog_services)
+                last_fingerprint = fingerprint
+                retry_pending = not complete
+                interval = next_poll_interval(interval, published_count, complete)
+                METRICS.inc('daemon_cycles_total', result='published' if published_count else 'no_new_posts')
+        except Exception as e:
+            # কোটা শেষ বা নেটওয়ার্ক ত্রুটি: ডেমন চলতে থাকে, শুধু পরের চেষ্টা পিছিয়ে যায়
+            print(f"❌ ডেমন চক্রে ত্রুটি: {e}")
+            METRICS.inc('daemon_cycles_total', result='error')
+            retry_pending = True
+            interval = POLL_MAX_SECONDS if isinstance(e, QuotaExceededError) else next_poll_interval(interval, 0, True)
+
+        if time.time() >= next_prune_at:
+            prune_http_cache()
+            next_prune_at = time.time() + HTTP_CACHE_PRUNE_INTERVAL_SECONDS
+
+        write_run_report()
+        print(f"⏳ পরের পোল {interval:.0f} সেকেন্ড পরে।")
+        _shutdown_event.wait(interval)
+
+    print("👋 ডেমন বন্ধ হলো।")
+
+
+def run_backfill(blog_services, sources, parse_pool):
+    """
+    ব্যাকফিল মোড: হাজারো পোস্টের গভীর আর্কাইভে BeautifulSoup পার্সিং CPU-বাউন্ড, আর GIL এর কারণে
+    থ্রেডে তা এক কোরেই আটকে থাকে। তাই কাঁচা পেজ PARSE_WORKERS টি প্রসেসে (start_parse_pool) পাঠানো হয়
+    এবং ফেরত আসে শুধু ছোট, picklable রেকর্ড (details ও media dict); ডুপ্লিকেট চেক, রেন্ডার ও প্রকাশ স্বাভাবিক পাইপলাইনেই।
+    """
+    print(f"\n=== 📚 ব্যাকফিল মোড: {PARSE_WORKERS} টি পার্সার প্রসেস, প্রতি চাংকে {PARSE_CHUNK_SIZE} টি পেজ ===")
+    return scrape_filter_and_publish(sources, blog_services, parse_pool=parse_pool)
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='সরকারি চাকরির বিজ্ঞপ্তি স্ক্র্যাপ করে Blogger এ প্রকাশ করে।')
+    parser.add_argument('--mode', choices=('once', 'daemon', 'backfill'), default=RUN_MODE,
+                        help="once: একবার চালিয়ে বের হয় (CI); daemon: অবিরাম চলে; "
+                             "backfill: পুরো আর্কাইভ প্রসেস পুলে পার্স করে (ডিফল্ট RUN_MODE env)")
+    return parser.parse_args()
+
+
 # =========================================================
 # প্রধান ফাংশন (Main Function)
 # =========================================================
 
 if __name__ == '__main__':
+    STARTUP_TIMINGS['imports'] = time.perf_counter() - _PROCESS_STARTED
+    args = parse_args()
+    # পার্সার প্রসেসগুলো fork হয় কোনো HTTP সেশন, API ক্লায়েন্ট বা থ্রেড চালুর আগেই
+    parse_pool = start_parse_pool() if args.mode == 'backfill' else None
+    sources = load_sources()
+    atexit.register(write_run_report, start_profiler())
     print("--- ধাপ ১: Blogger API সার্ভিস সেটআপ শুরু হচ্ছে ---")
     blogger_service = get_blogger_service()
 
     if blogger_service:
         print("✅ Blogger API সার্ভিস সেটআপ সম্পন্ন।")
-        
-        # 1. প্রথমে মেয়াদোত্তীর্ণ ট্যাগযুক্ত পোস্টগুলি ডিলিট করা হবে
-        print("\n=== 🔄 প্রক্রিয়া শুরু: প্রথমে ডিলিট করা হচ্ছে... ===")
-        delete_expired_posts(blogger_service, BLOG_ID)
-        
-        # 2. তারপর নতুন পোস্ট স্ক্র্যাপ, ফিল্টার এবং প্রকাশ করা হবে
-        print("\n=== 🚀 প্রক্রিয়া চলমান: নতুন ডেটা সংগ্রহ ও প্রকাশ... ===")
-        scrape_filter_and_publish(TARGET_LISTING_URL, blogger_service, BLOG_ID)
\ No newline at end of file
+        print_startup_report()
+        blog_services = get_blog_services(blogger_service, BLOG_IDS)
+        if not blog_services:
+            # কোনো ব্লগ ছাড়া ডিলিট/প্রকাশের ধাপগুলো চালানোর মানে নেই
+            print("ERROR: BLOG_ID বা BLOG_IDS পূরণ করা হয়নি।")
+        elif args.mode == 'daemon':
+            run_daemon(blog_services, sources)
+        else:
+            # 1. প্রথমে মেয়াদোত্তীর্ণ ট্যাগযুক্ত পোস্টগুলি ডিলিট করা হবে (প্রতিটি ব্লগে একসাথে)
+            print("\n=== 🔄 প্রক্রিয়া শুরু: প্রথমে ডিলিট করা হচ্ছে... ===")
+            delete_expired_posts_for_blogs(blog_services)
+
+            # 2. তারপর নতুন পোস্ট একবার স্ক্র্যাপ করে সব ব্লগে প্রকাশ করা হবে
+            print("\n=== 🚀 প্রক্রিয়া চলমান: নতুন ডেটা সংগ্রহ ও প্রকাশ... ===")
+            if args.mode == 'backfill':
+                run_backfill(blog_services, sources, parse_pool)
+            else:
+                scrape_filter_and_publish(sources, blog_services)
+
+    if parse_pool:
+        parse_pool.shutdown()
+    prune_http_cache()
+    METRICS.finished = True
\ No newline at end of file